@@ -0,0 +1,45 @@
+"""Add semantic answer cache table
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+from alembic import op
+from app.core.config import get_settings
+
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    dimension = get_settings().embedding.dimension
+    op.create_table(
+        "answer_cache",
+        sa.Column("id", sa.dialects.postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("query", sa.Text, nullable=False),
+        sa.Column("embedding", Vector(dimension), nullable=False),
+        sa.Column("answer", sa.Text, nullable=False),
+        sa.Column("sources", sa.dialects.postgresql.JSONB, nullable=False, server_default="[]"),
+        sa.Column("confidence_tier", sa.String(20), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.execute(
+        "CREATE INDEX ix_answer_cache_embedding_hnsw "
+        "ON answer_cache USING hnsw (embedding vector_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_answer_cache_embedding_hnsw", table_name="answer_cache")
+    op.drop_table("answer_cache")
@@ -0,0 +1,28 @@
+"""Add (session_id, created_at) index for windowed context reads
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_chat_messages_session_id_created_at",
+        "chat_messages",
+        ["session_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chat_messages_session_id_created_at", table_name="chat_messages")
@@ -0,0 +1,74 @@
+"""Size embedding columns from EMBEDDING_DIMENSION, optionally as halfvec
+
+Converts document_chunks.embedding and answer_cache.embedding to the
+configured type (``vector(N)`` or ``halfvec(N)`` per EMBEDDING_STORAGE) and
+rebuilds their HNSW indexes with the matching operator class. Existing
+vectors are cast in place when only the storage changes; if the dimension
+changes they cannot be converted, so chunk embeddings are cleared (re-run
+ingestion) and the answer cache is emptied.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.core.config import get_settings
+
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_INDEXES = {
+    "document_chunks": "ix_document_chunks_embedding_hnsw",
+    "answer_cache": "ix_answer_cache_embedding_hnsw",
+}
+
+
+def _current_type(table: str) -> str:
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT format_type(atttypid, atttypmod) FROM pg_attribute"
+            " WHERE attrelid = CAST(:table AS regclass) AND attname = 'embedding'"
+        ),
+        {"table": table},
+    ).scalar_one()
+
+
+def _dimension(type_name: str) -> int:
+    return int(type_name.split("(")[1].rstrip(")"))
+
+
+def _convert(column_type: str, cosine_ops: str) -> None:
+    target_dimension = _dimension(column_type)
+    for table, index in _INDEXES.items():
+        current = _current_type(table)
+        if current == column_type:
+            continue
+        op.drop_index(index, table_name=table)
+        if _dimension(current) == target_dimension:
+            using = f"CAST(embedding AS {column_type})"
+        else:
+            if table == "answer_cache":
+                op.execute("DELETE FROM answer_cache")  # embedding is NOT NULL there
+            using = f"CAST(NULL AS {column_type})"
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN embedding TYPE {column_type} USING {using}")
+        op.execute(
+            f"CREATE INDEX {index} ON {table} USING hnsw (embedding {cosine_ops}) "
+            "WITH (m = 16, ef_construction = 64)"
+        )
+
+
+def upgrade() -> None:
+    embedding = get_settings().embedding
+    _convert(embedding.column_type, embedding.cosine_ops)
+
+
+def downgrade() -> None:
+    _convert(f"vector({get_settings().embedding.dimension})", "vector_cosine_ops")
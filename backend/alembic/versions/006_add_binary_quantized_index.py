@@ -0,0 +1,35 @@
+"""Add binary-quantized HNSW index for two-stage vector search
+
+Indexes ``binary_quantize(embedding)`` (one bit per dimension) with Hamming
+distance, used when ``retrieval.vector_search`` is ``binary``. The expression
+must stay identical to the one in ``chunk_repo.semantic_candidates_sql``.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.core.config import get_settings
+
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    dimension = get_settings().embedding.dimension
+    op.execute(
+        "CREATE INDEX ix_document_chunks_embedding_bit_hnsw "
+        "ON document_chunks USING hnsw "
+        f"((CAST(binary_quantize(embedding) AS bit({dimension}))) bit_hamming_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_document_chunks_embedding_bit_hnsw", table_name="document_chunks")
@@ -0,0 +1,48 @@
+"""Make document_chunks.tsv a stored generated column weighted by title and heading
+
+``tsv`` used to be filled by a separate UPDATE after every insert, so chunks
+written by any other path were never keyword-searchable. Postgres now derives
+it on every insert and update: the document title (``metadata->>'title'``)
+at weight A, the chunk's section heading (``metadata->>'heading'``) at
+weight B and the chunk text at weight D. Adding the column rewrites the
+table, which backfills existing rows.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match DocumentChunk.tsv (app.models.document.CHUNK_TSV_EXPRESSION).
+_TSV_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(metadata->>'title', '')), 'A')"
+    " || setweight(to_tsvector('english', coalesce(metadata->>'heading', '')), 'B')"
+    " || setweight(to_tsvector('english', text), 'D')"
+)
+
+
+def upgrade() -> None:
+    op.drop_index("ix_document_chunks_tsv", table_name="document_chunks")
+    op.execute("ALTER TABLE document_chunks DROP COLUMN tsv")
+    op.execute(
+        "ALTER TABLE document_chunks ADD COLUMN tsv tsvector"
+        f" GENERATED ALWAYS AS ({_TSV_EXPRESSION}) STORED"
+    )
+    op.create_index("ix_document_chunks_tsv", "document_chunks", ["tsv"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_document_chunks_tsv", table_name="document_chunks")
+    op.execute("ALTER TABLE document_chunks DROP COLUMN tsv")
+    op.execute("ALTER TABLE document_chunks ADD COLUMN tsv tsvector")
+    op.execute("UPDATE document_chunks SET tsv = to_tsvector('english', text)")
+    op.create_index("ix_document_chunks_tsv", "document_chunks", ["tsv"], postgresql_using="gin")
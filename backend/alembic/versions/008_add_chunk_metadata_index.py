@@ -0,0 +1,35 @@
+"""Add a GIN index on document_chunks.metadata for filtered retrieval
+
+Metadata filters are pushed into the search SQL as ``metadata @> ...``
+containment tests; ``jsonb_path_ops`` supports exactly that operator with a
+smaller index than the default opclass. ``document_id`` filters use the
+existing ``ix_document_chunks_document_id``.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_document_chunks_metadata",
+        "document_chunks",
+        ["metadata"],
+        postgresql_using="gin",
+        postgresql_ops={"metadata": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_document_chunks_metadata", table_name="document_chunks")
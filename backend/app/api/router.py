@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
-from app.api.v1 import admin, chat, documents, feedback, health, sessions, voice
+from app.api.v1 import admin, chat, documents, feedback, health, metrics, sessions, voice
 
 api_router = APIRouter(prefix="/api/v1")
 
 api_router.include_router(health.router)
+api_router.include_router(metrics.router)
 api_router.include_router(chat.router)
 api_router.include_router(voice.router)
 api_router.include_router(sessions.router)
@@ -6,6 +6,7 @@ import structlog
 from fastapi import APIRouter
 
 from app.core.config import get_settings
+from app.dependencies import get_retrieval_cache
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 log = structlog.get_logger()
@@ -17,3 +18,17 @@ async def reload_config():
     settings.reload_yaml()
     log.info("config_reloaded")
     return {"status": "ok", "message": "YAML configuration reloaded"}
+
+
+@router.get("/cache/stats")
+async def cache_stats():
+    stats = get_retrieval_cache().stats
+    return {
+        "retrieval": {
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "errors": stats.errors,
+            "hit_rate": round(stats.hit_rate, 4),
+            "seconds_saved": round(stats.seconds_saved, 3),
+        }
+    }
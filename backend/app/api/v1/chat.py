@@ -10,11 +10,13 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sse_starlette.sse import EventSourceResponse
 
+from app.core.metrics import StageTimer
 from app.db.engine import get_db
 from app.db.repositories.session_repo import SessionRepository
 from app.dependencies import get_rag_pipeline
 from app.schemas.chat import ChatRequest
 from app.services.rag_pipeline import RAGPipeline
+from app.services.session_manager import ConversationContext, SessionManager
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 log = structlog.get_logger()
@@ -27,16 +29,24 @@ async def chat_stream(
     pipeline: RAGPipeline = Depends(get_rag_pipeline),
 ):
     session_repo = SessionRepository(db)
+    timer = StageTimer()
 
-    # Create or fetch session
+    # Create or fetch session; only the recent context window is loaded
+    context = ConversationContext()
     if request.session_id:
-        session = await session_repo.get_with_messages(request.session_id)
-        if not session:
+        session = await session_repo.get(request.session_id)
+        if session:
+            with timer.stage("context_load"):
+                context = await SessionManager(db).get_context(
+                    str(session.id), pipeline.settings.conversation
+                )
+        else:
             session = await session_repo.create()
     else:
         session = await session_repo.create()
 
-    # Save user message
+    # Save user message. Committing here releases the pooled connection; the
+    # pipeline opens its own short-lived sessions while the response streams.
     await session_repo.add_message(
         session_id=session.id, role="user", content=request.message
     )
@@ -47,7 +57,9 @@ async def chat_stream(
             result = pipeline.run(
                 query=request.message,
                 session_id=str(session.id),
-                db=db,
+                context=context,
+                timer=timer,
+                filters=request.filters,
             )
 
             async for event in result:
@@ -13,12 +13,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.db.engine import get_db
+from app.db.repositories.chunk_repo import ChunkRepository
 from app.db.repositories.document_repo import DocumentRepository
+from app.dependencies import get_keyword_search, get_retrieval_cache, get_vector_store
 from app.schemas.documents import (
     DocumentResponse,
     DocumentUploadRequest,
     IngestionStatusResponse,
 )
+from app.services.answer_cache import SemanticAnswerCache
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 log = structlog.get_logger()
@@ -142,6 +145,19 @@ async def get_ingestion_status(document_id: uuid.UUID, db: AsyncSession = Depend
 @router.delete("/{document_id}", status_code=204)
 async def delete_document(document_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     repo = DocumentRepository(db)
+    settings = get_settings()
+    in_process_vectors = settings.vectorstore.provider == "mmap"
+    in_process_keywords = settings.keyword_search.provider == "bm25"
+    chunk_ids = []
+    if in_process_vectors or in_process_keywords:
+        chunk_ids = await ChunkRepository(db).ids_for_document(document_id)
     deleted = await repo.delete(document_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Document not found")
+    await SemanticAnswerCache.invalidate(db)
+    await db.commit()
+    if chunk_ids and in_process_vectors:
+        await get_vector_store().delete(chunk_ids)
+    if chunk_ids and in_process_keywords:
+        await get_keyword_search().delete(chunk_ids)
+    await get_retrieval_cache().bump_corpus_version()
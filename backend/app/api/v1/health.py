@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import structlog
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.engine import get_db
+from app.services.warmup import get_warmup_state
 
 router = APIRouter(tags=["health"])
 log = structlog.get_logger()
@@ -19,7 +20,7 @@ async def health():
 
 
 @router.get("/ready")
-async def readiness(db: AsyncSession = Depends(get_db)):
+async def readiness(response: Response, db: AsyncSession = Depends(get_db)):
     checks = {}
     try:
         await db.execute(text("SELECT 1"))
@@ -28,5 +29,12 @@ async def readiness(db: AsyncSession = Depends(get_db)):
         log.error("readiness_check_failed", component="database", error=str(e))
         checks["database"] = "error"
 
+    # Models and templates are preloaded in the background at startup; don't
+    # take traffic until the first request would be warm.
+    warmup = get_warmup_state()
+    checks["models"] = "ok" if warmup.ready else warmup.status
+
     all_ok = all(v == "ok" for v in checks.values())
-    return {"status": "ok" if all_ok else "degraded", "checks": checks}
+    if not all_ok:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {"status": "ok" if all_ok else "degraded", "checks": checks, "warmup": warmup.as_dict()}
@@ -0,0 +1,15 @@
+"""Prometheus scrape endpoint (behind the API key like every other route)."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Response
+
+from app.core.metrics import render_latest
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics")
+async def metrics():
+    body, content_type = render_latest()
+    return Response(body, media_type=content_type)
@@ -10,11 +10,13 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sse_starlette.sse import EventSourceResponse
 
+from app.core.metrics import StageTimer
 from app.db.engine import get_db
 from app.db.repositories.session_repo import SessionRepository
 from app.dependencies import get_rag_pipeline
 from app.schemas.chat import ChatRequest
 from app.services.rag_pipeline import RAGPipeline
+from app.services.session_manager import ConversationContext, SessionManager
 
 router = APIRouter(prefix="/voice", tags=["voice"])
 log = structlog.get_logger()
@@ -29,10 +31,17 @@ async def voice_stream(
     pipeline: RAGPipeline = Depends(get_rag_pipeline),
 ):
     session_repo = SessionRepository(db)
+    timer = StageTimer()
 
+    context = ConversationContext()
     if request.session_id:
-        session = await session_repo.get_with_messages(request.session_id)
-        if not session:
+        session = await session_repo.get(request.session_id)
+        if session:
+            with timer.stage("context_load"):
+                context = await SessionManager(db).get_context(
+                    str(session.id), pipeline.settings.conversation
+                )
+        else:
             session = await session_repo.create()
     else:
         session = await session_repo.create()
@@ -48,7 +57,10 @@ async def voice_stream(
             result = pipeline.run(
                 query=request.message,
                 session_id=str(session.id),
-                db=db,
+                context=context,
+                timer=timer,
+                filters=request.filters,
+                budget=pipeline.settings.latency_budget.for_channel("voice"),
             )
 
             async for event in result:
@@ -0,0 +1,109 @@
+"""Dynamic micro-batching of concurrent single-item calls."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+from app.core.metrics import histogram
+
+In = TypeVar("In")
+Out = TypeVar("Out")
+
+BATCH_SIZE = histogram(
+    "microbatch_size",
+    "Items per dispatched micro-batch.",
+    ("batcher",),
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+BATCH_WAIT = histogram(
+    "microbatch_wait_seconds",
+    "Time an item spent queued before its batch was dispatched.",
+    ("batcher",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+
+
+class MicroBatcher(Generic[In, Out]):
+    """Collect concurrent ``submit`` calls and run them as one batch call.
+
+    A batch is dispatched once ``max_batch_size`` items are queued or the first
+    queued item has waited ``max_wait_ms``, whichever comes first. With
+    ``max_concurrent_batches`` set, items keep queueing while that many batches
+    are running, so a busy backend receives fuller batches. ``fn`` must return
+    one output per input, in order.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[list[In]], Awaitable[list[Out]]],
+        *,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_concurrent_batches: int | None = None,
+        name: str = "default",
+    ):
+        self._fn = fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_concurrent_batches = max_concurrent_batches
+        self.name = name
+        self._pending: list[tuple[In, asyncio.Future[Out], float]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._in_flight: set[asyncio.Future[None]] = set()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    async def submit(self, item: In) -> Out:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Out] = loop.create_future()
+        self._pending.append((item, future, time.perf_counter()))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending and self._has_capacity():
+            batch = [p for p in self._pending[: self.max_batch_size] if not p[1].done()]
+            del self._pending[: self.max_batch_size]
+            if batch:
+                task = asyncio.ensure_future(self._dispatch(batch))
+                self._in_flight.add(task)
+                task.add_done_callback(self._batch_done)
+
+    def _has_capacity(self) -> bool:
+        return (
+            self.max_concurrent_batches is None
+            or len(self._in_flight) < self.max_concurrent_batches
+        )
+
+    def _batch_done(self, task: asyncio.Future[None]) -> None:
+        self._in_flight.discard(task)
+        # Items queued while the backend was busy have already waited; send them now.
+        if self._pending:
+            self._flush()
+
+    async def _dispatch(self, batch: list[tuple[In, asyncio.Future[Out], float]]) -> None:
+        now = time.perf_counter()
+        BATCH_SIZE.labels(batcher=self.name).observe(len(batch))
+        for _, _, queued_at in batch:
+            BATCH_WAIT.labels(batcher=self.name).observe(now - queued_at)
+        try:
+            results = await self._fn([item for item, _, _ in batch])
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future, _), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
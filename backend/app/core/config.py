@@ -62,6 +62,21 @@ class EmbeddingSettings(BaseSettings):
     model: str = "text-embedding-3-small"
     api_key: str = ""
     dimension: int = 1536
+    # "halfvec" stores float16 (half the table/index size); "vector" is float32.
+    storage: str = "vector"
+
+    @property
+    def sql_type(self) -> str:
+        """pgvector type name for casts, e.g. ``CAST(:embedding AS halfvec)``."""
+        return "halfvec" if self.storage == "halfvec" else "vector"
+
+    @property
+    def column_type(self) -> str:
+        return f"{self.sql_type}({self.dimension})"
+
+    @property
+    def cosine_ops(self) -> str:
+        return f"{self.sql_type}_cosine_ops"
 
 
 class RerankerSettings(BaseSettings):
@@ -72,10 +87,42 @@ class RerankerSettings(BaseSettings):
     api_key: str = ""
 
 
+class OnnxSettings(BaseSettings):
+    """Used when EMBEDDING_PROVIDER / RERANKER_PROVIDER is ``onnx``."""
+
+    model_config = SettingsConfigDict(env_prefix="ONNX_", env_file=_ENV_FILE, extra="ignore")
+
+    cache_dir: str = str(_CONFIG_DIR.parent / ".cache" / "onnx")
+    intra_op_threads: int = 0  # 0 = onnxruntime default (all physical cores)
+
+
+class InferenceSettings(BaseSettings):
+    """Shared local inference server (``python -m app.inference.server``)."""
+
+    model_config = SettingsConfigDict(env_prefix="INFERENCE_", env_file=_ENV_FILE, extra="ignore")
+
+    socket_path: str = ""  # empty = every worker loads its own models
+    timeout: float = 30.0
+
+
 class VectorStoreSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="VECTORSTORE_", env_file=_ENV_FILE, extra="ignore")
 
-    provider: str = "pgvector"
+    provider: str = "pgvector"  # pgvector | mmap
+    # mmap: directory of the in-process index, shared by all workers on a host
+    index_path: str = str(_CONFIG_DIR.parent / ".cache" / "vector_index")
+    # pgvector: rows per set-based upsert/delete statement
+    write_batch_size: int = 1000
+
+
+class KeywordSearchSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="KEYWORD_SEARCH_", env_file=_ENV_FILE, extra="ignore"
+    )
+
+    provider: str = "postgres"  # postgres | bm25
+    # bm25: directory of the in-process index, shared by all workers on a host
+    index_path: str = str(_CONFIG_DIR.parent / ".cache" / "bm25")
 
 
 class LangFuseSettings(BaseSettings):
@@ -108,6 +155,7 @@ class AppSettings(BaseSettings):
     log_level: str = "INFO"
     cors_origins: list[str] = Field(default=["http://localhost:5173"])
     api_key: str = ""
+    warmup: bool = True  # preload models before /ready reports ok
 
 
 class RetrievalConfig:
@@ -118,11 +166,117 @@ class RetrievalConfig:
         self.semantic_top_k: int = d.get("semantic_top_k", 20)
         self.keyword_top_k: int = d.get("keyword_top_k", 20)
         self.rrf_k: int = d.get("rrf_k", 60)
+        self.fusion: str = d.get("fusion", "python")  # python | sql
+        self.rewrite_heuristic: bool = d.get("rewrite_heuristic", True)
+        self.speculative_retrieval: bool = d.get("speculative_retrieval", True)
+        self.rewrite_cache_size: int = d.get("rewrite_cache_size", 1024)
         self.rerank_top_k: int = d.get("rerank_top_k", 5)
+        self.hnsw_ef_search: int = d.get("hnsw_ef_search", 40)
+        self.ivfflat_probes: int = d.get("ivfflat_probes", 1)
+        # Filtered HNSW scans: strict_order | relaxed_order | off. Off by default since
+        # pgvector < 0.8 rejects the setting; an unquoted YAML ``off`` loads as False.
+        iterative_scan = d.get("hnsw_iterative_scan", "off")
+        self.hnsw_iterative_scan: str | None = (
+            None if iterative_scan in ("off", False) else iterative_scan
+        )
+        # ann: HNSW over full vectors | binary: Hamming prefilter, exact rescoring
+        self.vector_search: str = d.get("vector_search", "ann")
+        self.binary_oversample: int = d.get("binary_oversample", 8)
         self.chunk_size: int = d.get("chunk_size", 512)
         self.chunk_overlap: int = d.get("chunk_overlap", 64)
 
 
+class AnswerCacheConfig:
+    """Loaded from YAML — semantic answer cache tuning."""
+
+    def __init__(self, data: dict[str, Any] | None = None):
+        d = data or {}
+        self.enabled: bool = d.get("enabled", True)
+        self.similarity_threshold: float = d.get("similarity_threshold", 0.95)
+        self.ttl_seconds: int = d.get("ttl_seconds", 86400)
+
+
+class RetrievalCacheConfig:
+    """Loaded from YAML — shared retrieval result cache tuning."""
+
+    def __init__(self, data: dict[str, Any] | None = None):
+        d = data or {}
+        self.enabled: bool = d.get("enabled", True)
+        self.ttl_seconds: int = d.get("ttl_seconds", 3600)
+
+
+class ConversationConfig:
+    """Loaded from YAML — prompt context window and rolling summary."""
+
+    def __init__(self, data: dict[str, Any] | None = None):
+        d = data or {}
+        self.recent_messages: int = d.get("recent_messages", 6)
+        self.summarize: bool = d.get("summarize", True)
+        self.summary_batch_messages: int = d.get("summary_batch_messages", 4)
+        self.summary_max_tokens: int = d.get("summary_max_tokens", 256)
+
+    @property
+    def max_context_messages(self) -> int:
+        """Cap on messages sent verbatim: the recent window plus those not yet summarised.
+
+        The summary folds messages in batches off the request path, so up to a
+        batch (two while an update lags a turn behind) can be outside the window
+        and not in the summary yet.
+        """
+        if not self.summarize:
+            return self.recent_messages
+        return self.recent_messages + 2 * self.summary_batch_messages
+
+
+class CoalescingConfig:
+    """Loaded from YAML — in-flight deduplication of identical concurrent turns."""
+
+    def __init__(self, data: dict[str, Any] | None = None):
+        d = data or {}
+        self.retrieval: bool = d.get("retrieval", True)
+        self.generation: bool = d.get("generation", True)
+
+
+class BatchingConfig:
+    """Loaded from YAML — micro-batching of concurrent model calls."""
+
+    def __init__(self, data: dict[str, Any] | None = None):
+        d = data or {}
+        self.embedding_enabled: bool = d.get("embedding_enabled", True)
+        self.embedding_max_batch_size: int = d.get("embedding_max_batch_size", 32)
+        self.embedding_max_wait_ms: float = d.get("embedding_max_wait_ms", 5.0)
+        self.rerank_enabled: bool = d.get("rerank_enabled", True)
+        self.rerank_max_batch_size: int = d.get("rerank_max_batch_size", 64)
+        self.rerank_max_wait_ms: float = d.get("rerank_max_wait_ms", 5.0)
+        self.rerank_workers: int = d.get("rerank_workers", 1)
+
+
+class LatencyBudgetConfig:
+    """Loaded from YAML — per-turn deadline and per-stage time budgets (seconds)."""
+
+    def __init__(self, data: dict[str, Any] | None = None):
+        d = data or {}
+        self._data = d
+        self.enabled: bool = d.get("enabled", True)
+        self.total_seconds: float = d.get("total_seconds", 4.0)
+        self.rewrite_seconds: float = d.get("rewrite_seconds", 1.5)
+        self.embedding_seconds: float = d.get("embedding_seconds", 1.0)
+        self.search_seconds: float = d.get("search_seconds", 1.5)
+        self.rerank_seconds: float = d.get("rerank_seconds", 1.5)
+        # ANN search breadth for turns under this budget; None keeps retrieval.hnsw_ef_search
+        # / retrieval.ivfflat_probes. Channels trade recall for latency by overriding them.
+        self.hnsw_ef_search: int | None = d.get("hnsw_ef_search")
+        self.ivfflat_probes: int | None = d.get("ivfflat_probes")
+        self.channels: dict[str, dict[str, Any]] = d.get("channels", {})
+
+    def for_channel(self, channel: str) -> LatencyBudgetConfig:
+        """Budget with the channel's overrides (e.g. ``voice``) applied."""
+        overrides = self.channels.get(channel)
+        if not overrides:
+            return self
+        return LatencyBudgetConfig({**self._data, **overrides, "channels": {}})
+
+
 class ConfidenceConfig:
     """Loaded from YAML — confidence tier thresholds."""
 
@@ -156,19 +310,34 @@ class Settings:
         self.llm = LLMSettings()
         self.embedding = EmbeddingSettings()
         self.reranker = RerankerSettings()
+        self.onnx = OnnxSettings()
+        self.inference = InferenceSettings()
         self.vectorstore = VectorStoreSettings()
+        self.keyword_search = KeywordSearchSettings()
         self.langfuse = LangFuseSettings()
         self.escalation = EscalationSettings()
         self.ingestion = IngestionSettings()
 
         yaml_data = _load_yaml(_CONFIG_DIR / "default.yaml")
         self.retrieval = RetrievalConfig(yaml_data.get("retrieval"))
+        self.answer_cache = AnswerCacheConfig(yaml_data.get("answer_cache"))
+        self.retrieval_cache = RetrievalCacheConfig(yaml_data.get("retrieval_cache"))
+        self.conversation = ConversationConfig(yaml_data.get("conversation"))
+        self.latency_budget = LatencyBudgetConfig(yaml_data.get("latency_budget"))
+        self.coalescing = CoalescingConfig(yaml_data.get("coalescing"))
+        self.batching = BatchingConfig(yaml_data.get("batching"))
         self.confidence = ConfidenceConfig(yaml_data.get("confidence"))
         self.persona = PersonaConfig(yaml_data.get("persona"))
 
     def reload_yaml(self) -> None:
         yaml_data = _load_yaml(_CONFIG_DIR / "default.yaml")
         self.retrieval = RetrievalConfig(yaml_data.get("retrieval"))
+        self.answer_cache = AnswerCacheConfig(yaml_data.get("answer_cache"))
+        self.retrieval_cache = RetrievalCacheConfig(yaml_data.get("retrieval_cache"))
+        self.conversation = ConversationConfig(yaml_data.get("conversation"))
+        self.latency_budget = LatencyBudgetConfig(yaml_data.get("latency_budget"))
+        self.coalescing = CoalescingConfig(yaml_data.get("coalescing"))
+        self.batching = BatchingConfig(yaml_data.get("batching"))
         self.confidence = ConfidenceConfig(yaml_data.get("confidence"))
         self.persona = PersonaConfig(yaml_data.get("persona"))
 
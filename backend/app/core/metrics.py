@@ -0,0 +1,152 @@
+"""Prometheus metrics, backed by ``prometheus_client``.
+
+Single-process deployments expose the default registry. With several uvicorn
+workers, set ``PROMETHEUS_MULTIPROC_DIR`` to an empty directory shared by the
+workers (cleared on each deploy): every worker then writes its samples there
+and a scrape of any worker returns the aggregate across all of them.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# Metrics by name, so re-creating a component (e.g. a second reranker) reuses
+# its metric instead of registering a duplicate.
+_METRICS: dict[str, Counter | Gauge | Histogram] = {}
+# Gauges read from a callback: set_function is per process, so in multiprocess
+# mode they are refreshed into the shared files instead (see refresh_gauges).
+_CALLBACK_GAUGES: dict[str, tuple[Gauge, Callable[[], float]]] = {}
+
+
+def multiprocess_enabled() -> bool:
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+def counter(name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+    if name not in _METRICS:
+        _METRICS[name] = Counter(name, documentation, labelnames)
+    return _METRICS[name]
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: tuple[str, ...] = (),
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+) -> Histogram:
+    if name not in _METRICS:
+        _METRICS[name] = Histogram(name, documentation, labelnames, buckets=buckets)
+    return _METRICS[name]
+
+
+def gauge(name: str, documentation: str, callback: Callable[[], float]) -> Gauge:
+    """Gauge whose value is read from ``callback``; summed over live workers."""
+    metric = _METRICS.get(name)
+    if metric is None:
+        metric = Gauge(name, documentation, multiprocess_mode="livesum")
+        _METRICS[name] = metric
+    if multiprocess_enabled():
+        _CALLBACK_GAUGES[name] = (metric, callback)
+    else:
+        metric.set_function(callback)
+    return metric
+
+
+def refresh_gauges() -> None:
+    """Write this process's callback gauge values (multiprocess mode only)."""
+    for metric, callback in _CALLBACK_GAUGES.values():
+        metric.set(callback())
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Exposition body and content type; aggregated across workers in multiprocess mode."""
+    if not multiprocess_enabled():
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+    refresh_gauges()
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the aggregate on shutdown."""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(os.getpid())
+
+
+STAGE_LATENCY = histogram(
+    "rag_stage_duration_seconds",
+    "Time spent in each RAG pipeline stage, labelled by the turn's confidence tier.",
+    ("stage", "confidence_tier"),
+)
+PROVIDER_ERRORS = counter(
+    "rag_provider_errors_total",
+    "Exceptions raised inside a RAG pipeline stage.",
+    ("stage",),
+)
+
+DEGRADATIONS = counter(
+    "rag_degradations_total",
+    "Turns where a stage was skipped or degraded to stay within the latency budget.",
+    ("degradation",),
+)
+
+COALESCED = counter(
+    "rag_coalesced_requests_total",
+    "Requests that joined an identical in-flight retrieval or LLM stream.",
+    ("stage",),
+)
+SPECULATIVE_RETRIEVALS = counter(
+    "rag_speculative_retrievals_total",
+    "Speculative retrievals on the raw question by outcome (kept, discarded).",
+    ("result",),
+)
+
+
+class StageTimer:
+    """Per-turn stage durations, observed into STAGE_LATENCY once the tier is known."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.durations: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            PROVIDER_ERRORS.labels(stage=name).inc()
+            raise
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def mark(self, name: str) -> None:
+        """Record the time elapsed since the turn started (e.g. time to first token)."""
+        self.durations.setdefault(name, time.perf_counter() - self.started)
+
+    def observe(self, confidence_tier: str) -> None:
+        for name, seconds in self.durations.items():
+            STAGE_LATENCY.labels(stage=name, confidence_tier=confidence_tier).observe(seconds)
+        refresh_gauges()
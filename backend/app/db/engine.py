@@ -4,14 +4,45 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 
+import structlog
+from pgvector.asyncpg import register_vector
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import get_settings
+from app.core.metrics import gauge
+
+log = structlog.get_logger()
 
 _engine = None
 _session_factory = None
 
 
+def _pool_stat(name: str):
+    def read() -> float:
+        return float(getattr(_engine.pool, name)()) if _engine is not None else 0.0
+
+    return read
+
+
+gauge("db_pool_size", "Configured connection pool size.", _pool_stat("size"))
+gauge("db_pool_checked_out", "Connections currently checked out of the pool.", _pool_stat("checkedout"))
+gauge("db_pool_overflow", "Connections open beyond the pool size.", _pool_stat("overflow"))
+
+
+def _register_vector_codec(dbapi_connection, _connection_record) -> None:
+    """Send and receive vector/halfvec values in pgvector's binary format.
+
+    NumPy embeddings are then bound as raw float32 bytes instead of being
+    formatted as ``'[0.1,...]'`` text and parsed back by Postgres, and
+    vector columns decode to arrays rather than lists of Python floats.
+    """
+    try:
+        dbapi_connection.run_async(register_vector)
+    except ValueError as e:  # extension not created yet, e.g. before the first migration
+        log.warning("pgvector_codec_unavailable", error=str(e))
+
+
 def get_engine():
     global _engine
     if _engine is None:
@@ -22,6 +53,7 @@ def get_engine():
             pool_size=20,
             max_overflow=10,
         )
+        event.listen(_engine.sync_engine, "connect", _register_vector_codec)
     return _engine
 
 
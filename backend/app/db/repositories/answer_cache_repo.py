@@ -0,0 +1,44 @@
+"""Semantic answer cache repository."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.answer_cache import AnswerCacheEntry
+
+
+class AnswerCacheRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, **kwargs) -> AnswerCacheEntry:
+        entry = AnswerCacheEntry(**kwargs)
+        self.session.add(entry)
+        await self.session.flush()
+        return entry
+
+    async def find_nearest(
+        self, embedding: np.ndarray, max_age_seconds: int
+    ) -> tuple[AnswerCacheEntry, float] | None:
+        """Return the closest non-expired entry and its cosine similarity."""
+        distance = AnswerCacheEntry.embedding.cosine_distance(embedding)
+        cutoff = datetime.now(UTC) - timedelta(seconds=max_age_seconds)
+        stmt = (
+            select(AnswerCacheEntry, (1 - distance).label("similarity"))
+            .where(AnswerCacheEntry.created_at >= cutoff)
+            .order_by(distance)
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+        return row[0], float(row[1])
+
+    async def clear(self) -> int:
+        result = await self.session.execute(delete(AnswerCacheEntry))
+        return result.rowcount
@@ -2,13 +2,117 @@
 
 from __future__ import annotations
 
+import json
 import uuid
+from collections.abc import Sequence
 
+import numpy as np
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import delete, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.document import DocumentChunk
+from app.providers.base import MetadataFilter
+
+_STAGING_TABLE = "document_chunks_staging"
+_STAGING_COLUMNS = ("id", "document_id", "chunk_index", "text", "embedding", "metadata")
+
+
+async def apply_ann_search_params(
+    session: AsyncSession,
+    ef_search: int | None = None,
+    probes: int | None = None,
+    iterative_scan: str | None = None,
+) -> None:
+    """Set transaction-local pgvector ANN knobs (HNSW ef_search / IVFFlat probes).
+
+    Higher values trade latency for recall. ``iterative_scan`` (pgvector 0.8+,
+    ``relaxed_order`` or ``strict_order``) lets a filtered HNSW scan keep
+    walking the graph until enough rows pass the filter, instead of filtering
+    the first ``ef_search`` neighbours. Settings are scoped to the current
+    transaction so pooled connections never leak them to other queries.
+    """
+    if ef_search is not None:
+        await session.execute(
+            text("SELECT set_config('hnsw.ef_search', :value, true)"),
+            {"value": str(ef_search)},
+        )
+    if probes is not None:
+        await session.execute(
+            text("SELECT set_config('ivfflat.probes', :value, true)"),
+            {"value": str(probes)},
+        )
+    if iterative_scan is not None:
+        await session.execute(
+            text("SELECT set_config('hnsw.iterative_scan', :value, true)"),
+            {"value": iterative_scan},
+        )
+
+
+def chunk_filter_sql(filters: MetadataFilter | None) -> tuple[str, dict[str, list[str]]]:
+    """``AND`` conditions on ``document_chunks`` for ``filters``, and their bind params.
+
+    ``document_id`` compares the indexed column. Other keys become
+    ``metadata @> ANY(...)`` containment tests, one candidate object per
+    allowed value, which the ``jsonb_path_ops`` GIN index on ``metadata``
+    answers with a bitmap scan. Keys and values only ever travel as bind
+    parameters.
+    """
+    if not filters:
+        return "", {}
+    clauses, params = [], {}
+    for i, (key, value) in enumerate(sorted(filters.items())):
+        values = value if isinstance(value, list) else [value]
+        name = f"filter_{i}"
+        if key == "document_id":
+            clauses.append(f"document_id = ANY(CAST(:{name} AS uuid[]))")
+            params[name] = [str(v) for v in values]
+        else:
+            clauses.append(f"metadata @> ANY(CAST(CAST(:{name} AS text[]) AS jsonb[]))")
+            params[name] = [json.dumps({key: v}) for v in values]
+    return "".join(f" AND {clause}" for clause in clauses), params
+
+
+def binary_ef_search(ef_search: int | None, candidates: int) -> int:
+    """HNSW returns at most ``ef_search`` rows, so it must cover the oversampled set."""
+    return min(max(ef_search or 40, candidates), 1000)  # pgvector caps ef_search at 1000
+
+
+def semantic_candidates_sql(
+    vector_type: str = "vector",
+    *,
+    binary_dimension: int | None = None,
+    limit_param: str = "top_k",
+    filter_sql: str = "",
+) -> str:
+    """SQL yielding ``(id, distance)`` for the nearest chunks to ``:embedding``.
+
+    With ``binary_dimension`` set, ``:candidates`` rows are first found by
+    Hamming distance over the binary-quantized HNSW index (one bit per
+    dimension), then rescored with exact cosine distance on ``embedding``.
+    The bit expression must match ``ix_document_chunks_embedding_bit_hnsw``.
+    ``filter_sql`` comes from ``chunk_filter_sql``.
+    """
+    query = f"CAST(:embedding AS {vector_type})"
+    if binary_dimension is None:
+        return (
+            f"SELECT id, embedding <=> {query} AS distance"
+            " FROM document_chunks"
+            f" WHERE embedding IS NOT NULL{filter_sql}"
+            f" ORDER BY embedding <=> {query}"
+            f" LIMIT :{limit_param}"
+        )
+    return (
+        f"SELECT id, embedding <=> {query} AS distance FROM ("
+        " SELECT id, embedding FROM document_chunks"
+        f" WHERE embedding IS NOT NULL{filter_sql}"
+        f" ORDER BY CAST(binary_quantize(embedding) AS bit({binary_dimension}))"
+        f" <~> binary_quantize({query})"
+        " LIMIT :candidates"
+        ") AS quantized_candidates"
+        " ORDER BY distance"
+        f" LIMIT :{limit_param}"
+    )
 
 
 class ChunkRepository:
@@ -19,12 +123,64 @@ class ChunkRepository:
         self.session.add_all(chunks)
         await self.session.flush()
 
+    # -- bulk loading ----------------------------------------------------
+    #
+    # Large documents are streamed into a temporary staging table with
+    # binary COPY (one round trip per batch, embeddings sent as raw float32)
+    # and moved into document_chunks by one INSERT ... SELECT; Postgres
+    # generates tsv as the rows land. All three steps must run in the same
+    # transaction; the staging table is dropped on commit or rollback.
+
+    async def create_staging_table(self) -> None:
+        await self.session.execute(
+            text(
+                f"CREATE TEMP TABLE {_STAGING_TABLE}"
+                " (LIKE document_chunks INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+        )
+
+    async def copy_to_staging(
+        self,
+        document_id: uuid.UUID,
+        chunk_ids: Sequence[uuid.UUID],
+        chunk_indexes: Sequence[int],
+        texts: Sequence[str],
+        embeddings: np.ndarray,
+        metadatas: Sequence[dict],
+    ) -> None:
+        """Append one batch of chunks to the staging table with binary COPY."""
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        records = [
+            (chunk_id, document_id, index, chunk_text, embedding, json.dumps(metadata))
+            for chunk_id, index, chunk_text, embedding, metadata in zip(
+                chunk_ids, chunk_indexes, texts, embeddings, metadatas
+            )
+        ]
+        await raw.driver_connection.copy_records_to_table(
+            _STAGING_TABLE, records=records, columns=_STAGING_COLUMNS
+        )
+
+    async def insert_from_staging(self) -> int:
+        """Move staged rows into document_chunks; returns the row count."""
+        columns = ", ".join(_STAGING_COLUMNS)
+        result = await self.session.execute(
+            text(
+                f"INSERT INTO document_chunks ({columns})"
+                f" SELECT {columns} FROM {_STAGING_TABLE}"
+            )
+        )
+        return result.rowcount
+
     async def vector_search(
         self,
-        query_embedding: list[float],
+        query_embedding: np.ndarray,
         top_k: int = 10,
         document_ids: list[uuid.UUID] | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
     ) -> list[tuple[DocumentChunk, float]]:
+        await apply_ann_search_params(self.session, ef_search=ef_search, probes=probes)
         distance = DocumentChunk.embedding.cosine_distance(query_embedding)
         stmt = (
             select(DocumentChunk, (1 - distance).label("score"))
@@ -56,6 +212,27 @@ class ChunkRepository:
         result = await self.session.execute(stmt)
         return [(row[0], float(row[1])) for row in result.all()]
 
+    async def get_texts(
+        self, chunk_ids: list[str], filters: MetadataFilter | None = None
+    ) -> dict[str, tuple[str, dict]]:
+        """``chunk_id -> (text, metadata)`` for the given ids, in one query.
+
+        Ids whose chunk does not match ``filters`` are left out.
+        """
+        stmt = select(DocumentChunk.id, DocumentChunk.text, DocumentChunk.metadata_).where(
+            DocumentChunk.id.in_([uuid.UUID(cid) for cid in chunk_ids])
+        )
+        filter_sql, filter_params = chunk_filter_sql(filters)
+        if filter_sql:
+            stmt = stmt.where(text(f"TRUE{filter_sql}").bindparams(**filter_params))
+        result = await self.session.execute(stmt)
+        return {str(row[0]): (row[1], row[2] or {}) for row in result.all()}
+
+    async def ids_for_document(self, document_id: uuid.UUID) -> list[str]:
+        stmt = select(DocumentChunk.id).where(DocumentChunk.document_id == document_id)
+        result = await self.session.execute(stmt)
+        return [str(row[0]) for row in result.all()]
+
     async def delete_by_document(self, document_id: uuid.UUID) -> int:
         stmt = delete(DocumentChunk).where(DocumentChunk.document_id == document_id)
         result = await self.session.execute(stmt)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import uuid
+from datetime import datetime
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -33,6 +34,38 @@ class SessionRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_recent_messages(
+        self, session_id: uuid.UUID, limit: int, after: datetime | None = None
+    ) -> list[ChatMessage]:
+        """Last ``limit`` messages (created after ``after``) in chronological order.
+
+        Reads only those rows, without loading the full history.
+        """
+        stmt = (
+            select(ChatMessage)
+            .where(ChatMessage.session_id == session_id)
+            .order_by(ChatMessage.created_at.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(ChatMessage.created_at > after)
+        result = await self.session.execute(stmt)
+        return list(reversed(result.scalars().all()))
+
+    async def get_messages_after(
+        self, session_id: uuid.UUID, after: datetime | None = None
+    ) -> list[ChatMessage]:
+        """Messages created after ``after`` (all when None), oldest first."""
+        stmt = (
+            select(ChatMessage)
+            .where(ChatMessage.session_id == session_id)
+            .order_by(ChatMessage.created_at)
+        )
+        if after is not None:
+            stmt = stmt.where(ChatMessage.created_at > after)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def list_all(self, limit: int = 50) -> list[ChatSession]:
         stmt = select(ChatSession).order_by(ChatSession.updated_at.desc()).limit(limit)
         result = await self.session.execute(stmt)
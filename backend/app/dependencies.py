@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
 from app.providers.base import (
     EmbeddingProvider,
+    HybridSearchProvider,
     KeywordSearchProvider,
     LLMProvider,
     RerankerProvider,
     VectorStoreProvider,
 )
 
+if TYPE_CHECKING:
+    from app.inference.client import InferenceClient
+
 
 @lru_cache(maxsize=1)
 def get_llm_provider() -> LLMProvider:
@@ -28,59 +33,208 @@ def get_llm_provider() -> LLMProvider:
     )
 
 
+# Providers that load model weights; these can be served by the shared
+# inference server (app.inference.server) instead of in every worker.
+_LOCAL_EMBEDDING_PROVIDERS = frozenset({"sentence-transformers", "onnx"})
+_LOCAL_RERANKER_PROVIDERS = frozenset({"cross-encoder", "onnx"})
+
+
+@lru_cache(maxsize=1)
+def get_inference_client() -> InferenceClient | None:
+    settings = get_settings()
+    if not settings.inference.socket_path:
+        return None
+    from app.inference.client import InferenceClient
+
+    return InferenceClient(settings.inference.socket_path, timeout=settings.inference.timeout)
+
+
 @lru_cache(maxsize=1)
 def get_embedding_provider() -> EmbeddingProvider:
     settings = get_settings()
-    if settings.embedding.provider == "sentence-transformers":
+    client = get_inference_client()
+    if client is not None and settings.embedding.provider in _LOCAL_EMBEDDING_PROVIDERS:
+        from app.inference.client import RemoteEmbeddingProvider
+
+        return RemoteEmbeddingProvider(client, dimension=settings.embedding.dimension)
+    return build_embedding_provider(settings)
+
+
+def build_embedding_provider(settings: Settings) -> EmbeddingProvider:
+    """In-process embedding provider, micro-batched when enabled."""
+    provider: EmbeddingProvider
+    if settings.embedding.provider == "onnx":
+        from app.providers.embeddings.onnx_embeddings import OnnxEmbeddingProvider
+
+        provider = OnnxEmbeddingProvider(
+            model_name=settings.embedding.model,
+            dimension=settings.embedding.dimension,
+            cache_dir=settings.onnx.cache_dir,
+            intra_op_threads=settings.onnx.intra_op_threads,
+        )
+    elif settings.embedding.provider == "sentence-transformers":
         from app.providers.embeddings.sentence_transformer_embeddings import (
             SentenceTransformerEmbeddingProvider,
         )
 
-        return SentenceTransformerEmbeddingProvider(
+        provider = SentenceTransformerEmbeddingProvider(
             model_name=settings.embedding.model,
             dimension=settings.embedding.dimension,
         )
     else:
         from app.providers.embeddings.litellm_embeddings import LiteLLMEmbeddingProvider
 
-        return LiteLLMEmbeddingProvider(
+        provider = LiteLLMEmbeddingProvider(
             model=settings.embedding.model,
             api_key=settings.embedding.api_key,
             dimension=settings.embedding.dimension,
         )
 
+    batching = settings.batching
+    if not batching.embedding_enabled:
+        return provider
+
+    from app.providers.embeddings.batching_embeddings import BatchingEmbeddingProvider
+
+    return BatchingEmbeddingProvider(
+        provider,
+        max_batch_size=batching.embedding_max_batch_size,
+        max_wait_ms=batching.embedding_max_wait_ms,
+    )
+
 
 @lru_cache(maxsize=1)
 def get_vector_store() -> VectorStoreProvider:
+    settings = get_settings()
+    if settings.vectorstore.provider == "mmap":
+        from app.providers.vectorstore.mmap_store import MmapVectorStore
+
+        return MmapVectorStore(
+            settings.vectorstore.index_path, dimension=settings.embedding.dimension
+        )
+
     from app.db.engine import get_session_factory
     from app.providers.vectorstore.pgvector_store import PgVectorStore
 
-    return PgVectorStore(session_factory=get_session_factory())
+    return PgVectorStore(
+        session_factory=get_session_factory(),
+        ef_search=settings.retrieval.hnsw_ef_search,
+        probes=settings.retrieval.ivfflat_probes,
+        vector_type=settings.embedding.sql_type,
+        search_mode=settings.retrieval.vector_search,
+        dimension=settings.embedding.dimension,
+        binary_oversample=settings.retrieval.binary_oversample,
+        write_batch_size=settings.vectorstore.write_batch_size,
+        iterative_scan=settings.retrieval.hnsw_iterative_scan,
+    )
 
 
 @lru_cache(maxsize=1)
 def get_reranker() -> RerankerProvider:
     settings = get_settings()
+    client = get_inference_client()
+    if client is not None and settings.reranker.provider in _LOCAL_RERANKER_PROVIDERS:
+        from app.inference.client import RemoteReranker
+
+        return RemoteReranker(client)
+    return build_reranker(settings)
+
+
+def build_reranker(settings: Settings) -> RerankerProvider:
+    """In-process reranker."""
     if settings.reranker.provider == "cohere":
         from app.providers.reranker.cohere_reranker import CohereReranker
 
         return CohereReranker(api_key=settings.reranker.api_key)
-    else:
-        from app.providers.reranker.cross_encoder_reranker import CrossEncoderReranker
 
-        return CrossEncoderReranker(model_name=settings.reranker.model)
+    batching = settings.batching
+    max_batch_size = batching.rerank_max_batch_size if batching.rerank_enabled else None
+    if settings.reranker.provider == "onnx":
+        from app.providers.reranker.onnx_reranker import OnnxCrossEncoderReranker
+
+        return OnnxCrossEncoderReranker(
+            model_name=settings.reranker.model,
+            max_batch_size=max_batch_size,
+            max_wait_ms=batching.rerank_max_wait_ms,
+            workers=batching.rerank_workers,
+            cache_dir=settings.onnx.cache_dir,
+            intra_op_threads=settings.onnx.intra_op_threads,
+        )
+
+    from app.providers.reranker.cross_encoder_reranker import CrossEncoderReranker
+
+    return CrossEncoderReranker(
+        model_name=settings.reranker.model,
+        max_batch_size=max_batch_size,
+        max_wait_ms=batching.rerank_max_wait_ms,
+        workers=batching.rerank_workers,
+    )
 
 
 @lru_cache(maxsize=1)
 def get_keyword_search() -> KeywordSearchProvider:
+    settings = get_settings()
+    if settings.keyword_search.provider == "bm25":
+        from app.providers.keyword_search.bm25_search import Bm25KeywordSearchProvider
+
+        return Bm25KeywordSearchProvider(settings.keyword_search.index_path)
+
     from app.db.engine import get_session_factory
     from app.providers.keyword_search.postgres_fts import PostgresFTSProvider
 
     return PostgresFTSProvider(session_factory=get_session_factory())
 
 
+@lru_cache(maxsize=1)
+def get_hybrid_search() -> HybridSearchProvider | None:
+    """SQL-side fusion is only possible when both rankings live in Postgres."""
+    settings = get_settings()
+    if settings.vectorstore.provider != "pgvector":
+        return None
+    if settings.keyword_search.provider != "postgres":
+        return None
+
+    from app.db.engine import get_session_factory
+    from app.providers.hybrid_search.postgres_hybrid import PostgresHybridSearchProvider
+
+    return PostgresHybridSearchProvider(
+        session_factory=get_session_factory(),
+        ef_search=settings.retrieval.hnsw_ef_search,
+        probes=settings.retrieval.ivfflat_probes,
+        vector_type=settings.embedding.sql_type,
+        search_mode=settings.retrieval.vector_search,
+        dimension=settings.embedding.dimension,
+        binary_oversample=settings.retrieval.binary_oversample,
+        iterative_scan=settings.retrieval.hnsw_iterative_scan,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_answer_cache():
+    from app.db.engine import get_session_factory
+    from app.services.answer_cache import SemanticAnswerCache
+
+    return SemanticAnswerCache(session_factory=get_session_factory(), settings=get_settings())
+
+
+@lru_cache(maxsize=1)
+def get_redis():
+    from redis.asyncio import Redis
+
+    return Redis.from_url(get_settings().redis.url)
+
+
+@lru_cache(maxsize=1)
+def get_retrieval_cache():
+    from app.services.retrieval_cache import RetrievalCache
+
+    return RetrievalCache(redis=get_redis(), settings=get_settings())
+
+
 @lru_cache(maxsize=1)
 def get_rag_pipeline():
+    from app.db.engine import get_session_factory
+    from app.services.conversation_summarizer import ConversationSummarizer
     from app.services.rag_pipeline import RAGPipeline
 
     settings = get_settings()
@@ -91,4 +245,13 @@ def get_rag_pipeline():
         reranker=get_reranker(),
         keyword_search=get_keyword_search(),
         settings=settings,
+        session_factory=get_session_factory(),
+        hybrid_search=get_hybrid_search(),
+        answer_cache=get_answer_cache(),
+        retrieval_cache=get_retrieval_cache(),
+        summarizer=ConversationSummarizer(
+            llm=get_llm_provider(),
+            session_factory=get_session_factory(),
+            settings=settings,
+        ),
     )
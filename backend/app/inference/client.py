@@ -0,0 +1,146 @@
+"""Client and providers that delegate model inference to the local server."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+import numpy as np
+import structlog
+
+from app.core.exceptions import ProviderError
+from app.inference.protocol import (
+    OP_EMBED,
+    OP_ERROR,
+    OP_PING,
+    OP_RERANK,
+    decode_matrix,
+    decode_scores,
+    encode_frame,
+    encode_rerank_request,
+    encode_texts,
+    read_frame,
+)
+from app.providers.base import WARMUP_TEXT, RerankResult
+
+log = structlog.get_logger()
+
+
+class InferenceClient:
+    """One multiplexed UNIX-socket connection per process, reconnected on failure."""
+
+    def __init__(self, socket_path: str, timeout: float = 30.0):
+        self._socket_path = socket_path
+        self._timeout = timeout
+        self._ids = itertools.count(1)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._pending: dict[int, asyncio.Future[tuple[int, bytes]]] = {}
+
+    async def _connection(self) -> asyncio.StreamWriter:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._lock, self._writer = loop, asyncio.Lock(), None
+        assert self._lock is not None
+        async with self._lock:
+            if self._writer is None or self._writer.is_closing():
+                try:
+                    reader, writer = await asyncio.open_unix_connection(self._socket_path)
+                except OSError as e:
+                    raise ProviderError(
+                        f"Inference server unavailable at {self._socket_path}: {e}"
+                    ) from e
+                self._writer = writer
+                self._reader_task = asyncio.create_task(self._read_responses(reader, writer))
+            return self._writer
+
+    async def _read_responses(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                op, request_id, payload = await read_frame(reader)
+                future = self._pending.get(request_id)
+                if future is not None and not future.done():
+                    future.set_result((op, payload))
+        except Exception as e:
+            log.warning("inference_connection_lost", error=str(e))
+        finally:
+            writer.close()
+            if self._writer is writer:
+                self._writer = None
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ProviderError("Inference server connection lost"))
+
+    async def request(self, op: int, payload: bytes = b"") -> bytes:
+        writer = await self._connection()
+        request_id = next(self._ids) & 0xFFFFFFFF
+        future: asyncio.Future[tuple[int, bytes]] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            writer.write(encode_frame(op, request_id, payload))
+            await writer.drain()
+            status, body = await asyncio.wait_for(future, self._timeout)
+        finally:
+            self._pending.pop(request_id, None)
+        if status == OP_ERROR:
+            raise ProviderError(f"Inference server error: {body.decode()}")
+        return body
+
+    async def ping(self) -> bool:
+        try:
+            await self.request(OP_PING)
+        except ProviderError:
+            return False
+        return True
+
+
+class RemoteEmbeddingProvider:
+    def __init__(self, client: InferenceClient, dimension: int):
+        self._client = client
+        self._dimension = dimension
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    async def embed_texts(self, texts: list[str]) -> np.ndarray:
+        return decode_matrix(await self._client.request(OP_EMBED, encode_texts(texts)))
+
+    async def embed_query(self, text: str) -> np.ndarray:
+        results = await self.embed_texts([text])
+        return results[0]
+
+    async def warmup(self) -> None:
+        """Open the connection; the server warms its own models before listening."""
+        await self.embed_texts([WARMUP_TEXT])
+
+
+class RemoteReranker:
+    def __init__(self, client: InferenceClient):
+        self._client = client
+
+    async def rerank(
+        self,
+        query: str,
+        documents: list[str],
+        top_k: int = 5,
+    ) -> list[RerankResult]:
+        if not documents:
+            return []
+
+        scores = decode_scores(
+            await self._client.request(OP_RERANK, encode_rerank_request(query, documents))
+        )
+        results = [
+            RerankResult(index=i, score=score, text=documents[i])
+            for i, score in enumerate(scores)
+        ]
+        results.sort(key=lambda r: r.score, reverse=True)
+        return results[:top_k]
+
+    async def warmup(self) -> None:
+        await self.rerank(WARMUP_TEXT, [WARMUP_TEXT], top_k=1)
@@ -0,0 +1,111 @@
+"""Binary framing for the local inference server.
+
+Every frame is ``uint32 length`` followed by ``length`` bytes of body. A body
+starts with ``uint8 op`` and ``uint32 request_id`` (big-endian); responses
+echo the request id so one connection can carry many concurrent requests.
+
+Request payloads:
+    EMBED   texts
+    RERANK  query, documents
+    PING    (empty)
+
+Texts are ``uint32 count`` then ``uint32 length`` + UTF-8 bytes per text.
+Response payloads are little-endian float32 arrays: ``uint32 rows, uint32
+dim`` + data for EMBED, ``uint32 count`` + one score per document (in input
+order) for RERANK. ERROR carries a UTF-8 message.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+
+import numpy as np
+
+from app.core.exceptions import ProviderError
+
+OP_EMBED = 1
+OP_RERANK = 2
+OP_PING = 3
+OP_OK = 0
+OP_ERROR = 255
+
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+_LENGTH = struct.Struct("!I")
+_HEADER = struct.Struct("!BI")
+
+
+class ProtocolError(ProviderError):
+    """Raised for a malformed frame."""
+
+
+def encode_frame(op: int, request_id: int, payload: bytes = b"") -> bytes:
+    body = _HEADER.pack(op, request_id) + payload
+    return _LENGTH.pack(len(body)) + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> tuple[int, int, bytes]:
+    """Read one frame; raises ``asyncio.IncompleteReadError`` on EOF."""
+    (length,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+    if length < _HEADER.size or length > MAX_FRAME_BYTES:
+        raise ProtocolError(f"invalid frame length {length}")
+    body = await reader.readexactly(length)
+    op, request_id = _HEADER.unpack_from(body)
+    return op, request_id, body[_HEADER.size :]
+
+
+def encode_texts(texts: list[str]) -> bytes:
+    parts = [_LENGTH.pack(len(texts))]
+    for text in texts:
+        data = text.encode()
+        parts.append(_LENGTH.pack(len(data)))
+        parts.append(data)
+    return b"".join(parts)
+
+
+def decode_texts(payload: bytes, offset: int = 0) -> tuple[list[str], int]:
+    """Return the decoded texts and the offset just past them."""
+    (count,) = _LENGTH.unpack_from(payload, offset)
+    offset += _LENGTH.size
+    texts = []
+    for _ in range(count):
+        (length,) = _LENGTH.unpack_from(payload, offset)
+        offset += _LENGTH.size
+        texts.append(payload[offset : offset + length].decode())
+        offset += length
+    return texts, offset
+
+
+def encode_rerank_request(query: str, documents: list[str]) -> bytes:
+    return encode_texts([query]) + encode_texts(documents)
+
+
+def decode_rerank_request(payload: bytes) -> tuple[str, list[str]]:
+    (query,), offset = decode_texts(payload)
+    documents, _ = decode_texts(payload, offset)
+    return query, documents
+
+
+def encode_matrix(rows: np.ndarray, dim: int = 0) -> bytes:
+    """Pack embedding rows; ``dim`` gives the shape of an empty batch, ``(0, dim)``."""
+    if len(rows) == 0:
+        return struct.pack("!II", 0, dim)
+    matrix = np.asarray(rows, dtype="<f4")
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(rows), -1)
+    return struct.pack("!II", *matrix.shape) + matrix.tobytes()
+
+
+def decode_matrix(payload: bytes) -> np.ndarray:
+    rows, dim = struct.unpack_from("!II", payload)
+    return np.frombuffer(payload, dtype="<f4", offset=8).reshape(rows, dim)
+
+
+def encode_scores(scores: list[float]) -> bytes:
+    return _LENGTH.pack(len(scores)) + np.asarray(scores, dtype="<f4").tobytes()
+
+
+def decode_scores(payload: bytes) -> list[float]:
+    (count,) = _LENGTH.unpack_from(payload)
+    return np.frombuffer(payload, dtype="<f4", count=count, offset=_LENGTH.size).tolist()
@@ -0,0 +1,147 @@
+"""Local model-serving sidecar.
+
+Holds the single copy of the embedding model and cross-encoder for every API
+and arq worker on the host; clients connect over a UNIX socket. Concurrent
+requests from all workers share the providers' micro-batchers.
+
+Usage: python -m app.inference.server [--socket /run/csbot/inference.sock]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+from pathlib import Path
+
+import structlog
+
+from app.core.config import get_settings
+from app.core.logging import setup_logging
+from app.inference.protocol import (
+    OP_EMBED,
+    OP_ERROR,
+    OP_OK,
+    OP_PING,
+    OP_RERANK,
+    ProtocolError,
+    decode_rerank_request,
+    decode_texts,
+    encode_frame,
+    encode_matrix,
+    encode_scores,
+    read_frame,
+)
+from app.providers.base import EmbeddingProvider, RerankerProvider
+from app.services.warmup import warm_up
+
+log = structlog.get_logger()
+
+
+class InferenceServer:
+    def __init__(self, embeddings: EmbeddingProvider, reranker: RerankerProvider):
+        self.embeddings = embeddings
+        self.reranker = reranker
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        write_lock = asyncio.Lock()
+        in_flight: set[asyncio.Task[None]] = set()
+        try:
+            while True:
+                op, request_id, payload = await read_frame(reader)
+                task = asyncio.create_task(
+                    self._respond(op, request_id, payload, writer, write_lock)
+                )
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ProtocolError as e:
+            log.warning("inference_protocol_error", error=str(e))
+        finally:
+            for task in in_flight:
+                task.cancel()
+            writer.close()
+
+    async def _respond(
+        self,
+        op: int,
+        request_id: int,
+        payload: bytes,
+        writer: asyncio.StreamWriter,
+        write_lock: asyncio.Lock,
+    ) -> None:
+        try:
+            frame = encode_frame(OP_OK, request_id, await self.execute(op, payload))
+        except Exception as e:
+            log.error("inference_request_failed", op=op, error=str(e))
+            frame = encode_frame(OP_ERROR, request_id, str(e).encode())
+        async with write_lock:
+            writer.write(frame)
+            await writer.drain()
+
+    async def execute(self, op: int, payload: bytes) -> bytes:
+        if op == OP_EMBED:
+            texts, _ = decode_texts(payload)
+            if not texts:
+                vectors = []
+            elif len(texts) == 1:
+                # Single queries go through the provider's micro-batcher.
+                vectors = [await self.embeddings.embed_query(texts[0])]
+            else:
+                vectors = await self.embeddings.embed_texts(texts)
+            return encode_matrix(vectors, self.embeddings.dimension)
+        if op == OP_RERANK:
+            query, documents = decode_rerank_request(payload)
+            results = await self.reranker.rerank(query, documents, top_k=len(documents))
+            scores = [0.0] * len(documents)
+            for r in results:
+                scores[r.index] = r.score
+            return encode_scores(scores)
+        if op == OP_PING:
+            return b""
+        raise ProtocolError(f"unknown op {op}")
+
+
+async def serve(socket_path: str) -> None:
+    from app.dependencies import build_embedding_provider, build_reranker
+
+    settings = get_settings()
+    server = InferenceServer(
+        embeddings=build_embedding_provider(settings),
+        reranker=build_reranker(settings),
+    )
+    # Clients connect only once the socket exists, so warm before listening.
+    state = await warm_up(embeddings=server.embeddings, reranker=server.reranker)
+    if not state.ready:
+        raise RuntimeError(f"inference warm-up failed: {state.error}")
+    path = Path(socket_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)  # stale socket from a previous run
+    unix_server = await asyncio.start_unix_server(server.handle_connection, path=socket_path)
+    os.chmod(socket_path, 0o660)
+    log.info(
+        "inference_server_listening",
+        socket=socket_path,
+        embedding_model=settings.embedding.model,
+        reranker_model=settings.reranker.model,
+    )
+    async with unix_server:
+        await unix_server.serve_forever()
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Local embedding/rerank inference server")
+    parser.add_argument("--socket", default=settings.inference.socket_path)
+    args = parser.parse_args()
+    if not args.socket:
+        parser.error("set --socket or INFERENCE_SOCKET_PATH")
+    setup_logging(settings.app.log_level)
+    asyncio.run(serve(args.socket))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import bisect
+import re
+
 from app.ingestion.chunkers.base import Chunk
 
+_HEADING = re.compile(r"^#{1,6}\s+(.+?)\s*#*$", re.MULTILINE)
+
 
 class FixedSizeChunker:
     def __init__(self, chunk_size: int = 512, overlap: int = 64):
@@ -12,6 +17,8 @@ class FixedSizeChunker:
 
     def chunk(self, text: str, metadata: dict | None = None) -> list[Chunk]:
         metadata = metadata or {}
+        headings = [(m.start(), m.group(1)) for m in _HEADING.finditer(text)]
+        heading_starts = [pos for pos, _ in headings]
         chunks = []
         start = 0
         idx = 0
@@ -35,13 +42,14 @@ class FixedSizeChunker:
 
             chunk_text = text[start:end].strip()
             if chunk_text:
-                chunks.append(
-                    Chunk(
-                        text=chunk_text,
-                        index=idx,
-                        metadata={**metadata, "char_start": start, "char_end": end},
-                    )
-                )
+                chunk_metadata = {**metadata, "char_start": start, "char_end": end}
+                # The section the chunk starts in, else the first one it opens.
+                i = bisect.bisect_right(heading_starts, start) - 1
+                if i < 0 and heading_starts and heading_starts[0] < end:
+                    i = 0
+                if i >= 0:
+                    chunk_metadata["heading"] = headings[i][1]
+                chunks.append(Chunk(text=chunk_text, index=idx, metadata=chunk_metadata))
                 idx += 1
 
             start = end - self.overlap
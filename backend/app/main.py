@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 import structlog
 from fastapi import FastAPI
@@ -11,10 +12,30 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.router import api_router
 from app.core.config import get_settings
 from app.core.logging import setup_logging
+from app.core.metrics import mark_process_dead
 from app.db.engine import dispose_engine
 
 log = structlog.get_logger()
 
+_WARMUP_RETRY_SECONDS = 5.0
+
+
+async def _warm_up_until_ready() -> None:
+    """Background warm-up; retried so a late inference server doesn't pin /ready."""
+    from app.dependencies import get_rag_pipeline
+    from app.services.warmup import warm_up
+
+    pipeline = get_rag_pipeline()
+    while True:
+        state = await warm_up(
+            embeddings=pipeline.embeddings,
+            reranker=pipeline.reranker,
+            persona=pipeline.persona,
+        )
+        if state.ready:
+            return
+        await asyncio.sleep(_WARMUP_RETRY_SECONDS)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -26,8 +47,20 @@ async def lifespan(app: FastAPI):
         llm_model=settings.llm.model,
         embedding_model=settings.embedding.model,
     )
+    warmup_task = None
+    if settings.app.warmup:
+        warmup_task = asyncio.create_task(_warm_up_until_ready())
+    else:
+        from app.services.warmup import get_warmup_state
+
+        get_warmup_state().status = "ready"
     yield
+    if warmup_task is not None:
+        warmup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup_task
     await dispose_engine()
+    mark_process_dead()
     log.info("app_shutdown")
 
 
@@ -1,9 +1,11 @@
+from app.models.answer_cache import AnswerCacheEntry
 from app.models.base import Base
 from app.models.document import Document, DocumentChunk
 from app.models.feedback import EscalationEvent, UserFeedback
 from app.models.session import ChatMessage, ChatSession
 
 __all__ = [
+    "AnswerCacheEntry",
     "Base",
     "ChatMessage",
     "ChatSession",
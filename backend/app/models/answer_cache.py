@@ -0,0 +1,36 @@
+"""Semantic answer cache model."""
+
+from __future__ import annotations
+
+import numpy as np
+from sqlalchemy import Index, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import (
+    Base,
+    TimestampMixin,
+    UUIDPrimaryKeyMixin,
+    embedding_cosine_ops,
+    embedding_type,
+)
+
+
+class AnswerCacheEntry(Base, UUIDPrimaryKeyMixin, TimestampMixin):
+    __tablename__ = "answer_cache"
+
+    query: Mapped[str] = mapped_column(Text, nullable=False)
+    embedding: Mapped[np.ndarray] = mapped_column(embedding_type(), nullable=False)
+    answer: Mapped[str] = mapped_column(Text, nullable=False)
+    sources: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
+    confidence_tier: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_answer_cache_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": embedding_cosine_ops()},
+        ),
+    )
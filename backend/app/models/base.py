@@ -5,10 +5,14 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
+import numpy as np
+from pgvector.sqlalchemy import HALFVEC, Vector
 from sqlalchemy import DateTime, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import BIT, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from app.core.config import get_settings
+
 
 class Base(DeclarativeBase):
     pass
@@ -27,3 +31,53 @@ class UUIDPrimaryKeyMixin:
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
+
+
+class _BinaryCodecMixin:
+    """Leave values to the asyncpg binary codec registered in ``app.db.engine``.
+
+    pgvector's own types render every bound value as text, which the binary
+    codec rejects; here arrays pass through untouched and results come back
+    as float32 arrays.
+    """
+
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        return None
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            return None if value is None else value.to_numpy().astype(np.float32)
+
+        return process
+
+    def compare_values(self, x, y) -> bool:
+        if x is None or y is None:
+            return x is y
+        return np.array_equal(x, y)
+
+
+class BinaryVector(_BinaryCodecMixin, Vector):
+    pass
+
+
+class BinaryHalfVector(_BinaryCodecMixin, HALFVEC):
+    pass
+
+
+def embedding_type() -> BinaryVector | BinaryHalfVector:
+    """Embedding column type for the configured dimension and storage."""
+    embedding = get_settings().embedding
+    if embedding.sql_type == "halfvec":
+        return BinaryHalfVector(embedding.dimension)
+    return BinaryVector(embedding.dimension)
+
+
+def embedding_cosine_ops() -> str:
+    return get_settings().embedding.cosine_ops
+
+
+def embedding_bit_type() -> BIT:
+    """Type of ``binary_quantize(embedding)``: one bit per embedding dimension."""
+    return BIT(get_settings().embedding.dimension)
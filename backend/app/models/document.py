@@ -4,12 +4,27 @@ from __future__ import annotations
 
 import uuid
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import ForeignKey, Index, String, Text
+import numpy as np
+from sqlalchemy import Computed, ForeignKey, Index, String, Text, cast, func, literal_column
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin, UUIDPrimaryKeyMixin
+from app.models.base import (
+    Base,
+    TimestampMixin,
+    UUIDPrimaryKeyMixin,
+    embedding_bit_type,
+    embedding_cosine_ops,
+    embedding_type,
+)
+
+# Keyword-search document for a chunk: title (A) and section heading (B) from
+# chunk metadata outrank body text (D) in ts_rank. Kept in sync with migration 007.
+CHUNK_TSV_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(metadata->>'title', '')), 'A')"
+    " || setweight(to_tsvector('english', coalesce(metadata->>'heading', '')), 'B')"
+    " || setweight(to_tsvector('english', text), 'D')"
+)
 
 
 class Document(Base, UUIDPrimaryKeyMixin, TimestampMixin):
@@ -40,8 +55,10 @@ class DocumentChunk(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     )
     chunk_index: Mapped[int] = mapped_column(nullable=False)
     text: Mapped[str] = mapped_column(Text, nullable=False)
-    embedding: Mapped[list[float] | None] = mapped_column(Vector(384), nullable=True)
-    tsv: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True)
+    embedding: Mapped[np.ndarray | None] = mapped_column(embedding_type(), nullable=True)
+    tsv: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(CHUNK_TSV_EXPRESSION, persisted=True), nullable=True
+    )
     metadata_: Mapped[dict] = mapped_column("metadata", JSONB, nullable=False, default=dict)
 
     document: Mapped[Document] = relationship(back_populates="chunks")
@@ -49,4 +66,28 @@ class DocumentChunk(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __table_args__ = (
         Index("ix_document_chunks_document_id", "document_id"),
         Index("ix_document_chunks_tsv", "tsv", postgresql_using="gin"),
+        Index(
+            "ix_document_chunks_metadata",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_document_chunks_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": embedding_cosine_ops()},
+        ),
+        # Hamming prefilter for retrieval.vector_search = binary (migration 006); the
+        # expression must match chunk_repo.semantic_candidates_sql.
+        Index(
+            "ix_document_chunks_embedding_bit_hnsw",
+            cast(func.binary_quantize(literal_column("embedding")), embedding_bit_type()).label(
+                "embedding_bit"
+            ),
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding_bit": "bit_hamming_ops"},
+        ),
     )
@@ -36,4 +36,7 @@ class ChatMessage(Base, UUIDPrimaryKeyMixin, TimestampMixin):
 
     session: Mapped[ChatSession] = relationship(back_populates="messages")
 
-    __table_args__ = (Index("ix_chat_messages_session_id", "session_id"),)
+    __table_args__ = (
+        Index("ix_chat_messages_session_id", "session_id"),
+        Index("ix_chat_messages_session_id_created_at", "session_id", "created_at"),
+    )
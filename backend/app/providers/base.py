@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import AsyncIterator, Protocol, runtime_checkable
 
+import numpy as np
+
 
 @dataclass
 class LLMMessage:
@@ -40,12 +42,25 @@ class LLMProvider(Protocol):
 
 @runtime_checkable
 class EmbeddingProvider(Protocol):
+    """Embeddings are float32 arrays, never Python float lists.
+
+    ``embed_texts`` returns ``(len(texts), dimension)`` and ``embed_query``
+    returns ``(dimension,)``. Stores pass them to Postgres as-is through
+    pgvector's binary codec (see ``app.db.engine``).
+    """
+
     @property
     def dimension(self) -> int: ...
 
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]: ...
+    async def embed_texts(self, texts: list[str]) -> np.ndarray: ...
+
+    async def embed_query(self, text: str) -> np.ndarray: ...
 
-    async def embed_query(self, text: str) -> list[float]: ...
+
+# Search filters: each key must match. ``document_id`` matches the chunk's
+# document; other keys match chunk metadata. A list matches any of its values.
+FilterValue = str | int | float | bool
+MetadataFilter = dict[str, FilterValue | list[FilterValue]]
 
 
 @dataclass
@@ -61,17 +76,26 @@ class VectorStoreProvider(Protocol):
     async def upsert(
         self,
         ids: list[str],
-        embeddings: list[list[float]],
+        embeddings: np.ndarray,
         texts: list[str],
         metadatas: list[dict[str, str | int | float | bool]],
     ) -> None: ...
 
     async def search(
         self,
-        query_embedding: list[float],
+        query_embedding: np.ndarray,
         top_k: int = 10,
-        filter_metadata: dict[str, str | int | float | bool] | None = None,
-    ) -> list[VectorSearchResult]: ...
+        filter_metadata: MetadataFilter | None = None,
+        *,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> list[VectorSearchResult]:
+        """Nearest chunks to ``query_embedding``.
+
+        ``ef_search``/``probes`` override the ANN search breadth for this call;
+        stores without an HNSW/IVFFlat index ignore them.
+        """
+        ...
 
     async def delete(self, ids: list[str]) -> None: ...
 
@@ -107,7 +131,7 @@ class KeywordSearchProvider(Protocol):
         self,
         query: str,
         top_k: int = 10,
-        filter_metadata: dict[str, str | int | float | bool] | None = None,
+        filter_metadata: MetadataFilter | None = None,
     ) -> list[KeywordSearchResult]: ...
 
     async def index(
@@ -116,3 +140,41 @@ class KeywordSearchProvider(Protocol):
         text: str,
         metadata: dict[str, str | int | float | bool],
     ) -> None: ...
+
+
+@dataclass
+class HybridSearchResult:
+    chunk_id: str
+    score: float  # fused RRF score
+    text: str
+    metadata: dict[str, str | int | float | bool] = field(default_factory=dict)
+    semantic_rank: int | None = None
+    keyword_rank: int | None = None
+
+
+@runtime_checkable
+class HybridSearchProvider(Protocol):
+    async def search(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        top_k: int = 10,
+        *,
+        semantic_top_k: int = 20,
+        keyword_top_k: int = 20,
+        rrf_k: int = 60,
+        filter_metadata: MetadataFilter | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> list[HybridSearchResult]: ...
+
+
+# Input for warm-up inference at startup (see app.services.warmup).
+WARMUP_TEXT = "How do I reset my device to factory settings?"
+
+
+@runtime_checkable
+class WarmableProvider(Protocol):
+    """Optional: providers with local models load them and run one inference."""
+
+    async def warmup(self) -> None: ...
@@ -0,0 +1,44 @@
+"""Micro-batching wrapper that coalesces concurrent query embeddings."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from app.core.batching import MicroBatcher
+from app.providers.base import EmbeddingProvider
+
+
+class BatchingEmbeddingProvider:
+    """Runs concurrent ``embed_query`` calls as one ``embed_texts`` call.
+
+    ``embed_texts`` is passed straight through; ingestion already batches.
+    """
+
+    def __init__(
+        self,
+        inner: EmbeddingProvider,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        self._inner = inner
+        self._batcher: MicroBatcher[str, np.ndarray] = MicroBatcher(
+            inner.embed_texts,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            name="embedding",
+        )
+
+    @property
+    def dimension(self) -> int:
+        return self._inner.dimension
+
+    async def embed_texts(self, texts: list[str]) -> np.ndarray:
+        return await self._inner.embed_texts(texts)
+
+    async def embed_query(self, text: str) -> np.ndarray:
+        return await self._batcher.submit(text)
+
+    async def warmup(self) -> None:
+        warmup = getattr(self._inner, "warmup", None)
+        if warmup is not None:
+            await warmup()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import litellm
+import numpy as np
 
 
 class LiteLLMEmbeddingProvider:
@@ -15,14 +16,14 @@ class LiteLLMEmbeddingProvider:
     def dimension(self) -> int:
         return self._dimension
 
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    async def embed_texts(self, texts: list[str]) -> np.ndarray:
         response = await litellm.aembedding(
             model=self._model,
             input=texts,
             api_key=self._api_key,
         )
-        return [item["embedding"] for item in response.data]
+        return np.array([item["embedding"] for item in response.data], dtype=np.float32)
 
-    async def embed_query(self, text: str) -> list[float]:
+    async def embed_query(self, text: str) -> np.ndarray:
         results = await self.embed_texts([text])
         return results[0]
@@ -0,0 +1,66 @@
+"""Int8-quantized ONNX Runtime embedding provider (CPU deployments)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+
+from app.providers.base import WARMUP_TEXT
+from app.providers.onnx_models import OnnxModel, export_quantized
+
+
+class OnnxEmbeddingProvider:
+    """Drop-in for SentenceTransformerEmbeddingProvider backed by onnxruntime.
+
+    The model is exported and quantized on first use (cached on disk), then
+    pooled and L2-normalized the way sentence-transformers does.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        dimension: int = 384,
+        cache_dir: str = ".cache/onnx",
+        intra_op_threads: int = 0,
+    ):
+        self._model_name = model_name
+        self._dimension = dimension
+        self._cache_dir = cache_dir
+        self._intra_op_threads = intra_op_threads
+        self._model: OnnxModel | None = None
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def _get_model(self) -> OnnxModel:
+        if self._model is None:
+            name = self._model_name
+            if "/" not in name:
+                name = f"sentence-transformers/{name}"
+            model_dir = export_quantized(name, "feature-extraction", self._cache_dir)
+            self._model = OnnxModel(model_dir, intra_op_threads=self._intra_op_threads)
+        return self._model
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        model = self._get_model()
+        hidden, mask = model.run(texts)
+        if model.pooling == "cls":
+            pooled = hidden[:, 0]
+        else:
+            weights = mask[..., None].astype(hidden.dtype)
+            pooled = (hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.clip(norms, 1e-12, None)).astype(np.float32, copy=False)
+
+    async def embed_texts(self, texts: list[str]) -> np.ndarray:
+        return await asyncio.to_thread(self._encode, texts)
+
+    async def embed_query(self, text: str) -> np.ndarray:
+        results = await self.embed_texts([text])
+        return results[0]
+
+    async def warmup(self) -> None:
+        """Export/load the model and run one inference."""
+        await self.embed_texts([WARMUP_TEXT])
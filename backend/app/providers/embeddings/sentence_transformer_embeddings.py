@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache
+
+import numpy as np
+
+from app.providers.base import WARMUP_TEXT
 
 
 class SentenceTransformerEmbeddingProvider:
@@ -23,11 +26,18 @@ class SentenceTransformerEmbeddingProvider:
             self._model = SentenceTransformer(self._model_name)
         return self._model
 
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
-        model = self._get_model()
-        embeddings = await asyncio.to_thread(model.encode, texts, normalize_embeddings=True)
-        return embeddings.tolist()
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        embeddings = self._get_model().encode(texts, normalize_embeddings=True)
+        return embeddings.astype(np.float32, copy=False)
 
-    async def embed_query(self, text: str) -> list[float]:
+    async def embed_texts(self, texts: list[str]) -> np.ndarray:
+        # Load inside the worker thread so a cold model never blocks the event loop.
+        return await asyncio.to_thread(self._encode, texts)
+
+    async def embed_query(self, text: str) -> np.ndarray:
         results = await self.embed_texts([text])
         return results[0]
+
+    async def warmup(self) -> None:
+        """Load the model and run one inference."""
+        await self.embed_texts([WARMUP_TEXT])
@@ -0,0 +1,146 @@
+"""Single-statement hybrid search: pgvector + tsvector rankings fused with RRF in SQL."""
+
+from __future__ import annotations
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.repositories.chunk_repo import (
+    apply_ann_search_params,
+    binary_ef_search,
+    chunk_filter_sql,
+    semantic_candidates_sql,
+)
+from app.providers.base import HybridSearchResult, MetadataFilter
+
+_HYBRID_SQL = """
+WITH semantic_candidates AS (
+    {semantic_candidates}
+),
+semantic AS (
+    SELECT id, ROW_NUMBER() OVER (ORDER BY distance) AS rank
+    FROM semantic_candidates
+),
+keyword_candidates AS (
+    SELECT id, ts_rank(tsv, plainto_tsquery('english', :query)) AS rank_score
+    FROM document_chunks
+    WHERE tsv @@ plainto_tsquery('english', :query){keyword_filter}
+    ORDER BY rank_score DESC
+    LIMIT :keyword_top_k
+),
+keyword AS (
+    SELECT id, ROW_NUMBER() OVER (ORDER BY rank_score DESC) AS rank
+    FROM keyword_candidates
+),
+fused AS (
+    SELECT
+        COALESCE(semantic.id, keyword.id) AS id,
+        COALESCE(1.0 / (:rrf_k + semantic.rank), 0.0)
+            + COALESCE(1.0 / (:rrf_k + keyword.rank), 0.0) AS rrf_score,
+        semantic.rank AS semantic_rank,
+        keyword.rank AS keyword_rank
+    FROM semantic
+    FULL OUTER JOIN keyword ON semantic.id = keyword.id
+    ORDER BY rrf_score DESC
+    LIMIT :top_k
+)
+SELECT CAST(c.id AS text), c.text, c.metadata, fused.rrf_score,
+       fused.semantic_rank, fused.keyword_rank
+FROM fused
+JOIN document_chunks c ON c.id = fused.id
+ORDER BY fused.rrf_score DESC
+"""
+
+
+class PostgresHybridSearchProvider:
+    """Runs semantic and keyword retrieval plus RRF in one round trip.
+
+    Only the fused top-N rows carry chunk text back to the application, and a
+    single pooled connection is used per query instead of one per ranking.
+    ``filter_metadata`` restricts both rankings in SQL.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        ef_search: int | None = None,
+        probes: int | None = None,
+        vector_type: str = "vector",
+        search_mode: str = "ann",
+        dimension: int = 384,
+        binary_oversample: int = 8,
+        iterative_scan: str | None = None,
+    ):
+        self._session_factory = session_factory
+        self._ef_search = ef_search
+        self._probes = probes
+        self._iterative_scan = iterative_scan
+        self._vector_type = vector_type
+        self._binary = search_mode == "binary"
+        self._binary_oversample = binary_oversample
+        self._binary_dimension = dimension if self._binary else None
+        self._sql = self._build_sql()
+
+    def _build_sql(self, filter_sql: str = "") -> str:
+        # The query vector must be cast to the column type for the index to apply.
+        return _HYBRID_SQL.format(
+            semantic_candidates=semantic_candidates_sql(
+                self._vector_type,
+                binary_dimension=self._binary_dimension,
+                limit_param="semantic_top_k",
+                filter_sql=filter_sql,
+            ),
+            keyword_filter=filter_sql,
+        )
+
+    async def search(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        top_k: int = 10,
+        *,
+        semantic_top_k: int = 20,
+        keyword_top_k: int = 20,
+        rrf_k: int = 60,
+        filter_metadata: MetadataFilter | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> list[HybridSearchResult]:
+        """Fused results; ``ef_search``/``probes`` override the provider defaults."""
+        filter_sql, filter_params = chunk_filter_sql(filter_metadata)
+        sql = self._build_sql(filter_sql) if filter_sql else self._sql
+        params = {
+            "embedding": query_embedding,
+            "query": query,
+            "semantic_top_k": semantic_top_k,
+            "keyword_top_k": keyword_top_k,
+            "rrf_k": rrf_k,
+            "top_k": top_k,
+            **filter_params,
+        }
+        if ef_search is None:
+            ef_search = self._ef_search
+        if self._binary:
+            params["candidates"] = semantic_top_k * self._binary_oversample
+            ef_search = binary_ef_search(ef_search, params["candidates"])
+        async with self._session_factory() as session:
+            await apply_ann_search_params(
+                session,
+                ef_search=ef_search,
+                probes=probes if probes is not None else self._probes,
+                iterative_scan=self._iterative_scan if filter_sql else None,
+            )
+            result = await session.execute(text(sql), params)
+            rows = result.fetchall()
+            return [
+                HybridSearchResult(
+                    chunk_id=str(row[0]),
+                    text=row[1],
+                    metadata=row[2] or {},
+                    score=float(row[3]),
+                    semantic_rank=row[4],
+                    keyword_rank=row[5],
+                )
+                for row in rows
+            ]
@@ -0,0 +1,33 @@
+"""Helpers for on-disk indexes shared by every worker on a host.
+
+Writers serialize on an exclusive ``flock`` and publish by atomically
+replacing a file; readers compare ``file_version`` on each query (one
+``stat``) and reload when it changes.
+"""
+
+from __future__ import annotations
+
+import fcntl
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+
+@contextmanager
+def exclusive_lock(directory: Path) -> Iterator[None]:
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def file_version(path: Path) -> tuple[int, int] | None:
+    """Identity of the current file; ``os.replace`` always yields a new inode."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
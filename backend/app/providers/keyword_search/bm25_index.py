@@ -0,0 +1,244 @@
+"""Okapi BM25 inverted index in flat NumPy arrays with MaxScore top-k search.
+
+Postings are stored term-major (CSR): ``offsets[t]:offsets[t + 1]`` slices
+``doc_ids`` (ascending) and ``tfs`` for term ``t``. Per-posting BM25 impacts
+and each term's maximum impact are derived on load, so a query is a few
+array slices and lookups with no per-document Python work.
+
+Unlike ``plainto_tsquery`` every query term is optional (OR semantics), and
+MaxScore avoids scoring the long posting lists of common terms in full:
+terms are ordered by their impact upper bound, and only documents that
+contain one of the "essential" (high-bound) terms are candidates. The
+remaining terms are probed for those candidates only, and the essential set
+grows until the k-th best candidate outscores anything the non-essential
+terms alone could reach. Results are exact.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+K1 = 1.2
+B = 0.75
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Postgres' english stopword list, abridged to the words that matter for support queries.
+STOPWORDS = frozenset(
+    """a about above after again against all am an and any are as at be because been
+    before being below between both but by can could did do does doing down during each
+    few for from further had has have having he her here hers herself him himself his how
+    i if in into is it its itself just me more most my myself no nor not now of off on
+    once only or other our ours ourselves out over own same she should so some such than
+    that the their theirs them themselves then there these they this those through to too
+    under until up very was we were what when where which while who whom why will with
+    would you your yours yourself yourselves""".split()
+)
+
+
+@lru_cache(maxsize=65536)
+def _stem(token: str) -> str:
+    """Light suffix stripping (plurals, -ing, -ed); applied to queries and documents alike."""
+    if len(token) <= 3 or token.isdigit():
+        return token
+    if token.endswith("ies") and len(token) > 4:
+        return token[:-3] + "y"
+    if token.endswith(("sses", "ches", "shes", "xes", "zes")):
+        return token[:-2]
+    if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    if token.endswith("ing") and len(token) > 5:
+        return token[:-3]
+    if token.endswith("ed") and len(token) > 4:
+        return token[:-2]
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    return [_stem(t) for t in _TOKEN.findall(text.lower()) if t not in STOPWORDS]
+
+
+class Bm25Index:
+    def __init__(
+        self,
+        chunk_ids: np.ndarray,
+        doc_lengths: np.ndarray,
+        terms: np.ndarray,
+        offsets: np.ndarray,
+        doc_ids: np.ndarray,
+        tfs: np.ndarray,
+    ):
+        self.chunk_ids = chunk_ids
+        self.doc_lengths = doc_lengths
+        self.terms = terms
+        self.offsets = offsets
+        self.doc_ids = doc_ids
+        self.tfs = tfs
+        self._term_ids = {str(t): i for i, t in enumerate(terms)}
+
+        n_docs = len(chunk_ids)
+        if n_docs:
+            df = np.diff(offsets).astype(np.float32)
+            idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+            lengths = doc_lengths[doc_ids].astype(np.float32)
+            norm = K1 * (1 - B + B * lengths / max(float(doc_lengths.mean()), 1.0))
+            tf = tfs.astype(np.float32)
+            term_of_posting = np.repeat(np.arange(len(terms)), np.diff(offsets))
+            self.impacts = idf[term_of_posting] * tf * (K1 + 1) / (tf + norm)
+            self.max_impacts = np.maximum.reduceat(self.impacts, offsets[:-1])
+        else:
+            self.impacts = np.empty(0, dtype=np.float32)
+            self.max_impacts = np.empty(0, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.chunk_ids)
+
+    @classmethod
+    def empty(cls) -> Bm25Index:
+        return cls(
+            chunk_ids=np.empty(0, dtype="<U36"),
+            doc_lengths=np.empty(0, dtype=np.int32),
+            terms=np.empty(0, dtype="<U1"),
+            offsets=np.zeros(1, dtype=np.int64),
+            doc_ids=np.empty(0, dtype=np.int32),
+            tfs=np.empty(0, dtype=np.uint16),
+        )
+
+    # -- persistence -----------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                chunk_ids=self.chunk_ids,
+                doc_lengths=self.doc_lengths,
+                terms=self.terms,
+                offsets=self.offsets,
+                doc_ids=self.doc_ids,
+                tfs=self.tfs,
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> Bm25Index:
+        with np.load(path) as data:
+            return cls(**{name: data[name] for name in data.files})
+
+    # -- updates ---------------------------------------------------------
+
+    def updated(
+        self,
+        add_ids: list[str] | None = None,
+        add_texts: list[str] | None = None,
+        delete_ids: list[str] | None = None,
+    ) -> Bm25Index:
+        """A new index with ``delete_ids`` removed and the given documents added or replaced."""
+        add_ids, add_texts = add_ids or [], add_texts or []
+        removed = set(delete_ids or []) | set(add_ids)
+        keep = ~np.isin(self.chunk_ids, list(removed)) if removed else np.ones(len(self), bool)
+        new_doc = np.cumsum(keep) - 1
+
+        term_of_posting = np.repeat(np.arange(len(self.terms)), np.diff(self.offsets))
+        kept = keep[self.doc_ids]
+        post_terms = [term_of_posting[kept]]
+        post_docs = [new_doc[self.doc_ids[kept]].astype(np.int32)]
+        post_tfs = [self.tfs[kept]]
+
+        vocab = list(self.terms.tolist())
+        term_ids = dict(self._term_ids)
+        n_kept = int(keep.sum())
+        lengths = [self.doc_lengths[keep]]
+        added_terms, added_docs, added_tfs, added_lengths = [], [], [], []
+        for offset, text in enumerate(add_texts):
+            tokens = tokenize(text)
+            added_lengths.append(len(tokens))
+            for term, count in Counter(tokens).items():
+                if term not in term_ids:
+                    term_ids[term] = len(vocab)
+                    vocab.append(term)
+                added_terms.append(term_ids[term])
+                added_docs.append(n_kept + offset)
+                added_tfs.append(min(count, np.iinfo(np.uint16).max))
+        post_terms.append(np.array(added_terms, dtype=np.int64))
+        post_docs.append(np.array(added_docs, dtype=np.int32))
+        post_tfs.append(np.array(added_tfs, dtype=np.uint16))
+        lengths.append(np.array(added_lengths, dtype=np.int32))
+
+        terms_all = np.concatenate(post_terms)
+        docs_all = np.concatenate(post_docs)
+        tfs_all = np.concatenate(post_tfs)
+        order = np.lexsort((docs_all, terms_all))
+        terms_all, docs_all, tfs_all = terms_all[order], docs_all[order], tfs_all[order]
+
+        # Drop terms whose every posting was deleted, renumbering the rest.
+        counts = np.bincount(terms_all, minlength=len(vocab))
+        live = counts > 0
+        vocab_array = np.array(vocab, dtype=f"<U{max((len(t) for t in vocab), default=1)}")
+        offsets = np.concatenate([[0], np.cumsum(counts[live])]).astype(np.int64)
+
+        return Bm25Index(
+            chunk_ids=np.concatenate(
+                [self.chunk_ids[keep], np.array(add_ids, dtype="<U36")]
+            ).astype("<U36"),
+            doc_lengths=np.concatenate(lengths).astype(np.int32),
+            terms=vocab_array[live],
+            offsets=offsets,
+            doc_ids=docs_all,
+            tfs=tfs_all,
+        )
+
+    # -- search ----------------------------------------------------------
+
+    def _accumulate(self, term_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Union of the terms' postings with summed impacts."""
+        slices = [slice(self.offsets[t], self.offsets[t + 1]) for t in term_ids]
+        docs = np.concatenate([self.doc_ids[s] for s in slices])
+        impacts = np.concatenate([self.impacts[s] for s in slices])
+        candidates, inverse = np.unique(docs, return_inverse=True)
+        return candidates, np.bincount(inverse, weights=impacts).astype(np.float32)
+
+    def _probe(self, term_id: int, candidates: np.ndarray) -> np.ndarray:
+        """The term's impact for each candidate document (0 where absent)."""
+        start, end = self.offsets[term_id], self.offsets[term_id + 1]
+        postings = self.doc_ids[start:end]
+        pos = np.minimum(np.searchsorted(postings, candidates), len(postings) - 1)
+        return np.where(postings[pos] == candidates, self.impacts[start + pos], 0.0)
+
+    def search(self, query: str, top_k: int = 10) -> list[tuple[str, float]]:
+        term_ids = np.array(
+            sorted({self._term_ids[t] for t in tokenize(query) if t in self._term_ids}),
+            dtype=np.int64,
+        )
+        if not len(term_ids) or top_k <= 0:
+            return []
+        order = np.argsort(self.max_impacts[term_ids])
+        term_ids = term_ids[order]
+        bound = np.cumsum(self.max_impacts[term_ids])  # bound[i]: best score from terms 0..i
+
+        split = len(term_ids) - 1  # term_ids[split:] are essential
+        while True:
+            candidates, scores = self._accumulate(term_ids[split:])
+            for j in range(split - 1, -1, -1):
+                if len(scores) > top_k:
+                    # Scores only grow, so the current k-th best is a lower bound
+                    # on the final one; drop candidates that can no longer reach it.
+                    kth = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+                    alive = scores + bound[j] >= kth
+                    candidates, scores = candidates[alive], scores[alive]
+                scores += self._probe(term_ids[j], candidates)
+            if split == 0:
+                break
+            if len(scores) >= top_k:
+                kth = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+                if kth >= bound[split - 1]:
+                    break  # no document outside the candidates can enter the top k
+            split -= 1
+
+        k = min(top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(str(self.chunk_ids[candidates[i]]), float(scores[i])) for i in top]
@@ -0,0 +1,114 @@
+"""In-process BM25 keyword search over an index file shared by the host's workers."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.providers.base import KeywordSearchResult, MetadataFilter
+from app.providers.index_files import exclusive_lock, file_version
+from app.providers.keyword_search.bm25_index import Bm25Index
+
+log = structlog.get_logger()
+
+_INDEX_FILE = "bm25.npz"
+
+
+class Bm25KeywordSearchProvider:
+    """Drop-in for PostgresFTSProvider backed by an in-memory ``Bm25Index``.
+
+    Results carry chunk ids and scores only; the pipeline hydrates texts for
+    the fused top-N. Searches run inline on the event loop since they take
+    microseconds. Ingestion updates the index incrementally; every worker
+    reloads it in a thread when the file on disk is replaced, since loading
+    recomputes every posting's impact.
+    """
+
+    def __init__(self, index_path: str):
+        self._dir = Path(index_path)
+        self._path = self._dir / _INDEX_FILE
+        self._index = Bm25Index.empty()
+        self._version: tuple[int, int] | None = None
+        self._reload_lock = asyncio.Lock()
+
+    def _current(self) -> Bm25Index:
+        version = file_version(self._path)
+        if version is not None and version != self._version:
+            self._index = Bm25Index.load(self._path)
+            self._version = version
+        return self._index
+
+    async def _load(self) -> Bm25Index:
+        """The current index; only a replaced file costs more than a ``stat``."""
+        version = file_version(self._path)
+        if version is None or version == self._version:
+            return self._index
+        async with self._reload_lock:  # one reload per worker, not one per waiting search
+            return await asyncio.to_thread(self._current)
+
+    async def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        filter_metadata: MetadataFilter | None = None,
+    ) -> list[KeywordSearchResult]:
+        if filter_metadata:
+            # The index holds no metadata; the pipeline applies filters when hydrating texts.
+            log.debug("search_filters_deferred", provider="bm25")
+        return [
+            KeywordSearchResult(chunk_id=chunk_id, score=score, text="")
+            for chunk_id, score in (await self._load()).search(query, top_k)
+        ]
+
+    async def warmup(self) -> None:
+        await asyncio.to_thread(self._current)
+
+    # -- writing ---------------------------------------------------------
+
+    def _publish(self, index: Bm25Index) -> None:
+        staging = self._dir / f".{_INDEX_FILE}.tmp"
+        index.save(staging)
+        os.replace(staging, self._path)
+        log.info("bm25_index_published", documents=len(index), terms=len(index.terms))
+
+    def _apply(
+        self, add_ids: list[str], add_texts: list[str], delete_ids: list[str]
+    ) -> None:
+        with exclusive_lock(self._dir):
+            self._publish(self._current().updated(add_ids, add_texts, delete_ids))
+
+    async def index(
+        self,
+        chunk_id: str,
+        text: str,
+        metadata: dict[str, str | int | float | bool],
+    ) -> None:
+        await self.add_documents([chunk_id], [text])
+
+    async def add_documents(self, chunk_ids: list[str], texts: list[str]) -> None:
+        """Add or replace documents in one index rewrite."""
+        await asyncio.to_thread(self._apply, chunk_ids, texts, [])
+
+    async def delete(self, chunk_ids: list[str]) -> None:
+        await asyncio.to_thread(self._apply, [], [], chunk_ids)
+
+    async def rebuild(self, session_factory: async_sessionmaker[AsyncSession]) -> int:
+        """Replace the index with every chunk in ``document_chunks``."""
+        async with session_factory() as session:
+            result = await session.execute(
+                text("SELECT CAST(id AS text), text FROM document_chunks")
+            )
+            rows = result.fetchall()
+
+        def build() -> None:
+            index = Bm25Index.empty().updated([r[0] for r in rows], [r[1] for r in rows])
+            with exclusive_lock(self._dir):
+                self._publish(index)
+
+        await asyncio.to_thread(build)
+        return len(rows)
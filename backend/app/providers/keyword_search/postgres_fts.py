@@ -5,7 +5,8 @@ from __future__ import annotations
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.providers.base import KeywordSearchResult
+from app.db.repositories.chunk_repo import chunk_filter_sql
+from app.providers.base import KeywordSearchResult, MetadataFilter
 
 
 class PostgresFTSProvider:
@@ -16,19 +17,20 @@ class PostgresFTSProvider:
         self,
         query: str,
         top_k: int = 10,
-        filter_metadata: dict[str, str | int | float | bool] | None = None,
+        filter_metadata: MetadataFilter | None = None,
     ) -> list[KeywordSearchResult]:
+        filter_sql, filter_params = chunk_filter_sql(filter_metadata)
         async with self._session_factory() as session:
             result = await session.execute(
                 text(
                     "SELECT CAST(id AS text), text, metadata,"
                     " ts_rank(tsv, plainto_tsquery('english', :query)) AS score"
                     " FROM document_chunks"
-                    " WHERE tsv @@ plainto_tsquery('english', :query)"
+                    f" WHERE tsv @@ plainto_tsquery('english', :query){filter_sql}"
                     " ORDER BY score DESC"
                     " LIMIT :top_k"
                 ),
-                {"query": query, "top_k": top_k},
+                {"query": query, "top_k": top_k, **filter_params},
             )
             rows = result.fetchall()
             return [
@@ -47,13 +49,4 @@ class PostgresFTSProvider:
         text_content: str,
         metadata: dict[str, str | int | float | bool],
     ) -> None:
-        async with self._session_factory() as session:
-            await session.execute(
-                text("""
-                    UPDATE document_chunks
-                    SET tsv = to_tsvector('english', :text_content)
-                    WHERE id = :chunk_id
-                """),
-                {"chunk_id": chunk_id, "text_content": text_content},
-            )
-            await session.commit()
+        """No-op: ``tsv`` is a generated column, indexed whenever a chunk is written."""
@@ -0,0 +1,143 @@
+"""ONNX export with int8 dynamic quantization, cached on disk.
+
+Requires the ``onnx`` extra (optimum[onnxruntime]). The first process to need
+a model exports it into a temporary directory and renames it into place, so
+concurrent workers never load a half-written artifact.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+log = structlog.get_logger()
+
+QUANTIZED_FILE = "model_quantized.onnx"
+_POOLING_FILE = "pooling.json"
+
+
+def _artifact_dir(cache_dir: str, model_name: str) -> Path:
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "--", model_name)
+    return Path(cache_dir) / f"{slug}-int8"
+
+
+def _quantization_config():
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+    return AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+
+
+def _pooling_config(model_name: str) -> dict[str, Any]:
+    """sentence-transformers pooling mode and max sequence length (mean, 256 if absent)."""
+    from huggingface_hub import hf_hub_download
+
+    config: dict[str, Any] = {"mode": "mean", "max_seq_length": 256}
+    try:
+        pooling = json.loads(Path(hf_hub_download(model_name, "1_Pooling/config.json")).read_text())
+        if pooling.get("pooling_mode_cls_token"):
+            config["mode"] = "cls"
+        sbert = json.loads(
+            Path(hf_hub_download(model_name, "sentence_bert_config.json")).read_text()
+        )
+        config["max_seq_length"] = sbert.get("max_seq_length", config["max_seq_length"])
+    except Exception as e:
+        log.warning("onnx_pooling_config_missing", model=model_name, error=str(e))
+    return config
+
+
+def export_quantized(model_name: str, task: str, cache_dir: str) -> Path:
+    """Return the directory holding the int8 ONNX model and tokenizer, exporting if needed.
+
+    ``task`` is ``feature-extraction`` (embeddings) or ``text-classification``
+    (cross-encoder).
+    """
+    target = _artifact_dir(cache_dir, model_name)
+    if (target / QUANTIZED_FILE).exists():
+        return target
+
+    from optimum.onnxruntime import (
+        ORTModelForFeatureExtraction,
+        ORTModelForSequenceClassification,
+        ORTQuantizer,
+    )
+    from transformers import AutoTokenizer
+
+    model_cls = (
+        ORTModelForFeatureExtraction
+        if task == "feature-extraction"
+        else ORTModelForSequenceClassification
+    )
+    log.info("onnx_export_started", model=model_name, task=task)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".export-", dir=target.parent))
+    try:
+        model_cls.from_pretrained(model_name, export=True).save_pretrained(staging)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(staging)
+        quantizer = ORTQuantizer.from_pretrained(staging)
+        quantizer.quantize(save_dir=staging, quantization_config=_quantization_config())
+        (staging / "model.onnx").unlink(missing_ok=True)  # fp32 graph no longer needed
+        if task == "feature-extraction":
+            (staging / _POOLING_FILE).write_text(json.dumps(_pooling_config(model_name)))
+        try:
+            os.rename(staging, target)
+        except OSError:
+            # Another worker finished first; use its artifact.
+            shutil.rmtree(staging, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    log.info("onnx_export_finished", model=model_name, path=str(target))
+    return target
+
+
+class OnnxModel:
+    """Tokenizer plus an onnxruntime session over a quantized export."""
+
+    def __init__(self, model_dir: Path, intra_op_threads: int = 0):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        self.session = ort.InferenceSession(
+            str(model_dir / QUANTIZED_FILE),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self._input_names = {i.name for i in self.session.get_inputs()}
+        pooling_path = model_dir / _POOLING_FILE
+        pooling = json.loads(pooling_path.read_text()) if pooling_path.exists() else {}
+        self.pooling: str = pooling.get("mode", "mean")
+        self.max_length: int = pooling.get("max_seq_length") or self._model_max_length(model_dir)
+
+    def _model_max_length(self, model_dir: Path) -> int:
+        if self.tokenizer.model_max_length < 1_000_000:  # unset is a huge sentinel
+            return self.tokenizer.model_max_length
+        config = json.loads((model_dir / "config.json").read_text())
+        return config.get("max_position_embeddings", 512)
+
+    def run(self, *texts: list[str]) -> tuple[Any, Any]:
+        """Tokenize (single texts or text pairs) and return ``(first_output, attention_mask)``."""
+        encoded = self.tokenizer(
+            *texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="np",
+        )
+        feeds = {k: v for k, v in encoded.items() if k in self._input_names}
+        outputs = self.session.run(None, feeds)
+        return outputs[0], encoded["attention_mask"]
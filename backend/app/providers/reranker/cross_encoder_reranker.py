@@ -4,14 +4,46 @@ from __future__ import annotations
 
 import asyncio
 import math
+from concurrent.futures import ThreadPoolExecutor
 
-from app.providers.base import RerankResult
+from app.core.batching import MicroBatcher
+from app.core.metrics import gauge
+from app.providers.base import WARMUP_TEXT, RerankResult
 
 
 class CrossEncoderReranker:
-    def __init__(self, model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"):
+    """Cross-encoder scoring on a dedicated inference executor.
+
+    With ``max_batch_size`` set, (query, document) pairs from concurrent
+    requests are merged into bounded batches; while the executor is busy new
+    pairs keep queueing, so each ``model.predict`` call gets a fuller batch.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
+        max_batch_size: int | None = None,
+        max_wait_ms: float = 5.0,
+        workers: int = 1,
+    ):
         self._model_name = model_name
         self._model = None
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rerank")
+        self._batcher: MicroBatcher[tuple[str, str], float] | None = None
+        if max_batch_size:
+            self._batcher = MicroBatcher(
+                self._score_pairs,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+                max_concurrent_batches=workers,
+                name="rerank",
+            )
+            batcher = self._batcher
+            gauge(
+                "rerank_queue_depth",
+                "(query, document) pairs waiting for a rerank batch.",
+                lambda: batcher.queue_depth,
+            )
 
     def _get_model(self):
         if self._model is None:
@@ -20,6 +52,20 @@ class CrossEncoderReranker:
             self._model = CrossEncoder(self._model_name)
         return self._model
 
+    def _predict(self, pairs: list[tuple[str, str]]) -> list[float]:
+        scores = self._get_model().predict(
+            pairs, batch_size=len(pairs), show_progress_bar=False
+        )
+        return [float(s) for s in scores]
+
+    async def _score_pairs(self, pairs: list[tuple[str, str]]) -> list[float]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._predict, pairs)
+
+    async def warmup(self) -> None:
+        """Load the model on the inference executor and score one pair."""
+        await self._score_pairs([(WARMUP_TEXT, WARMUP_TEXT)])
+
     async def rerank(
         self,
         query: str,
@@ -29,9 +75,11 @@ class CrossEncoderReranker:
         if not documents:
             return []
 
-        model = self._get_model()
-        pairs = [[query, doc] for doc in documents]
-        scores = await asyncio.to_thread(model.predict, pairs)
+        pairs = [(query, doc) for doc in documents]
+        if self._batcher is not None:
+            scores = await asyncio.gather(*[self._batcher.submit(p) for p in pairs])
+        else:
+            scores = await self._score_pairs(pairs)
 
         results = [
             RerankResult(
@@ -0,0 +1,45 @@
+"""Int8-quantized ONNX Runtime cross-encoder reranker (CPU deployments)."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from app.providers.onnx_models import OnnxModel, export_quantized
+from app.providers.reranker.cross_encoder_reranker import CrossEncoderReranker
+
+
+class OnnxCrossEncoderReranker(CrossEncoderReranker):
+    """CrossEncoderReranker with ``model.predict`` served by onnxruntime.
+
+    Scheduling (dedicated executor, cross-request batching) is inherited.
+    Scores match ``CrossEncoder.predict``, which applies a sigmoid for
+    single-label models.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
+        max_batch_size: int | None = None,
+        max_wait_ms: float = 5.0,
+        workers: int = 1,
+        cache_dir: str = ".cache/onnx",
+        intra_op_threads: int = 0,
+    ):
+        super().__init__(model_name, max_batch_size, max_wait_ms, workers)
+        self._cache_dir = cache_dir
+        self._intra_op_threads = intra_op_threads
+
+    def _get_model(self) -> OnnxModel:
+        if self._model is None:
+            model_dir = export_quantized(self._model_name, "text-classification", self._cache_dir)
+            self._model = OnnxModel(model_dir, intra_op_threads=self._intra_op_threads)
+        return self._model
+
+    def _predict(self, pairs: list[tuple[str, str]]) -> list[float]:
+        model = self._get_model()
+        logits, _ = model.run([q for q, _ in pairs], [d for _, d in pairs])
+        if logits.shape[1] == 1:
+            scores = 1.0 / (1.0 + np.exp(-logits[:, 0]))
+        else:
+            scores = logits.max(axis=1)
+        return [float(s) for s in scores]
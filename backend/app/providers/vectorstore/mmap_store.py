@@ -0,0 +1,273 @@
+"""In-process vector index over a memory-mapped float32 matrix.
+
+For a read-heavy corpus that changes only on ingestion, searching in-process
+avoids a Postgres round trip per query and never ships chunk texts: results
+carry ids and scores only, and the pipeline fetches texts for the fused
+top-N in one batched lookup.
+
+The index directory holds one published generation at a time::
+
+    manifest.json          {"generation": 7, "base": 4, "count": N, "dimension": D,
+                            "tombstones": T}
+    vectors-4.f32          >= N x D float32, L2-normalized, row-major
+    ids-4.u36              >= N chunk ids (fixed-width UTF-32)
+    tombstones-7.npy       T row numbers deleted or superseded since base 4
+
+Every worker maps the same files read-only, so the OS page cache holds a
+single copy per host. Writers (ingestion) serialize on an exclusive file lock.
+An upsert appends its rows past row N of the current base files and a delete
+only records tombstones, so a write costs the size of the change rather than
+of the corpus; the new generation is published by atomically replacing the
+manifest, and readers notice the replaced manifest and remap. Readers only
+map the first N rows, so appending never disturbs a published generation.
+Once tombstones exceed ``_COMPACT_RATIO`` of the rows, the live rows are
+rewritten into a new base (as is ``rebuild``). Search is an exact
+matrix-vector product, which BLAS keeps in the low milliseconds for corpora
+of a few hundred thousand chunks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.providers.base import MetadataFilter, VectorSearchResult
+from app.providers.index_files import exclusive_lock, file_version
+
+log = structlog.get_logger()
+
+_MANIFEST = "manifest.json"
+_ID_DTYPE = np.dtype("<U36")
+# Rewrite the live rows into a new base once this share of rows is tombstoned.
+_COMPACT_RATIO = 0.25
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.clip(norms, 1e-12, None)
+
+
+def _write_rows(path: Path, row: int, rows: np.ndarray) -> None:
+    """Write ``rows`` starting at row ``row``, dropping anything after them.
+
+    Bytes past the published count (left by a writer that died before
+    publishing) are overwritten; rows before it are never touched.
+    """
+    row_bytes = rows.dtype.itemsize * int(np.prod(rows.shape[1:]))
+    with open(path, "r+b" if path.exists() else "wb") as f:
+        f.seek(row * row_bytes)
+        rows.tofile(f)
+        f.truncate()
+
+
+class _Generation:
+    """One published, read-only snapshot of the index."""
+
+    def __init__(self, directory: Path, manifest: dict, version: tuple[int, int]):
+        self.number: int = manifest["generation"]
+        self.base: int = manifest["base"]
+        self.version = version
+        self.count, dimension = manifest["count"], manifest["dimension"]
+        if self.count:
+            self.vectors = np.memmap(
+                directory / f"vectors-{self.base}.f32",
+                dtype=np.float32,
+                mode="r",
+                shape=(self.count, dimension),
+            )
+            self.ids = np.memmap(
+                directory / f"ids-{self.base}.u36", dtype=_ID_DTYPE, mode="r", shape=(self.count,)
+            )
+        else:
+            self.vectors = np.empty((0, dimension), dtype=np.float32)
+            self.ids = np.empty(0, dtype=_ID_DTYPE)
+        if manifest["tombstones"]:
+            self.tombstones = np.load(directory / f"tombstones-{self.number}.npy")
+        else:
+            self.tombstones = np.empty(0, dtype=np.int64)
+
+    @property
+    def live(self) -> int:
+        return self.count - len(self.tombstones)
+
+    def search(self, query: np.ndarray, top_k: int) -> list[tuple[str, float]]:
+        if not self.live:
+            return []
+        scores = self.vectors @ query
+        scores[self.tombstones] = -np.inf
+        top_k = min(top_k, self.live)
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top])]
+        return [(str(self.ids[i]), float(scores[i])) for i in top]
+
+
+class MmapVectorStore:
+    def __init__(self, index_path: str, dimension: int):
+        self._dir = Path(index_path)
+        self._dimension = dimension
+        self._generation: _Generation | None = None
+
+    # -- reading ---------------------------------------------------------
+
+    def _current(self) -> _Generation | None:
+        """The latest published generation, remapped when the manifest changes."""
+        manifest_path = self._dir / _MANIFEST
+        for _ in range(3):
+            version = file_version(manifest_path)
+            if version is None:
+                return None
+            try:
+                if self._generation is None or self._generation.version != version:
+                    manifest = json.loads(manifest_path.read_text())
+                    self._generation = _Generation(self._dir, manifest, version)
+                return self._generation
+            except FileNotFoundError:
+                # A writer published and removed the files between our
+                # manifest read and open; look again.
+                continue
+        return self._generation
+
+    def _search(self, query_embedding: np.ndarray, top_k: int) -> list[tuple[str, float]]:
+        generation = self._current()
+        if generation is None:
+            log.warning("vector_index_missing", path=str(self._dir))
+            return []
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)  # never mutate the caller's
+        return generation.search(query, top_k)
+
+    async def search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 10,
+        filter_metadata: MetadataFilter | None = None,
+        *,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> list[VectorSearchResult]:
+        """Chunk ids and cosine scores; ``text`` is left empty for the caller to hydrate.
+
+        The index holds no metadata, so ``filter_metadata`` is not applied here;
+        the pipeline drops out-of-scope chunks when it hydrates texts. Search is
+        exact, so ``ef_search``/``probes`` do not apply.
+        """
+        if filter_metadata:
+            log.debug("search_filters_deferred", provider="mmap")
+        hits = await asyncio.to_thread(self._search, query_embedding, top_k)
+        return [VectorSearchResult(chunk_id=cid, score=score, text="") for cid, score in hits]
+
+    async def warmup(self) -> None:
+        """Map the index and fault its pages in."""
+        await asyncio.to_thread(self._search, np.ones(self._dimension, dtype=np.float32), 1)
+
+    # -- writing ---------------------------------------------------------
+
+    def _write_manifest(
+        self, previous: _Generation | None, base: int, count: int, tombstones: np.ndarray
+    ) -> int:
+        """Publish a generation over ``count`` rows of base ``base``; caller holds the lock."""
+        number = previous.number + 1 if previous is not None else 1
+        if len(tombstones):
+            np.save(self._dir / f"tombstones-{number}.npy", tombstones)
+        manifest = {
+            "generation": number,
+            "base": base,
+            "count": count,
+            "dimension": self._dimension,
+            "tombstones": len(tombstones),
+        }
+        staging = self._dir / f"{_MANIFEST}.tmp"
+        staging.write_text(json.dumps(manifest))
+        os.replace(staging, self._dir / _MANIFEST)
+        if previous is not None:
+            # Workers still mapping the old files keep them alive until they remap.
+            (self._dir / f"tombstones-{previous.number}.npy").unlink(missing_ok=True)
+            if previous.base != base:
+                (self._dir / f"vectors-{previous.base}.f32").unlink(missing_ok=True)
+                (self._dir / f"ids-{previous.base}.u36").unlink(missing_ok=True)
+        log.info(
+            "vector_index_published",
+            generation=number,
+            count=count - len(tombstones),
+            tombstones=len(tombstones),
+        )
+        return number
+
+    def _publish(self, ids: np.ndarray, vectors: np.ndarray) -> None:
+        """Write ``ids``/``vectors`` as a new base with no tombstones; caller holds the lock."""
+        previous = self._current()
+        base = previous.number + 1 if previous is not None else 1
+        _write_rows(self._dir / f"vectors-{base}.f32", 0, vectors.astype(np.float32))
+        _write_rows(self._dir / f"ids-{base}.u36", 0, ids.astype(_ID_DTYPE))
+        self._write_manifest(previous, base, len(ids), np.empty(0, dtype=np.int64))
+
+    def _apply(self, upserts: dict[str, np.ndarray], deletes: set[str]) -> None:
+        with exclusive_lock(self._dir):
+            generation = self._current()
+            new_ids = np.array(list(upserts), dtype=_ID_DTYPE)
+            new_vectors = np.empty((0, self._dimension), dtype=np.float32)
+            if upserts:
+                new_vectors = _normalize(np.stack(list(upserts.values())).astype(np.float32))
+            if generation is None:
+                self._publish(new_ids, new_vectors)
+                return
+
+            # Replaced and deleted rows become tombstones; replacements are appended.
+            stale = np.flatnonzero(np.isin(generation.ids, list(deletes | upserts.keys())))
+            tombstones = np.union1d(generation.tombstones, stale).astype(np.int64)
+            count = generation.count + len(new_ids)
+            if len(tombstones) > _COMPACT_RATIO * count:
+                keep = np.ones(generation.count, dtype=bool)
+                keep[tombstones] = False
+                self._publish(
+                    np.concatenate([generation.ids[keep], new_ids]),
+                    np.concatenate([generation.vectors[keep], new_vectors]),
+                )
+                return
+            if upserts:
+                base = generation.base
+                _write_rows(self._dir / f"vectors-{base}.f32", generation.count, new_vectors)
+                _write_rows(self._dir / f"ids-{base}.u36", generation.count, new_ids)
+            self._write_manifest(generation, generation.base, count, tombstones)
+
+    async def upsert(
+        self,
+        ids: list[str],
+        embeddings: np.ndarray,
+        texts: list[str],
+        metadatas: list[dict[str, str | int | float | bool]],
+    ) -> None:
+        """Add or replace vectors; texts and metadata stay in Postgres."""
+        await asyncio.to_thread(self._apply, dict(zip(ids, embeddings)), set())
+
+    async def delete(self, ids: list[str]) -> None:
+        await asyncio.to_thread(self._apply, {}, set(ids))
+
+    async def rebuild(self, session_factory: async_sessionmaker[AsyncSession]) -> int:
+        """Replace the index with every embedded chunk in ``document_chunks``."""
+        async with session_factory() as session:
+            result = await session.execute(
+                text(
+                    "SELECT CAST(id AS text), CAST(embedding AS vector)"
+                    " FROM document_chunks WHERE embedding IS NOT NULL"
+                )
+            )
+            rows = result.fetchall()
+
+        def build() -> None:
+            ids = np.array([r[0] for r in rows], dtype="<U36")
+            vectors = np.empty((len(rows), self._dimension), dtype=np.float32)
+            for i, (_, embedding) in enumerate(rows):
+                vectors[i] = embedding.to_numpy()  # decoded by the binary codec
+            with exclusive_lock(self._dir):
+                self._publish(ids, _normalize(vectors))
+
+        await asyncio.to_thread(build)
+        return len(rows)
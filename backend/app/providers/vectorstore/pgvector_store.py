@@ -2,52 +2,118 @@
 
 from __future__ import annotations
 
+import numpy as np
+from pgvector import HalfVector, Vector
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.providers.base import VectorSearchResult
+from app.db.repositories.chunk_repo import (
+    apply_ann_search_params,
+    binary_ef_search,
+    chunk_filter_sql,
+    semantic_candidates_sql,
+)
+from app.providers.base import MetadataFilter, VectorSearchResult
 
 
 class PgVectorStore:
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+    """Nearest-neighbour search over ``document_chunks.embedding``.
+
+    ``search_mode="binary"`` finds ``top_k * binary_oversample`` candidates on
+    the binary-quantized index and rescores them with exact cosine distance;
+    the default ``"ann"`` searches the full-precision HNSW index directly.
+    ``filter_metadata`` is applied inside the index scan, with
+    ``iterative_scan`` so a selective filter still yields ``top_k`` rows.
+
+    Writes are set-based: each statement updates up to ``write_batch_size``
+    rows matched by primary key against a typed ``uuid[]``.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        ef_search: int | None = None,
+        probes: int | None = None,
+        vector_type: str = "vector",
+        search_mode: str = "ann",
+        dimension: int = 384,
+        binary_oversample: int = 8,
+        write_batch_size: int = 1000,
+        iterative_scan: str | None = None,
+    ):
         self._session_factory = session_factory
+        self._ef_search = ef_search
+        self._probes = probes
+        self._iterative_scan = iterative_scan
+        self._vector_type = vector_type  # "vector" or "halfvec", matching the column
+        self._vector_class = HalfVector if vector_type == "halfvec" else Vector
+        self._write_batch_size = write_batch_size
+        self._binary = search_mode == "binary"
+        self._binary_oversample = binary_oversample
+        self._binary_dimension = dimension if self._binary else None
+        self._search_sql = self._build_search_sql()
+
+    def _build_search_sql(self, filter_sql: str = "") -> str:
+        nearest = semantic_candidates_sql(
+            self._vector_type, binary_dimension=self._binary_dimension, filter_sql=filter_sql
+        )
+        # Iterative scans may return rows slightly out of order; re-sort here.
+        return (
+            f"WITH nearest AS ({nearest})"
+            " SELECT CAST(c.id AS text), c.text, c.metadata, 1 - nearest.distance AS score"
+            " FROM nearest JOIN document_chunks c ON c.id = nearest.id"
+            " ORDER BY nearest.distance"
+        )
 
     async def upsert(
         self,
         ids: list[str],
-        embeddings: list[list[float]],
+        embeddings: np.ndarray,
         texts: list[str],
         metadatas: list[dict[str, str | int | float | bool]],
     ) -> None:
+        statement = text(
+            "UPDATE document_chunks AS c SET embedding = v.embedding"
+            f" FROM unnest(CAST(:ids AS uuid[]), CAST(:embeddings AS {self._vector_type}[]))"
+            " AS v(id, embedding)"
+            " WHERE c.id = v.id"
+        )
+        batch = self._write_batch_size
         async with self._session_factory() as session:
-            for id_, emb, txt, meta in zip(ids, embeddings, texts, metadatas):
+            for start in range(0, len(ids), batch):
+                # Wrapped so asyncpg encodes each row as one array element, not a sub-array.
+                vectors = [self._vector_class(e) for e in embeddings[start : start + batch]]
                 await session.execute(
-                    text(
-                        "UPDATE document_chunks SET embedding = CAST(:embedding AS vector) WHERE id = CAST(:id AS uuid)"
-                    ),
-                    {"id": id_, "embedding": str(emb)},
+                    statement, {"ids": ids[start : start + batch], "embeddings": vectors}
                 )
             await session.commit()
 
     async def search(
         self,
-        query_embedding: list[float],
+        query_embedding: np.ndarray,
         top_k: int = 10,
-        filter_metadata: dict[str, str | int | float | bool] | None = None,
+        filter_metadata: MetadataFilter | None = None,
+        *,
+        ef_search: int | None = None,
+        probes: int | None = None,
     ) -> list[VectorSearchResult]:
-        embedding_str = str(query_embedding)
+        """Nearest-neighbour search; ``ef_search``/``probes`` override the store defaults."""
+        filter_sql, filter_params = chunk_filter_sql(filter_metadata)
+        sql = self._build_search_sql(filter_sql) if filter_sql else self._search_sql
+        params = {"embedding": query_embedding, "top_k": top_k, **filter_params}
+        if ef_search is None:
+            ef_search = self._ef_search
+        if self._binary:
+            params["candidates"] = top_k * self._binary_oversample
+            ef_search = binary_ef_search(ef_search, params["candidates"])
         async with self._session_factory() as session:
-            result = await session.execute(
-                text(
-                    "SELECT CAST(id AS text), text, metadata,"
-                    " 1 - (embedding <=> CAST(:embedding AS vector)) AS score"
-                    " FROM document_chunks"
-                    " WHERE embedding IS NOT NULL"
-                    " ORDER BY embedding <=> CAST(:embedding AS vector)"
-                    " LIMIT :top_k"
-                ),
-                {"embedding": embedding_str, "top_k": top_k},
+            await apply_ann_search_params(
+                session,
+                ef_search=ef_search,
+                probes=probes if probes is not None else self._probes,
+                iterative_scan=self._iterative_scan if filter_sql else None,
             )
+            result = await session.execute(text(sql), params)
             rows = result.fetchall()
             return [
                 VectorSearchResult(
@@ -60,11 +126,12 @@ class PgVectorStore:
             ]
 
     async def delete(self, ids: list[str]) -> None:
+        # Comparing the uuid column (not CAST(id AS text)) keeps the primary-key index usable.
+        statement = text(
+            "UPDATE document_chunks SET embedding = NULL WHERE id = ANY(CAST(:ids AS uuid[]))"
+        )
+        batch = self._write_batch_size
         async with self._session_factory() as session:
-            await session.execute(
-                text(
-                    "UPDATE document_chunks SET embedding = NULL WHERE CAST(id AS text) = ANY(:ids)"
-                ),
-                {"ids": ids},
-            )
+            for start in range(0, len(ids), batch):
+                await session.execute(statement, {"ids": ids[start : start + batch]})
             await session.commit()
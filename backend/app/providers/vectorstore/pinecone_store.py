@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from app.providers.base import VectorSearchResult
+import numpy as np
+
+from app.providers.base import MetadataFilter, VectorSearchResult
 
 
 class PineconeStore:
@@ -22,14 +24,14 @@ class PineconeStore:
     async def upsert(
         self,
         ids: list[str],
-        embeddings: list[list[float]],
+        embeddings: np.ndarray,
         texts: list[str],
         metadatas: list[dict[str, str | int | float | bool]],
     ) -> None:
         index = self._get_index()
         vectors = [
             {"id": id_, "values": emb, "metadata": {"text": txt, **meta}}
-            for id_, emb, txt, meta in zip(ids, embeddings, texts, metadatas)
+            for id_, emb, txt, meta in zip(ids, np.asarray(embeddings).tolist(), texts, metadatas)
         ]
         # Pinecone upsert in batches of 100
         for i in range(0, len(vectors), 100):
@@ -37,16 +39,24 @@ class PineconeStore:
 
     async def search(
         self,
-        query_embedding: list[float],
+        query_embedding: np.ndarray,
         top_k: int = 10,
-        filter_metadata: dict[str, str | int | float | bool] | None = None,
+        filter_metadata: MetadataFilter | None = None,
+        *,
+        ef_search: int | None = None,
+        probes: int | None = None,
     ) -> list[VectorSearchResult]:
         index = self._get_index()
+        pinecone_filter = (
+            {k: {"$in": v} if isinstance(v, list) else v for k, v in filter_metadata.items()}
+            if filter_metadata
+            else None
+        )
         results = index.query(
-            vector=query_embedding,
+            vector=np.asarray(query_embedding).tolist(),
             top_k=top_k,
             include_metadata=True,
-            filter=filter_metadata,
+            filter=pinecone_filter,
         )
         return [
             VectorSearchResult(
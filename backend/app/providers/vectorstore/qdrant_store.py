@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from app.providers.base import VectorSearchResult
+import numpy as np
+
+from app.providers.base import MetadataFilter, VectorSearchResult
 
 
 class QdrantStore:
@@ -21,7 +23,7 @@ class QdrantStore:
     async def upsert(
         self,
         ids: list[str],
-        embeddings: list[list[float]],
+        embeddings: np.ndarray,
         texts: list[str],
         metadatas: list[dict[str, str | int | float | bool]],
     ) -> None:
@@ -34,20 +36,23 @@ class QdrantStore:
                 vector=emb,
                 payload={"text": txt, **meta},
             )
-            for id_, emb, txt, meta in zip(ids, embeddings, texts, metadatas)
+            for id_, emb, txt, meta in zip(ids, np.asarray(embeddings).tolist(), texts, metadatas)
         ]
         await client.upsert(collection_name=self._collection, points=points)
 
     async def search(
         self,
-        query_embedding: list[float],
+        query_embedding: np.ndarray,
         top_k: int = 10,
-        filter_metadata: dict[str, str | int | float | bool] | None = None,
+        filter_metadata: MetadataFilter | None = None,
+        *,
+        ef_search: int | None = None,
+        probes: int | None = None,
     ) -> list[VectorSearchResult]:
         client = self._get_client()
         results = await client.search(
             collection_name=self._collection,
-            query_vector=query_embedding,
+            query_vector=np.asarray(query_embedding).tolist(),
             limit=top_k,
         )
         return [
@@ -5,12 +5,28 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+FilterValue = str | int | float | bool
 
 
 class ChatRequest(BaseModel):
     message: str = Field(..., min_length=1, max_length=5000)
     session_id: uuid.UUID | None = None
+    # Restrict retrieval to chunks whose metadata matches every key; a list matches any
+    # of its values. ``document_id`` filters on the owning document.
+    filters: dict[str, FilterValue | list[FilterValue]] | None = None
+
+    @field_validator("filters")
+    @classmethod
+    def _document_ids_are_uuids(
+        cls, filters: dict[str, FilterValue | list[FilterValue]] | None
+    ) -> dict[str, FilterValue | list[FilterValue]] | None:
+        if filters and "document_id" in filters:
+            value = filters["document_id"]
+            for v in value if isinstance(value, list) else [value]:
+                uuid.UUID(str(v))  # ValueError surfaces as a 422
+        return filters
 
 
 class ChatMessageResponse(BaseModel):
@@ -0,0 +1,100 @@
+"""Semantic answer cache — replay generated answers for near-duplicate questions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import Settings
+from app.core.metrics import counter
+from app.db.repositories.answer_cache_repo import AnswerCacheRepository
+
+log = structlog.get_logger()
+
+CACHE_REQUESTS = counter(
+    "answer_cache_requests_total",
+    "Semantic answer cache lookups by result (hit, miss, error).",
+    ("result",),
+)
+
+
+@dataclass
+class CachedAnswer:
+    answer: str
+    confidence_tier: str
+    similarity: float
+    sources: list[dict[str, Any]] = field(default_factory=list)
+
+
+class SemanticAnswerCache:
+    """Answers keyed by query-embedding similarity, stored in Postgres.
+
+    Entries are wiped whenever the corpus changes (see ``invalidate``), so a hit
+    never reflects documents that have since been re-ingested or deleted.
+    Cache failures are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        settings: Settings,
+    ):
+        self._session_factory = session_factory
+        self.settings = settings
+
+    async def lookup(self, query_embedding: np.ndarray) -> CachedAnswer | None:
+        config = self.settings.answer_cache
+        try:
+            async with self._session_factory() as session:
+                nearest = await AnswerCacheRepository(session).find_nearest(
+                    query_embedding, max_age_seconds=config.ttl_seconds
+                )
+        except Exception as e:
+            CACHE_REQUESTS.labels(result="error").inc()
+            log.warning("answer_cache_lookup_failed", error=str(e))
+            return None
+
+        if nearest is None or nearest[1] < config.similarity_threshold:
+            CACHE_REQUESTS.labels(result="miss").inc()
+            return None
+        entry, similarity = nearest
+        CACHE_REQUESTS.labels(result="hit").inc()
+
+        log.info("answer_cache_hit", similarity=similarity, cached_query=entry.query)
+        return CachedAnswer(
+            answer=entry.answer,
+            confidence_tier=entry.confidence_tier,
+            similarity=similarity,
+            sources=entry.sources,
+        )
+
+    async def store(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        answer: str,
+        confidence_tier: str,
+        sources: list[dict[str, Any]],
+    ) -> None:
+        try:
+            async with self._session_factory() as session:
+                await AnswerCacheRepository(session).create(
+                    query=query,
+                    embedding=query_embedding,
+                    answer=answer,
+                    confidence_tier=confidence_tier,
+                    sources=sources,
+                )
+                await session.commit()
+        except Exception as e:
+            log.warning("answer_cache_store_failed", error=str(e))
+
+    @staticmethod
+    async def invalidate(db: AsyncSession) -> None:
+        """Drop every cached answer inside the caller's transaction."""
+        cleared = await AnswerCacheRepository(db).clear()
+        log.info("answer_cache_invalidated", entries=cleared)
@@ -0,0 +1,99 @@
+"""Rolling per-session conversation summary, maintained off the request path."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import datetime
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import Settings
+from app.db.repositories.session_repo import SessionRepository
+from app.providers.base import LLMMessage, LLMProvider
+
+log = structlog.get_logger()
+
+_SUMMARY_INSTRUCTIONS = (
+    "You maintain a running summary of a customer support conversation. "
+    "Merge the new messages into the existing summary. Keep product names, "
+    "models, symptoms, steps already tried and open questions. "
+    "Output ONLY the updated summary, at most a short paragraph."
+)
+
+
+class ConversationSummarizer:
+    """Folds messages that fall out of the recent window into ``ChatSession.metadata_``.
+
+    The summary lives under ``metadata_["summary"]`` with a ``summary_through``
+    cursor (creation time of the last folded message), so every update only
+    reads and summarises messages added since the previous one.
+    """
+
+    def __init__(
+        self,
+        llm: LLMProvider,
+        session_factory: async_sessionmaker[AsyncSession],
+        settings: Settings,
+    ):
+        self.llm = llm
+        self._session_factory = session_factory
+        self.settings = settings
+        self._in_flight: dict[str, asyncio.Task[None]] = {}
+
+    def schedule(self, session_id: str) -> None:
+        """Update the summary in the background; at most one update per session at a time."""
+        if not self.settings.conversation.summarize or session_id in self._in_flight:
+            return
+        task = asyncio.create_task(self._run(session_id))
+        self._in_flight[session_id] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(session_id, None))
+
+    async def _run(self, session_id: str) -> None:
+        try:
+            await self.update(session_id)
+        except Exception as e:
+            log.warning("conversation_summary_failed", session_id=session_id, error=str(e))
+
+    async def update(self, session_id: str) -> None:
+        config = self.settings.conversation
+        async with self._session_factory() as db:
+            repo = SessionRepository(db)
+            session = await repo.get(uuid.UUID(session_id))
+            if not session:
+                return
+            metadata = dict(session.metadata_ or {})
+            cursor = metadata.get("summary_through")
+            pending = await repo.get_messages_after(
+                session.id, datetime.fromisoformat(cursor) if cursor else None
+            )
+            # Messages still inside the recent window are sent verbatim, not summarised
+            folded = pending[: -config.recent_messages or None]
+            to_fold = [m for m in folded if m.role in ("user", "assistant")]
+            if len(to_fold) < config.summary_batch_messages:
+                return
+
+            previous = metadata.get("summary") or "(none yet)"
+            transcript = "\n".join(f"{m.role}: {m.content}" for m in to_fold)
+            response = await self.llm.complete(
+                [
+                    LLMMessage(role="system", content=_SUMMARY_INSTRUCTIONS),
+                    LLMMessage(
+                        role="user",
+                        content=f"Existing summary:\n{previous}\n\nNew messages:\n{transcript}",
+                    ),
+                ],
+                max_tokens=config.summary_max_tokens,
+            )
+
+            metadata["summary"] = response.content.strip()
+            metadata["summary_through"] = folded[-1].created_at.isoformat()
+            metadata["summary_message_count"] = metadata.get("summary_message_count", 0) + len(to_fold)
+            session.metadata_ = metadata
+            await db.commit()
+            log.info(
+                "conversation_summary_updated",
+                session_id=session_id,
+                folded_messages=len(to_fold),
+            )
@@ -0,0 +1,60 @@
+"""Per-turn latency budget with graceful stage degradation."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable
+from typing import TypeVar
+
+import structlog
+
+from app.core.config import LatencyBudgetConfig
+
+log = structlog.get_logger()
+
+T = TypeVar("T")
+
+
+class Deadline:
+    """Bounds each pipeline stage by its own budget and by what is left of the turn.
+
+    A stage that overruns raises ``TimeoutError``; the caller decides how to
+    degrade and records it with :meth:`degrade` so it is reported to the client.
+    """
+
+    def __init__(self, budget: LatencyBudgetConfig, started: float | None = None):
+        self.budget = budget
+        self.started = time.perf_counter() if started is None else started
+        self.degraded: list[str] = []
+
+    def remaining(self) -> float:
+        return self.budget.total_seconds - (time.perf_counter() - self.started)
+
+    def timeout(self, stage_seconds: float) -> float | None:
+        if not self.budget.enabled:
+            return None
+        return max(min(stage_seconds, self.remaining()), 0.0)
+
+    async def run(self, aw: Awaitable[T], stage_seconds: float) -> T:
+        timeout = self.timeout(stage_seconds)
+        if timeout is None:
+            return await aw
+        return await asyncio.wait_for(aw, timeout)
+
+    def degrade(self, degradation: str) -> None:
+        if degradation not in self.degraded:
+            self.degraded.append(degradation)
+            log.warning(
+                "stage_degraded",
+                degradation=degradation,
+                elapsed_ms=round((time.perf_counter() - self.started) * 1000, 1),
+            )
+
+    def fork(self) -> Deadline:
+        """Same clock, separate degradations — for work whose result may be discarded."""
+        return Deadline(self.budget, started=self.started)
+
+    def merge(self, other: Deadline) -> None:
+        for degradation in other.degraded:
+            self.degrade(degradation)
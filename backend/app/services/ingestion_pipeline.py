@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+import time
 import uuid
 
+import numpy as np
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.exceptions import IngestionError
+from app.db.repositories.chunk_repo import ChunkRepository
 from app.db.repositories.document_repo import DocumentRepository
+from app.dependencies import get_keyword_search, get_retrieval_cache, get_vector_store
+from app.ingestion.chunkers.base import Chunk
 from app.ingestion.chunkers.fixed_size_chunker import FixedSizeChunker
 from app.ingestion.loaders.base import get_loader
 from app.ingestion.processors.metadata_extractor import MetadataExtractor
 from app.ingestion.processors.text_cleaner import TextCleaner
-from app.models.document import DocumentChunk
 from app.providers.base import EmbeddingProvider
+from app.services.answer_cache import SemanticAnswerCache
 
 log = structlog.get_logger()
 
@@ -47,7 +52,7 @@ class IngestionPipeline:
             loaded_docs = loader.load(doc.source_uri)
             log.info("documents_loaded", document_id=document_id, count=len(loaded_docs))
 
-            all_chunks = []
+            all_chunks: list[Chunk] = []
             for loaded_doc in loaded_docs:
                 # 2. Clean
                 cleaned_text = self.cleaner.clean(loaded_doc.text)
@@ -61,28 +66,31 @@ class IngestionPipeline:
                 # 4. Chunk
                 chunks = self.chunker.chunk(cleaned_text, metadata=doc_metadata)
                 log.info("document_chunked", document_id=document_id, chunk_count=len(chunks))
-
-                # 5. Create chunk records
-                for chunk in chunks:
-                    db_chunk = DocumentChunk(
-                        document_id=doc.id,
-                        chunk_index=chunk.index,
-                        text=chunk.text,
-                        metadata_=chunk.metadata,
-                    )
-                    self.db.add(db_chunk)
-                    all_chunks.append(db_chunk)
-
-            await self.db.flush()
-
-            # 6. Embed in batches
+                all_chunks.extend(chunks)
+
+            # 5. Embed in batches, streaming each batch into a staging table with COPY
+            chunk_repo = ChunkRepository(self.db)
+            await chunk_repo.create_staging_table()
+            chunk_ids = [uuid.uuid4() for _ in all_chunks]
+            embedded: list[np.ndarray] = []
+            embed_seconds = 0.0
+            started = time.perf_counter()
             batch_size = 100
             for i in range(0, len(all_chunks), batch_size):
                 batch = all_chunks[i : i + batch_size]
                 texts = [c.text for c in batch]
+                embed_started = time.perf_counter()
                 embeddings = await self.embedding_provider.embed_texts(texts)
-                for chunk, embedding in zip(batch, embeddings):
-                    chunk.embedding = embedding
+                embed_seconds += time.perf_counter() - embed_started
+                await chunk_repo.copy_to_staging(
+                    doc.id,
+                    chunk_ids[i : i + batch_size],
+                    [c.index for c in batch],
+                    texts,
+                    embeddings,
+                    [c.metadata for c in batch],
+                )
+                embedded.append(embeddings)
                 log.info(
                     "batch_embedded",
                     document_id=document_id,
@@ -90,23 +98,36 @@ class IngestionPipeline:
                     batch_size=len(batch),
                 )
 
-            await self.db.flush()
-
-            # 7. Build FTS index
-            from sqlalchemy import text as sa_text
-
-            for chunk in all_chunks:
-                await self.db.execute(
-                    sa_text(
-                        "UPDATE document_chunks SET tsv = to_tsvector('english', :text) WHERE id = :id"
-                    ),
-                    {"text": chunk.text, "id": chunk.id},
-                )
+            # 6. Insert all rows in one statement; Postgres generates tsv
+            loaded = await chunk_repo.insert_from_staging()
+            elapsed = time.perf_counter() - started
+            log.info(
+                "chunks_bulk_loaded",
+                document_id=document_id,
+                rows=loaded,
+                seconds=round(elapsed, 3),
+                embed_seconds=round(embed_seconds, 3),
+                rows_per_second=round(loaded / elapsed, 1) if elapsed else None,
+            )
 
-            # 8. Update document status
+            # 7. Update document status
             doc.status = "ready"
             doc.chunk_count = len(all_chunks)
+            await SemanticAnswerCache.invalidate(self.db)
             await self.db.commit()
+            # In-process indexes mirror document_chunks; publish the new rows.
+            settings = get_settings()
+            ids = [str(chunk_id) for chunk_id in chunk_ids]
+            if settings.vectorstore.provider == "mmap" and all_chunks:
+                await get_vector_store().upsert(
+                    ids=ids,
+                    embeddings=np.concatenate(embedded),
+                    texts=[c.text for c in all_chunks],
+                    metadatas=[c.metadata for c in all_chunks],
+                )
+            if settings.keyword_search.provider == "bm25":
+                await get_keyword_search().add_documents(ids, [c.text for c in all_chunks])
+            await get_retrieval_cache().bump_corpus_version()
 
             log.info(
                 "ingestion_complete",
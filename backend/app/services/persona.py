@@ -12,11 +12,16 @@ from app.core.config import PersonaConfig
 
 _CONFIG_DIR = Path(__file__).resolve().parent.parent.parent / "config"
 
+_DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant."
+_DEFAULT_FALLBACK = "I couldn't find specific information about that."
+_DEFAULT_ESCALATION = "Let me connect you with a human agent."
+
 
 class PersonaService:
     def __init__(self, config: PersonaConfig):
         self.config = config
         self._template_data = self._load_template()
+        self._templates: dict[str, Template] = {}
 
     def _load_template(self) -> dict[str, Any]:
         path = _CONFIG_DIR / self.config.template_path
@@ -25,14 +30,30 @@ class PersonaService:
                 return yaml.safe_load(f) or {}
         return {}
 
+    def _template(self, key: str, default: str) -> Template:
+        """Compiled template for ``key``; Jinja compilation runs once per key."""
+        template = self._templates.get(key)
+        if template is None:
+            template = Template(self._template_data.get(key, default))
+            self._templates[key] = template
+        return template
+
+    def warmup(self) -> None:
+        """Compile every template up front so the first turn doesn't pay for it."""
+        self._template("system_prompt", _DEFAULT_SYSTEM_PROMPT)
+        self._template("fallback_message", _DEFAULT_FALLBACK)
+        self._template("escalation_message", _DEFAULT_ESCALATION)
+        self._template("off_topic_message", self._default_off_topic())
+
+    def _default_off_topic(self) -> str:
+        return f"I can only help with questions about {self.config.product_name}."
+
     def build_system_prompt(
         self,
         sources: list[dict[str, Any]],
         confidence_tier: str = "ANSWER",
     ) -> str:
-        template_str = self._template_data.get("system_prompt", "You are a helpful assistant.")
-        template = Template(template_str)
-        return template.render(
+        return self._template("system_prompt", _DEFAULT_SYSTEM_PROMPT).render(
             company_name=self.config.company_name,
             product_name=self.config.product_name,
             tone=self.config.tone,
@@ -41,27 +62,17 @@ class PersonaService:
         )
 
     def get_fallback_message(self) -> str:
-        template_str = self._template_data.get(
-            "fallback_message", "I couldn't find specific information about that."
-        )
-        return Template(template_str).render(
+        return self._template("fallback_message", _DEFAULT_FALLBACK).render(
             product_name=self.config.product_name,
         )
 
     def get_escalation_message(self) -> str:
-        template_str = self._template_data.get(
-            "escalation_message", "Let me connect you with a human agent."
-        )
-        return Template(template_str).render(
+        return self._template("escalation_message", _DEFAULT_ESCALATION).render(
             product_name=self.config.product_name,
         )
 
     def get_off_topic_message(self) -> str:
-        template_str = self._template_data.get(
-            "off_topic_message",
-            f"I can only help with questions about {self.config.product_name}.",
-        )
-        return Template(template_str).render(
+        return self._template("off_topic_message", self._default_off_topic()).render(
             product_name=self.config.product_name,
         )
 
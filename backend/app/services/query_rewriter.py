@@ -0,0 +1,111 @@
+"""Conversational query rewriting — heuristics, caching and equivalence checks."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import OrderedDict
+
+from app.providers.base import LLMMessage, LLMProvider
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+# Words that usually point back into the conversation ("does it...", "what about that one")
+_REFERENTIAL = frozenset({
+    "it", "its", "it's", "this", "that", "these", "those", "they", "them", "their",
+    "he", "she", "him", "her", "one", "ones", "same", "above", "previous", "else",
+    "another", "other", "former", "latter",
+})
+_FOLLOW_UP_OPENERS = ("what about", "how about", "and ", "but ", "also ", "then ", "so ")
+_STOPWORDS = frozenset({
+    "a", "an", "the", "i", "my", "me", "you", "your", "we", "our", "to", "of", "in", "on",
+    "for", "with", "is", "are", "do", "does", "can", "could", "should", "how", "what",
+    "when", "where", "why", "which", "please", "and", "or",
+})
+_MIN_SELF_CONTAINED_WORDS = 4
+
+
+def references_context(query: str) -> bool:
+    """True for follow-ups ("what about...") and questions that point back with a pronoun.
+
+    Their rewrites substitute the referent, so they are never equivalent to the
+    raw question and retrieving on it speculatively is wasted work.
+    """
+    lowered = query.strip().lower()
+    if lowered.startswith(_FOLLOW_UP_OPENERS):
+        return True
+    return any(word in _REFERENTIAL for word in _WORD.findall(lowered))
+
+
+def needs_rewrite(query: str) -> bool:
+    """Cheap check for follow-ups that cannot be searched without conversation context."""
+    if len(_WORD.findall(query.lower())) < _MIN_SELF_CONTAINED_WORDS:
+        return True
+    return references_context(query)
+
+
+def _content_terms(text: str) -> frozenset[str]:
+    return frozenset(w for w in _WORD.findall(text.lower()) if w not in _STOPWORDS)
+
+
+def rewrites_equivalent(original: str, rewritten: str) -> bool:
+    """True when the rewrite adds or removes no content terms, so retrieval would match."""
+    return _content_terms(original) == _content_terms(rewritten)
+
+
+class QueryRewriter:
+    """LLM rewrite of follow-up questions into standalone search queries.
+
+    Results are memoised in a bounded LRU keyed by a hash of the rolling
+    summary, the context window and the question, so retried or repeated turns skip the LLM round trip.
+    """
+
+    context_window = 4
+
+    def __init__(self, llm: LLMProvider, cache_size: int = 1024):
+        self.llm = llm
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, str] = OrderedDict()
+
+    def _cache_key(self, query: str, context: list[LLMMessage], summary: str | None) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{summary or ''}\x1e".encode())
+        for msg in context[-self.context_window :]:
+            digest.update(f"{msg.role}\x1f{msg.content}\x1e".encode())
+        digest.update(query.encode())
+        return digest.hexdigest()
+
+    async def rewrite(
+        self, query: str, context: list[LLMMessage], summary: str | None = None
+    ) -> str:
+        key = self._cache_key(query, context, summary)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        rewrite_messages = [
+            LLMMessage(
+                role="system",
+                content=(
+                    "Rewrite the user's latest question as a standalone search query. "
+                    "Incorporate relevant context from the conversation. "
+                    "Output ONLY the rewritten query, nothing else."
+                ),
+            ),
+        ]
+        if summary:
+            rewrite_messages.append(
+                LLMMessage(role="system", content=f"Earlier conversation summary:\n{summary}")
+            )
+        rewrite_messages += [
+            *context[-self.context_window :],
+            LLMMessage(role="user", content=query),
+        ]
+        response = await self.llm.complete(rewrite_messages, max_tokens=150)
+        rewritten = response.content.strip() or query
+
+        self._cache[key] = rewritten
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return rewritten
@@ -6,26 +6,46 @@ Flow: Query → Context → Rewrite → [Semantic + Keyword] → RRF → Rerank
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
+import time
 import uuid
+from collections.abc import Awaitable
 from typing import Any, AsyncIterator
 
+import numpy as np
 import structlog
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.core.config import Settings
+from app.core.config import LatencyBudgetConfig, Settings
+from app.core.metrics import COALESCED, DEGRADATIONS, SPECULATIVE_RETRIEVALS, StageTimer
+from app.db.repositories.chunk_repo import ChunkRepository
 from app.providers.base import (
     EmbeddingProvider,
+    HybridSearchProvider,
     KeywordSearchProvider,
     LLMMessage,
     LLMProvider,
+    MetadataFilter,
     RerankerProvider,
     RerankResult,
     VectorStoreProvider,
 )
-from app.services.confidence import ConfidenceScorer, ConfidenceTier
+from app.services.answer_cache import SemanticAnswerCache
+from app.services.confidence import ConfidenceResult, ConfidenceScorer, ConfidenceTier
+from app.services.conversation_summarizer import ConversationSummarizer
+from app.services.deadline import Deadline
 from app.services.escalation import EscalationService
 from app.services.persona import PersonaService
-from app.services.session_manager import SessionManager
+from app.services.query_rewriter import (
+    QueryRewriter,
+    needs_rewrite,
+    references_context,
+    rewrites_equivalent,
+)
+from app.services.retrieval_cache import RetrievalCache, normalize_query
+from app.services.session_manager import ConversationContext, SessionManager
+from app.services.singleflight import SingleFlight, StreamFanout
 
 log = structlog.get_logger()
 
@@ -42,12 +62,39 @@ def reciprocal_rank_fusion(
         for rank, item in enumerate(result_list):
             chunk_id = item["chunk_id"]
             scores[chunk_id] = scores.get(chunk_id, 0) + 1 / (k + rank + 1)
-            items[chunk_id] = item
+            # Id-only vector hits must not hide the text a keyword hit carries.
+            if item["text"] or chunk_id not in items:
+                items[chunk_id] = item
 
     sorted_ids = sorted(scores, key=lambda x: scores[x], reverse=True)
     return [{**items[cid], "rrf_score": scores[cid]} for cid in sorted_ids]
 
 
+# (fused, reranked, degradations) from one retrieval attempt
+_Candidates = tuple[list[dict[str, Any]], list[RerankResult], list[str]]
+
+
+def _budget_key(budget: LatencyBudgetConfig) -> str:
+    """The parts of a latency budget that shape retrieval, for keying shared work."""
+    return json.dumps(
+        [
+            budget.enabled,
+            budget.total_seconds,
+            budget.embedding_seconds,
+            budget.search_seconds,
+            budget.rerank_seconds,
+            budget.hnsw_ef_search,
+            budget.ivfflat_probes,
+        ]
+    )
+
+
+def _discard(task: asyncio.Task[Any]) -> None:
+    """Cancel a speculative task without leaking an unretrieved exception."""
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
 class RAGPipeline:
     def __init__(
         self,
@@ -57,71 +104,176 @@ class RAGPipeline:
         reranker: RerankerProvider,
         keyword_search: KeywordSearchProvider,
         settings: Settings,
+        session_factory: async_sessionmaker[AsyncSession],
+        hybrid_search: HybridSearchProvider | None = None,
+        answer_cache: SemanticAnswerCache | None = None,
+        retrieval_cache: RetrievalCache | None = None,
+        summarizer: ConversationSummarizer | None = None,
     ):
         self.llm = llm
         self.embeddings = embeddings
         self.vector_store = vector_store
         self.reranker = reranker
         self.keyword_search = keyword_search
+        self.hybrid_search = hybrid_search
+        self.answer_cache = answer_cache
+        self.retrieval_cache = retrieval_cache
+        self.summarizer = summarizer
         self.settings = settings
+        self._session_factory = session_factory
         self.confidence_scorer = ConfidenceScorer(settings.confidence)
         self.persona = PersonaService(settings.persona)
+        self.query_rewriter = QueryRewriter(
+            llm, cache_size=settings.retrieval.rewrite_cache_size
+        )
+        self._retrieval_flight: SingleFlight[_Candidates] = SingleFlight()
+        self._generation_fanout = StreamFanout()
 
     async def run(
         self,
         query: str,
         session_id: str,
-        db: AsyncSession,
+        context: ConversationContext | None = None,
+        timer: StageTimer | None = None,
+        budget: LatencyBudgetConfig | None = None,
+        filters: MetadataFilter | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream one turn as SSE-shaped events.
+
+        ``context`` holds the turns preceding ``query`` plus the rolling summary of
+        older ones; callers that have already loaded it pass it in to avoid a
+        second read. Database sessions are opened only for the context read and
+        the final writes, so no pooled connection is held while retrieval or the
+        LLM stream is in progress.
+
+        Stage latencies, time to first token and total stream time are recorded
+        on ``timer`` and exported labelled by the turn's confidence tier.
+
+        Every stage before generation runs under ``budget`` (the YAML latency
+        budget by default; endpoints pass a channel override). Stages that
+        overrun are skipped or degraded and listed under ``degraded`` in the
+        metadata event. The budget may also set the ANN search breadth
+        (``hnsw_ef_search``/``ivfflat_probes``) for this turn.
+
+        ``filters`` restricts retrieval to matching chunks (see
+        ``ChunkRepository.chunk_filter_sql``).
+        """
+        timer = timer or StageTimer()
+        deadline = Deadline(budget or self.settings.latency_budget, started=timer.started)
+        confidence_tier = "ERROR"
+        try:
+            async for event in self._run_turn(
+                query, session_id, context, timer, deadline, filters
+            ):
+                if event["event"] == "metadata":
+                    confidence_tier = event["data"]["confidence_tier"]
+                    for degradation in event["data"].get("degraded", []):
+                        DEGRADATIONS.labels(degradation=degradation).inc()
+                elif event["event"] == "delta":
+                    timer.mark("time_to_first_token")
+                elif event["event"] == "done":
+                    timer.mark("stream_total")
+                yield event
+        finally:
+            timer.mark("stream_total")
+            timer.observe(confidence_tier)
+
+    async def _run_turn(
+        self,
+        query: str,
+        session_id: str,
+        context: ConversationContext | None,
+        timer: StageTimer,
+        deadline: Deadline,
+        filters: MetadataFilter | None = None,
     ) -> AsyncIterator[dict[str, Any]]:
-        session_mgr = SessionManager(db)
-        escalation_svc = EscalationService(db)
-
         message_id = str(uuid.uuid4())
 
         # 1. Get conversation context
-        context_messages = await session_mgr.get_context_messages(session_id)
-
-        # 2. Query rewrite (use LLM to improve retrieval query if conversation context exists)
-        search_query = query
-        if context_messages:
-            search_query = await self._rewrite_query(query, context_messages)
-            log.info("query_rewritten", original=query, rewritten=search_query)
-
-        # 3. Parallel retrieval: semantic + keyword
-        semantic_results, keyword_results = await asyncio.gather(
-            self._semantic_search(search_query),
-            self._keyword_search(search_query),
-        )
-
-        # 4. Reciprocal Rank Fusion
-        fused = reciprocal_rank_fusion(
-            semantic_results,
-            keyword_results,
-            k=self.settings.retrieval.rrf_k,
+        if context is None:
+            with timer.stage("context_load"):
+                async with self._session_factory() as db:
+                    context = await SessionManager(db).get_context(
+                        session_id, self.settings.conversation
+                    )
+        context_messages = context.messages
+
+        # 1b. Semantic answer cache — only for the opening, unfiltered turn, since
+        # later answers depend on conversation history and cached answers are not
+        # scoped to a filter
+        answer_cache = None
+        query_embedding: np.ndarray | None = None
+        if (
+            self.answer_cache is not None
+            and self.settings.answer_cache.enabled
+            and not filters
+            and not any(m.role == "assistant" for m in context_messages)
+        ):
+            answer_cache = self.answer_cache
+            budget = deadline.budget
+            cached = None
+            try:
+                with timer.stage("embedding"):
+                    query_embedding = await deadline.run(
+                        self.embeddings.embed_query(query), budget.embedding_seconds
+                    )
+                with timer.stage("answer_cache"):
+                    cached = await deadline.run(
+                        answer_cache.lookup(query_embedding), budget.search_seconds
+                    )
+            except TimeoutError:
+                deadline.degrade("answer_cache_skipped")
+            if cached is not None:
+                yield {
+                    "event": "metadata",
+                    "data": {
+                        "session_id": session_id,
+                        "confidence_tier": cached.confidence_tier,
+                        "message_id": message_id,
+                        "cached": True,
+                        "degraded": deadline.degraded,
+                    },
+                }
+                yield {"event": "delta", "data": {"content": cached.answer}}
+                yield {"event": "sources", "data": self._sources_payload(cached.sources)}
+                yield {"event": "done", "data": {"usage": {}}}
+                await self._persist(
+                    session_id, cached.answer, cached.confidence_tier, sources=cached.sources
+                )
+                return
+
+        # 2-5. Query rewrite (when conversation context needs resolving), retrieval
+        # (semantic + keyword), Reciprocal Rank Fusion and rerank
+        search_query, fused, reranked = await self._rewrite_and_retrieve(
+            query, context, timer, deadline, query_embedding, filters
         )
 
         if not fused:
             # No results at all → off-topic
             off_topic_msg = self.persona.get_off_topic_message()
-            yield {"event": "metadata", "data": {"session_id": session_id, "confidence_tier": "OFF_TOPIC", "message_id": message_id}}
+            yield {"event": "metadata", "data": {"session_id": session_id, "confidence_tier": "OFF_TOPIC", "message_id": message_id, "degraded": deadline.degraded}}
             yield {"event": "delta", "data": {"content": off_topic_msg}}
             yield {"event": "sources", "data": []}
             yield {"event": "done", "data": {"usage": {}}}
-            await session_mgr.save_assistant_message(session_id, off_topic_msg, "OFF_TOPIC")
-            await db.commit()
+            await self._persist(session_id, off_topic_msg, "OFF_TOPIC")
             return
 
-        # 5. Rerank
-        reranked = await self.reranker.rerank(
-            query=search_query,
-            documents=[item["text"] for item in fused[: self.settings.retrieval.rerank_top_k * 3]],
-            top_k=self.settings.retrieval.rerank_top_k,
-        )
-
         # 6. Confidence scoring
-        confidence = self.confidence_scorer.score(reranked)
+        with timer.stage("confidence"):
+            if "rerank_skipped" in deadline.degraded:
+                # RRF scores are not on the cross-encoder's scale, so the
+                # thresholds do not apply; answer, but never without a caveat.
+                confidence = ConfidenceResult(
+                    tier=ConfidenceTier.CAVEAT,
+                    top_score=reranked[0].score,
+                    score_variance=0.0,
+                    distinct_topics=0,
+                )
+            else:
+                confidence = self.confidence_scorer.score(reranked)
         log.info(
             "confidence_scored",
+            search_query=search_query,
             tier=confidence.tier.value,
             top_score=confidence.top_score,
             variance=confidence.score_variance,
@@ -134,6 +286,7 @@ class RAGPipeline:
                 "session_id": session_id,
                 "confidence_tier": confidence.tier.value,
                 "message_id": message_id,
+                "degraded": deadline.degraded,
             },
         }
 
@@ -143,8 +296,7 @@ class RAGPipeline:
             yield {"event": "delta", "data": {"content": msg}}
             yield {"event": "sources", "data": []}
             yield {"event": "done", "data": {"usage": {}}}
-            await session_mgr.save_assistant_message(session_id, msg, "OFF_TOPIC")
-            await db.commit()
+            await self._persist(session_id, msg, "OFF_TOPIC")
             return
 
         if confidence.tier == ConfidenceTier.ESCALATE:
@@ -152,9 +304,7 @@ class RAGPipeline:
             yield {"event": "delta", "data": {"content": msg}}
             yield {"event": "sources", "data": []}
             yield {"event": "done", "data": {"usage": {}}}
-            await escalation_svc.escalate(session_id, query, "low_confidence")
-            await session_mgr.save_assistant_message(session_id, msg, "ESCALATE")
-            await db.commit()
+            await self._persist(session_id, msg, "ESCALATE", escalation_query=query)
             return
 
         if confidence.tier == ConfidenceTier.DECLINE:
@@ -162,8 +312,7 @@ class RAGPipeline:
             yield {"event": "delta", "data": {"content": msg}}
             yield {"event": "sources", "data": []}
             yield {"event": "done", "data": {"usage": {}}}
-            await session_mgr.save_assistant_message(session_id, msg, "DECLINE")
-            await db.commit()
+            await self._persist(session_id, msg, "DECLINE")
             return
 
         if confidence.tier == ConfidenceTier.AMBIGUOUS:
@@ -173,8 +322,7 @@ class RAGPipeline:
             yield {"event": "delta", "data": {"content": msg}}
             yield {"event": "sources", "data": []}
             yield {"event": "done", "data": {"usage": {}}}
-            await session_mgr.save_assistant_message(session_id, msg, "AMBIGUOUS")
-            await db.commit()
+            await self._persist(session_id, msg, "AMBIGUOUS")
             return
 
         # ANSWER or CAVEAT → generate with LLM
@@ -184,74 +332,432 @@ class RAGPipeline:
             confidence_tier=confidence.tier.value,
         )
 
-        messages = [
-            LLMMessage(role="system", content=system_prompt),
-            *context_messages[-6:],  # Keep last 3 turns
-            LLMMessage(role="user", content=query),
-        ]
+        messages = [LLMMessage(role="system", content=system_prompt)]
+        if context.summary:
+            messages.append(
+                LLMMessage(
+                    role="system",
+                    content=f"Summary of the earlier conversation:\n{context.summary}",
+                )
+            )
+        # Already bounded by get_context; includes messages not yet in the summary.
+        messages += [*context_messages, LLMMessage(role="user", content=query)]
 
         # 8. Stream LLM response
         full_response = ""
-        async for token in self.llm.stream(messages):
+        async for token in self._stream_answer(messages):
             full_response += token
             yield {"event": "delta", "data": {"content": token}}
 
         # Emit sources
-        yield {
-            "event": "sources",
-            "data": [
-                {"title": s["title"], "text": s["text"][:300], "score": s["score"]}
-                for s in sources
-            ],
-        }
+        yield {"event": "sources", "data": self._sources_payload(sources)}
 
         yield {"event": "done", "data": {"usage": {}}}
 
+        if answer_cache is not None and query_embedding is not None and not deadline.degraded:
+            await answer_cache.store(
+                query, query_embedding, full_response, confidence.tier.value, sources
+            )
+
         # Persist
-        await session_mgr.save_assistant_message(
-            session_id,
-            full_response,
-            confidence.tier.value,
-            sources=sources,
+        await self._persist(session_id, full_response, confidence.tier.value, sources=sources)
+
+    def _stream_answer(self, messages: list[LLMMessage]) -> AsyncIterator[str]:
+        """LLM token stream, shared with any in-flight turn that sent the same prompt."""
+        if not self.settings.coalescing.generation:
+            return self.llm.stream(messages)
+        key = hashlib.sha256(
+            json.dumps([[m.role, m.content] for m in messages]).encode()
+        ).hexdigest()
+        stream, shared = self._generation_fanout.subscribe(
+            key, lambda: self.llm.stream(messages)
+        )
+        if shared:
+            COALESCED.labels(stage="generation").inc()
+            log.info("generation_coalesced")
+        return stream
+
+    async def _persist(
+        self,
+        session_id: str,
+        content: str,
+        confidence_tier: str,
+        sources: list[dict[str, Any]] | None = None,
+        escalation_query: str | None = None,
+    ) -> None:
+        """Write the assistant turn (and escalation event) in a short-lived session."""
+        async with self._session_factory() as db:
+            if escalation_query is not None:
+                await EscalationService(db).escalate(session_id, escalation_query, "low_confidence")
+            await SessionManager(db).save_assistant_message(
+                session_id,
+                content,
+                confidence_tier,
+                sources=sources,
+            )
+            await db.commit()
+        if self.summarizer is not None:
+            self.summarizer.schedule(session_id)
+
+    async def _rewrite_and_retrieve(
+        self,
+        query: str,
+        context: ConversationContext,
+        timer: StageTimer,
+        deadline: Deadline,
+        query_embedding: np.ndarray | None = None,
+        filters: MetadataFilter | None = None,
+    ) -> tuple[str, list[dict[str, Any]], list[RerankResult]]:
+        """Resolve the search query and its candidates, overlapping rewrite and retrieval.
+
+        Self-contained questions skip the LLM rewrite entirely. Otherwise, in
+        speculative mode, retrieval on the raw question runs while the rewrite is
+        in flight and is kept when the rewrite turns out to be equivalent. Only
+        questions that are merely short speculate: a referential follow-up's
+        rewrite always differs, so retrieving on it would be discarded. A
+        rewrite that overruns its budget is skipped in favour of the raw question.
+        """
+        retrieval = self.settings.retrieval
+        if not context.messages or (retrieval.rewrite_heuristic and not needs_rewrite(query)):
+            fused, reranked = await self._retrieve_candidates(
+                query, timer, deadline, query_embedding, filters
+            )
+            return query, fused, reranked
+
+        if not retrieval.speculative_retrieval or references_context(query):
+            search_query = await self._rewrite(query, context, timer, deadline)
+            fused, reranked = await self._retrieve_candidates(
+                search_query,
+                timer,
+                deadline,
+                query_embedding=query_embedding if search_query == query else None,
+                filters=filters,
+            )
+            return search_query, fused, reranked
+
+        speculative_deadline = deadline.fork()
+        speculative = asyncio.create_task(
+            self._retrieve_candidates(
+                query, timer, speculative_deadline, query_embedding, filters
+            )
         )
-        await db.commit()
-
-    async def _rewrite_query(self, query: str, context: list[LLMMessage]) -> str:
-        """Use LLM to produce a better search query from conversation context."""
-        rewrite_messages = [
-            LLMMessage(
-                role="system",
-                content=(
-                    "Rewrite the user's latest question as a standalone search query. "
-                    "Incorporate relevant context from the conversation. "
-                    "Output ONLY the rewritten query, nothing else."
-                ),
-            ),
-            *context[-4:],
-            LLMMessage(role="user", content=query),
+        try:
+            search_query = await self._rewrite(query, context, timer, deadline)
+        except BaseException:
+            _discard(speculative)
+            raise
+
+        if rewrites_equivalent(query, search_query):
+            fused, reranked = await speculative
+            deadline.merge(speculative_deadline)
+            SPECULATIVE_RETRIEVALS.labels(result="kept").inc()
+            log.info("speculative_retrieval_kept")
+            return query, fused, reranked
+
+        _discard(speculative)
+        SPECULATIVE_RETRIEVALS.labels(result="discarded").inc()
+        log.info("speculative_retrieval_discarded")
+        fused, reranked = await self._retrieve_candidates(
+            search_query, timer, deadline, filters=filters
+        )
+        return search_query, fused, reranked
+
+    async def _rewrite(
+        self,
+        query: str,
+        context: ConversationContext,
+        timer: StageTimer,
+        deadline: Deadline,
+    ) -> str:
+        try:
+            with timer.stage("rewrite"):
+                search_query = await deadline.run(
+                    self.query_rewriter.rewrite(query, context.messages, summary=context.summary),
+                    deadline.budget.rewrite_seconds,
+                )
+        except TimeoutError:
+            deadline.degrade("rewrite_skipped")
+            return query
+        log.info("query_rewritten", original=query, rewritten=search_query)
+        return search_query
+
+    @property
+    def _rerank_candidates(self) -> int:
+        return self.settings.retrieval.rerank_top_k * 3
+
+    async def _retrieve_candidates(
+        self,
+        query: str,
+        timer: StageTimer,
+        deadline: Deadline,
+        query_embedding: np.ndarray | None = None,
+        filters: MetadataFilter | None = None,
+    ) -> tuple[list[dict[str, Any]], list[RerankResult]]:
+        """Fused and reranked candidates, shared across workers via the retrieval cache.
+
+        Concurrent identical questions under the same latency budget in this
+        worker join one in-flight retrieval; a turn under another budget (e.g.
+        voice vs chat) runs its own, with its own timeouts and ANN breadth.
+        Degraded results (a search leg or the rerank skipped) are never cached.
+        """
+        cache = self.retrieval_cache if self.settings.retrieval_cache.enabled else None
+        cache_key = None
+        if cache is not None:
+            with timer.stage("retrieval_cache"):
+                cache_key, cached = await cache.get(query, filters, deadline.budget)
+            if cached is not None:
+                return cached.fused, cached.reranked
+
+        def compute() -> Awaitable[_Candidates]:
+            return self._compute_candidates(
+                query, timer, deadline.fork(), query_embedding, cache, cache_key, filters
+            )
+
+        if self.settings.coalescing.retrieval:
+            started = time.perf_counter()
+            flight_key = normalize_query(query) + "\n" + _budget_key(deadline.budget)
+            if filters:
+                flight_key += "\n" + json.dumps(filters, sort_keys=True)
+            (fused, reranked, degraded), shared = await self._retrieval_flight.do(
+                flight_key, compute
+            )
+            if shared:
+                COALESCED.labels(stage="retrieval").inc()
+                timer.record("retrieval_shared", time.perf_counter() - started)
+        else:
+            fused, reranked, degraded = await compute()
+        for degradation in degraded:
+            deadline.degrade(degradation)
+        return fused, reranked
+
+    async def _compute_candidates(
+        self,
+        query: str,
+        timer: StageTimer,
+        attempt: Deadline,
+        query_embedding: np.ndarray | None,
+        cache: RetrievalCache | None,
+        cache_key: str | None,
+        filters: MetadataFilter | None = None,
+    ) -> _Candidates:
+        started = time.perf_counter()
+        fused = await self._retrieve(query, timer, attempt, query_embedding, filters)
+        try:
+            with timer.stage("rerank"):
+                reranked = await attempt.run(
+                    self._rerank(query, fused), attempt.budget.rerank_seconds
+                )
+        except TimeoutError:
+            attempt.degrade("rerank_skipped")
+            reranked = self._rrf_order(fused)
+        if cache is not None and cache_key is not None and not attempt.degraded:
+            await cache.set(
+                cache_key,
+                fused[: self._rerank_candidates],
+                reranked,
+                compute_seconds=time.perf_counter() - started,
+            )
+        return fused, reranked, attempt.degraded
+
+    def _rrf_order(self, fused: list[dict[str, Any]]) -> list[RerankResult]:
+        """Stand-in for the reranker: the top fused candidates in RRF order."""
+        return [
+            RerankResult(index=i, score=item["rrf_score"], text=item["text"])
+            for i, item in enumerate(fused[: self.settings.retrieval.rerank_top_k])
         ]
-        response = await self.llm.complete(rewrite_messages, max_tokens=150)
-        return response.content.strip() or query
 
-    async def _semantic_search(self, query: str) -> list[dict[str, Any]]:
-        query_embedding = await self.embeddings.embed_query(query)
-        results = await self.vector_store.search(
-            query_embedding, top_k=self.settings.retrieval.semantic_top_k
+    async def _rerank(self, query: str, fused: list[dict[str, Any]]) -> list[RerankResult]:
+        if not fused:
+            return []
+        return await self.reranker.rerank(
+            query=query,
+            documents=[item["text"] for item in fused[: self._rerank_candidates]],
+            top_k=self.settings.retrieval.rerank_top_k,
+        )
+
+    async def _retrieve(
+        self,
+        query: str,
+        timer: StageTimer,
+        deadline: Deadline,
+        query_embedding: np.ndarray | None = None,
+        filters: MetadataFilter | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run semantic + keyword retrieval and fuse the rankings with RRF."""
+        retrieval = self.settings.retrieval
+        if retrieval.fusion == "sql" and self.hybrid_search is not None:
+            return await self._hybrid_search(
+                self.hybrid_search, query, timer, deadline, query_embedding, filters
+            )
+
+        semantic_results, keyword_results = await asyncio.gather(
+            self._semantic_search(query, timer, deadline, query_embedding, filters),
+            self._keyword_search(query, timer, deadline, filters),
         )
+        with timer.stage("rrf"):
+            fused = reciprocal_rank_fusion(
+                semantic_results,
+                keyword_results,
+                k=retrieval.rrf_k,
+            )
+        return await self._hydrate(fused, timer, filters)
+
+    async def _hydrate(
+        self,
+        fused: list[dict[str, Any]],
+        timer: StageTimer,
+        filters: MetadataFilter | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch texts for the fused top-N when the vector store returned ids only.
+
+        Chunks deleted since the in-process index was last published are dropped.
+        The in-process indexes cannot apply ``filters``, so the lookup does and
+        out-of-scope chunks are dropped too, along with any unhydrated ones past
+        the top-N that were never checked.
+        """
+        top = fused[: self._rerank_candidates]
+        rest = fused[len(top) :]
+        if filters:
+            rest = [item for item in rest if item["text"]]
+        missing = [item["chunk_id"] for item in top if not item["text"]]
+        if not missing:
+            return top + rest
+        with timer.stage("hydrate"):
+            async with self._session_factory() as db:
+                rows = await ChunkRepository(db).get_texts(missing, filters)
+        hydrated = []
+        for item in top:
+            if not item["text"]:
+                row = rows.get(item["chunk_id"])
+                if row is None:
+                    continue
+                item = {**item, "text": row[0], "metadata": row[1]}
+            hydrated.append(item)
+        return hydrated + rest
+
+    async def _hybrid_search(
+        self,
+        hybrid_search: HybridSearchProvider,
+        query: str,
+        timer: StageTimer,
+        deadline: Deadline,
+        query_embedding: np.ndarray | None = None,
+        filters: MetadataFilter | None = None,
+    ) -> list[dict[str, Any]]:
+        """Single-round-trip retrieval with RRF computed in the database.
+
+        Falls back to keyword-only retrieval when the query embedding overruns.
+        """
+        retrieval = self.settings.retrieval
+        budget = deadline.budget
+        if query_embedding is None:
+            try:
+                with timer.stage("embedding"):
+                    query_embedding = await deadline.run(
+                        self.embeddings.embed_query(query), budget.embedding_seconds
+                    )
+            except TimeoutError:
+                deadline.degrade("semantic_search_skipped")
+                keyword_results = await self._keyword_search(query, timer, deadline, filters)
+                return await self._hydrate(
+                    reciprocal_rank_fusion(keyword_results, k=retrieval.rrf_k), timer, filters
+                )
+        try:
+            with timer.stage("hybrid_search"):
+                results = await deadline.run(
+                    hybrid_search.search(
+                        query,
+                        query_embedding,
+                        top_k=self._rerank_candidates,
+                        semantic_top_k=retrieval.semantic_top_k,
+                        keyword_top_k=retrieval.keyword_top_k,
+                        rrf_k=retrieval.rrf_k,
+                        filter_metadata=filters,
+                        ef_search=budget.hnsw_ef_search,
+                        probes=budget.ivfflat_probes,
+                    ),
+                    budget.search_seconds,
+                )
+        except TimeoutError:
+            deadline.degrade("hybrid_search_skipped")
+            return []
+        return [
+            {
+                "chunk_id": r.chunk_id,
+                "text": r.text,
+                "score": r.score,
+                "metadata": r.metadata,
+                "rrf_score": r.score,
+            }
+            for r in results
+        ]
+
+    async def _semantic_search(
+        self,
+        query: str,
+        timer: StageTimer,
+        deadline: Deadline,
+        query_embedding: np.ndarray | None = None,
+        filters: MetadataFilter | None = None,
+    ) -> list[dict[str, Any]]:
+        budget = deadline.budget
+        try:
+            if query_embedding is None:
+                with timer.stage("embedding"):
+                    query_embedding = await deadline.run(
+                        self.embeddings.embed_query(query), budget.embedding_seconds
+                    )
+            with timer.stage("vector_search"):
+                results = await deadline.run(
+                    self.vector_store.search(
+                        query_embedding,
+                        top_k=self.settings.retrieval.semantic_top_k,
+                        filter_metadata=filters,
+                        ef_search=budget.hnsw_ef_search,
+                        probes=budget.ivfflat_probes,
+                    ),
+                    budget.search_seconds,
+                )
+        except TimeoutError:
+            deadline.degrade("semantic_search_skipped")
+            return []
         return [
             {"chunk_id": r.chunk_id, "text": r.text, "score": r.score, "metadata": r.metadata}
             for r in results
         ]
 
-    async def _keyword_search(self, query: str) -> list[dict[str, Any]]:
-        results = await self.keyword_search.search(
-            query, top_k=self.settings.retrieval.keyword_top_k
-        )
+    async def _keyword_search(
+        self,
+        query: str,
+        timer: StageTimer,
+        deadline: Deadline,
+        filters: MetadataFilter | None = None,
+    ) -> list[dict[str, Any]]:
+        try:
+            with timer.stage("fts"):
+                results = await deadline.run(
+                    self.keyword_search.search(
+                        query,
+                        top_k=self.settings.retrieval.keyword_top_k,
+                        filter_metadata=filters,
+                    ),
+                    deadline.budget.search_seconds,
+                )
+        except TimeoutError:
+            deadline.degrade("keyword_search_skipped")
+            return []
         return [
             {"chunk_id": r.chunk_id, "text": r.text, "score": r.score, "metadata": r.metadata}
             for r in results
         ]
 
+    @staticmethod
+    def _sources_payload(sources: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [
+            {"title": s["title"], "text": s["text"][:300], "score": s["score"]}
+            for s in sources
+        ]
+
     def _build_sources(
         self, reranked: list[RerankResult], fused: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
@@ -0,0 +1,205 @@
+"""Shared retrieval result cache (Redis), versioned by corpus generation."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from app.core.config import LatencyBudgetConfig, Settings
+from app.core.metrics import counter
+from app.providers.base import MetadataFilter, RerankResult
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+log = structlog.get_logger()
+
+CACHE_REQUESTS = counter(
+    "retrieval_cache_requests_total",
+    "Retrieval cache lookups by result (hit, miss, error).",
+    ("result",),
+)
+CACHE_SECONDS_SAVED = counter(
+    "retrieval_cache_seconds_saved_total",
+    "Retrieval and rerank time avoided by cache hits.",
+)
+
+CORPUS_VERSION_KEY = "csbot:corpus_version"
+_KEY_PREFIX = "csbot:retrieval:"
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Case-fold, collapse whitespace and drop trailing punctuation."""
+    return _WHITESPACE.sub(" ", query.strip().lower()).rstrip("?!. ")
+
+
+def retrieval_cache_key(
+    query: str,
+    settings: Settings,
+    corpus_version: int,
+    filters: MetadataFilter | None = None,
+    budget: LatencyBudgetConfig | None = None,
+) -> str:
+    """Key over everything that can change the fused-and-reranked candidate list.
+
+    ``budget`` is the turn's latency budget; its ANN breadth overrides, when set,
+    replace the retrieval defaults so channels searching at different breadths
+    never share entries.
+    """
+    retrieval = settings.retrieval
+    ef_search = retrieval.hnsw_ef_search
+    probes = retrieval.ivfflat_probes
+    if budget is not None:
+        if budget.hnsw_ef_search is not None:
+            ef_search = budget.hnsw_ef_search
+        if budget.ivfflat_probes is not None:
+            probes = budget.ivfflat_probes
+    payload = {
+        "query": normalize_query(query),
+        "corpus_version": corpus_version,
+        "embedding_model": settings.embedding.model,
+        "reranker": [settings.reranker.provider, settings.reranker.model],
+        "vectorstore": settings.vectorstore.provider,
+        "keyword_search": settings.keyword_search.provider,
+        "retrieval": {
+            "semantic_top_k": retrieval.semantic_top_k,
+            "keyword_top_k": retrieval.keyword_top_k,
+            "rrf_k": retrieval.rrf_k,
+            "rerank_top_k": retrieval.rerank_top_k,
+            "fusion": retrieval.fusion,
+            "hnsw_ef_search": ef_search,
+            "ivfflat_probes": probes,
+            "hnsw_iterative_scan": retrieval.hnsw_iterative_scan,
+            "vector_search": retrieval.vector_search,
+            "binary_oversample": retrieval.binary_oversample,
+        },
+    }
+    if filters:
+        # Only when set, so unfiltered keys are unchanged.
+        payload["filters"] = filters
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+    return _KEY_PREFIX + digest
+
+
+@dataclass
+class CachedRetrieval:
+    fused: list[dict[str, Any]]
+    reranked: list[RerankResult]
+    compute_seconds: float
+
+
+@dataclass
+class RetrievalCacheStats:
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+    seconds_saved: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class RetrievalCache:
+    """Fused + reranked candidates shared by every API worker through Redis.
+
+    The corpus version is part of every key; ingestion and deletion bump it, so
+    entries computed against an older corpus are simply never looked up again
+    and age out via TTL. Redis failures degrade to cache misses.
+    """
+
+    def __init__(self, redis: Redis, settings: Settings):
+        self._redis = redis
+        self.settings = settings
+        self.stats = RetrievalCacheStats()
+
+    async def get(
+        self,
+        query: str,
+        filters: MetadataFilter | None = None,
+        budget: LatencyBudgetConfig | None = None,
+    ) -> tuple[str | None, CachedRetrieval | None]:
+        """Return ``(key, entry)``; key is None when the cache is unreachable."""
+        started = time.perf_counter()
+        try:
+            version = int(await self._redis.get(CORPUS_VERSION_KEY) or 0)
+            key = retrieval_cache_key(query, self.settings, version, filters, budget)
+            raw = await self._redis.get(key)
+        except Exception as e:
+            self.stats.errors += 1
+            CACHE_REQUESTS.labels(result="error").inc()
+            log.warning("retrieval_cache_get_failed", error=str(e))
+            return None, None
+
+        if raw is None:
+            self.stats.misses += 1
+            CACHE_REQUESTS.labels(result="miss").inc()
+            return key, None
+
+        try:
+            data = json.loads(raw)
+            entry = CachedRetrieval(
+                fused=data["fused"],
+                reranked=[RerankResult(**r) for r in data["reranked"]],
+                compute_seconds=data["compute_seconds"],
+            )
+        except Exception as e:
+            # Corrupt or written by an older format; drop it so the recomputed
+            # result replaces it.
+            self.stats.errors += 1
+            CACHE_REQUESTS.labels(result="error").inc()
+            log.warning("retrieval_cache_decode_failed", error=str(e))
+            try:
+                await self._redis.delete(key)
+            except Exception as delete_error:
+                log.warning("retrieval_cache_delete_failed", error=str(delete_error))
+            return key, None
+        saved = max(entry.compute_seconds - (time.perf_counter() - started), 0.0)
+        self.stats.hits += 1
+        self.stats.seconds_saved += saved
+        CACHE_REQUESTS.labels(result="hit").inc()
+        CACHE_SECONDS_SAVED.inc(saved)
+        log.info(
+            "retrieval_cache_hit",
+            saved_ms=round(saved * 1000, 1),
+            hit_rate=round(self.stats.hit_rate, 3),
+        )
+        return key, entry
+
+    async def set(
+        self,
+        key: str,
+        fused: list[dict[str, Any]],
+        reranked: list[RerankResult],
+        compute_seconds: float,
+    ) -> None:
+        payload = {
+            "fused": fused,
+            "reranked": [asdict(r) for r in reranked],
+            "compute_seconds": compute_seconds,
+        }
+        try:
+            await self._redis.set(
+                key,
+                json.dumps(payload),
+                ex=self.settings.retrieval_cache.ttl_seconds,
+            )
+        except Exception as e:
+            self.stats.errors += 1
+            log.warning("retrieval_cache_set_failed", error=str(e))
+
+    async def bump_corpus_version(self) -> None:
+        """Invalidate every cached retrieval by moving to a new corpus version."""
+        try:
+            version = await self._redis.incr(CORPUS_VERSION_KEY)
+            log.info("corpus_version_bumped", version=version)
+        except Exception as e:
+            log.warning("corpus_version_bump_failed", error=str(e))
@@ -3,32 +3,61 @@
 from __future__ import annotations
 
 import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import ConversationConfig
 from app.db.repositories.session_repo import SessionRepository
 from app.providers.base import LLMMessage
 
 
+@dataclass
+class ConversationContext:
+    """Prompt context for a turn: rolling summary of older turns + recent messages."""
+
+    messages: list[LLMMessage] = field(default_factory=list)
+    summary: str | None = None
+
+
 class SessionManager:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.repo = SessionRepository(db)
 
-    async def get_context_messages(
-        self, session_id: str, max_turns: int = 10
-    ) -> list[LLMMessage]:
-        session = await self.repo.get_with_messages(uuid.UUID(session_id))
-        if not session or not session.messages:
-            return []
-
-        # Take last N messages for context
-        recent = session.messages[-(max_turns * 2) :]
-        return [
-            LLMMessage(role=msg.role, content=msg.content)
-            for msg in recent
-            if msg.role in ("user", "assistant")
-        ]
+    async def get_context(
+        self, session_id: str, config: ConversationConfig
+    ) -> ConversationContext:
+        """Recent messages plus the session's rolling summary (see ConversationSummarizer).
+
+        The summary is updated in batches, so messages that have left the
+        recent window but are not folded in yet (created after its
+        ``summary_through`` cursor) are included verbatim as well.
+        """
+        session = await self.repo.get(uuid.UUID(session_id))
+        if not session:
+            return ConversationContext()
+        metadata = session.metadata_ or {}
+        if config.summarize:
+            cursor = metadata.get("summary_through")
+            recent = await self.repo.get_recent_messages(
+                session.id,
+                limit=config.max_context_messages,
+                after=datetime.fromisoformat(cursor) if cursor else None,
+            )
+        else:
+            recent = await self.repo.get_recent_messages(
+                session.id, limit=config.recent_messages
+            )
+        return ConversationContext(
+            messages=[
+                LLMMessage(role=msg.role, content=msg.content)
+                for msg in recent
+                if msg.role in ("user", "assistant")
+            ],
+            summary=metadata.get("summary"),
+        )
 
     async def save_assistant_message(
         self,
@@ -0,0 +1,130 @@
+"""In-flight request coalescing for identical concurrent work.
+
+Both helpers are per process: with several uvicorn workers, each worker
+coalesces its own requests (the Redis retrieval cache covers the rest).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def _consume_exception(task: asyncio.Task[object]) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+class SingleFlight(Generic[T]):
+    """Collapse concurrent calls that share a key into a single execution.
+
+    The shared call is shielded, so a caller that goes away (e.g. a client
+    disconnect) does not cancel the work the other callers are waiting on.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[str, asyncio.Future[T]] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Return ``(result, shared)``; ``shared`` is True if an existing call was joined."""
+        future = self._in_flight.get(key)
+        shared = future is not None
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+            future.add_done_callback(_consume_exception)
+        return await asyncio.shield(future), shared
+
+    def _forget(self, key: str, future: asyncio.Future[T]) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+
+
+class _Broadcast:
+    """Token buffer for one shared stream; late subscribers replay from the start.
+
+    When the last subscriber leaves before the stream ends (every client
+    disconnected), the upstream task is cancelled so the generation stops.
+    """
+
+    def __init__(self) -> None:
+        self.tokens: list[str] = []
+        self.closed = False
+        self.error: BaseException | None = None
+        self.subscribers = 0
+        self._changed = asyncio.Event()
+        self.task: asyncio.Task[None] | None = None
+
+    def publish(self, token: str) -> None:
+        self.tokens.append(token)
+        self._notify()
+
+    def close(self, error: BaseException | None = None) -> None:
+        self.closed = True
+        self.error = error
+        self._notify()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def subscribe(self) -> AsyncIterator[str]:
+        self.subscribers += 1
+        return self._follow()
+
+    async def _follow(self) -> AsyncIterator[str]:
+        i = 0
+        try:
+            while True:
+                while i < len(self.tokens):
+                    yield self.tokens[i]
+                    i += 1
+                if self.closed:
+                    if self.error is not None:
+                        raise self.error
+                    return
+                await self._changed.wait()
+        finally:
+            self.subscribers -= 1
+            if self.subscribers == 0 and not self.closed and self.task is not None:
+                self.task.cancel()
+
+
+class StreamFanout:
+    """Share one upstream token stream among concurrent identical requests."""
+
+    def __init__(self) -> None:
+        self._streams: dict[str, _Broadcast] = {}
+
+    def subscribe(
+        self, key: str, start: Callable[[], AsyncIterator[str]]
+    ) -> tuple[AsyncIterator[str], bool]:
+        """Return ``(tokens, shared)``, starting the upstream stream if none is in flight."""
+        broadcast = self._streams.get(key)
+        shared = broadcast is not None
+        if broadcast is None:
+            broadcast = _Broadcast()
+            self._streams[key] = broadcast
+            broadcast.task = asyncio.create_task(self._pump(key, broadcast, start))
+        return broadcast.subscribe(), shared
+
+    async def _pump(
+        self, key: str, broadcast: _Broadcast, start: Callable[[], AsyncIterator[str]]
+    ) -> None:
+        error: BaseException | None = None
+        try:
+            async for token in start():
+                broadcast.publish(token)
+        except asyncio.CancelledError:
+            error = RuntimeError("shared stream was cancelled")
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            if self._streams.get(key) is broadcast:
+                del self._streams[key]
+            broadcast.close(error)
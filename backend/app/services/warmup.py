@@ -0,0 +1,105 @@
+"""Startup warm-up: preload local models and templates before taking traffic.
+
+Local embedding and rerank providers load their weights lazily, so without
+this the first request after a deploy pays for download, deserialization and
+first-inference setup. ``warm_up`` runs each component's ``warmup()`` twice,
+records the cold and warm latencies, and flips the process-wide state that
+``/ready`` reports.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import structlog
+
+from app.providers.base import EmbeddingProvider, RerankerProvider, WarmableProvider
+from app.services.persona import PersonaService
+
+log = structlog.get_logger()
+
+
+class WarmupState:
+    """Progress of the startup warm-up, as reported by ``/ready``."""
+
+    def __init__(self) -> None:
+        self.status = "pending"  # pending | warming | ready | failed
+        self.error: str | None = None
+        self.timings: dict[str, dict[str, float]] = {}
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+    def as_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"status": self.status, "components": self.timings}
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+_state = WarmupState()
+
+
+def get_warmup_state() -> WarmupState:
+    return _state
+
+
+def _ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+async def _warm_provider(provider: object) -> dict[str, float] | None:
+    """Time the first (cold) and second (warm) warm-up inference."""
+    if not isinstance(provider, WarmableProvider):
+        return None  # hosted API; nothing to preload
+    started = time.perf_counter()
+    await provider.warmup()
+    cold_ms = _ms(started)
+    started = time.perf_counter()
+    await provider.warmup()
+    return {"cold_ms": cold_ms, "warm_ms": _ms(started)}
+
+
+def _warm_persona(persona: PersonaService) -> dict[str, float]:
+    started = time.perf_counter()
+    persona.warmup()
+    cold_ms = _ms(started)
+    started = time.perf_counter()
+    persona.build_system_prompt(sources=[], confidence_tier="ANSWER")
+    return {"cold_ms": cold_ms, "warm_ms": _ms(started)}
+
+
+async def warm_up(
+    *,
+    embeddings: EmbeddingProvider | None = None,
+    reranker: RerankerProvider | None = None,
+    persona: PersonaService | None = None,
+    state: WarmupState | None = None,
+) -> WarmupState:
+    """Warm the given components; failures leave the state ``failed``, never raise."""
+    state = state or _state
+    state.status = "warming"
+    state.error = None
+    started = time.perf_counter()
+    try:
+        if persona is not None:
+            state.timings["templates"] = _warm_persona(persona)
+        if embeddings is not None:
+            timings = await _warm_provider(embeddings)
+            if timings is not None:
+                state.timings["embeddings"] = timings
+        if reranker is not None:
+            timings = await _warm_provider(reranker)
+            if timings is not None:
+                state.timings["reranker"] = timings
+    except Exception as e:
+        state.status = "failed"
+        state.error = str(e)
+        log.error("warmup_failed", error=str(e), elapsed_ms=_ms(started))
+        return state
+
+    state.status = "ready"
+    log.info("warmup_complete", elapsed_ms=_ms(started), **state.timings)
+    return state
@@ -29,6 +29,11 @@ async def startup(ctx: dict) -> None:
 
     settings = get_settings()
     setup_logging(settings.app.log_level)
+    if settings.app.warmup:
+        # Ingestion only embeds; load the model before the first job arrives.
+        from app.services.warmup import warm_up
+
+        await warm_up(embeddings=get_embedding_provider())
     log.info("worker_started")
 
 
@@ -0,0 +1,151 @@
+"""Recall@k and latency of binary-quantized two-stage search vs plain HNSW search.
+
+``--offline`` measures the quantization itself on synthetic clustered vectors:
+exact Hamming prefilter over sign bits, exact cosine rescoring, for each
+oversampling factor. Without it, both modes of PgVectorStore run against the
+embeddings already in ``document_chunks`` (apply migration 006 first), with
+ground truth from exact float32 search in numpy.
+
+Usage:
+    python scripts/benchmark_binary_quantization.py --offline --rows 50000
+    python scripts/benchmark_binary_quantization.py --queries 200 --k 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint16)
+
+
+def _normalize(x: np.ndarray) -> np.ndarray:
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+def _random_corpus(rows: int, dimension: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(rows // 100, 1), dimension))
+    assignments = rng.integers(0, len(centers), rows)
+    return _normalize(centers[assignments] + 0.5 * rng.standard_normal((rows, dimension))).astype(
+        np.float32
+    )
+
+
+def _queries(corpus: np.ndarray, count: int, seed: int = 1) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    picks = corpus[rng.integers(0, len(corpus), count)]
+    return _normalize(picks + 0.1 * rng.standard_normal(picks.shape)).astype(np.float32)
+
+
+def _recall(found: list[list[int]], truth: np.ndarray) -> float:
+    k = truth.shape[1]
+    return sum(len(set(f) & set(t)) for f, t in zip(found, truth.tolist())) / (len(found) * k)
+
+
+def _run_offline(args: argparse.Namespace) -> None:
+    corpus = _random_corpus(args.rows, args.dimension)
+    queries = _queries(corpus, args.queries)
+    truth = np.argsort(-(queries @ corpus.T), axis=1)[:, : args.k]
+    packed = np.packbits(corpus > 0, axis=1)  # binary_quantize: 1 where x > 0
+
+    print(f"offline, {len(corpus)} x {corpus.shape[1]}, recall@{args.k}")
+    print(f"  bytes/vector: float32={corpus.shape[1] * 4}  bit={packed.shape[1]}")
+    for oversample in args.oversample:
+        candidates = args.k * oversample
+        found, latencies = [], []
+        for q in queries:
+            started = time.perf_counter()
+            q_bits = np.packbits(q > 0)
+            hamming = _POPCOUNT[np.bitwise_xor(packed, q_bits)].sum(axis=1)
+            shortlist = np.argpartition(hamming, candidates)[:candidates]
+            scores = corpus[shortlist] @ q
+            found.append(shortlist[np.argsort(-scores)[: args.k]].tolist())
+            latencies.append(time.perf_counter() - started)
+        print(
+            f"  oversample={oversample:<3} candidates={candidates:<4}"
+            f" recall={_recall(found, truth):.4f}"
+            f"  numpy p50={statistics.median(latencies) * 1000:.2f}ms"
+        )
+
+
+async def _run_db(args: argparse.Namespace) -> None:
+    from sqlalchemy import text
+
+    from app.core.config import get_settings
+    from app.db.engine import dispose_engine, get_session_factory
+    from app.providers.vectorstore.pgvector_store import PgVectorStore
+
+    settings = get_settings()
+    session_factory = get_session_factory()
+    try:
+        async with session_factory() as session:
+            result = await session.execute(
+                text(
+                    "SELECT CAST(id AS text), CAST(embedding AS vector)"
+                    " FROM document_chunks WHERE embedding IS NOT NULL"
+                )
+            )
+            rows = result.fetchall()
+        if not rows:
+            raise SystemExit("document_chunks has no embeddings; ingest first or use --offline")
+        ids = [r[0] for r in rows]
+        corpus = _normalize(
+            np.stack([r[1].to_numpy() for r in rows])
+        )
+        queries = _queries(corpus, args.queries)
+        truth = np.argsort(-(queries @ corpus.T), axis=1)[:, : args.k]
+        position = {chunk_id: i for i, chunk_id in enumerate(ids)}
+
+        configs = [("ann", 1)] + [("binary", o) for o in args.oversample]
+        print(f"{settings.embedding.column_type}, {len(corpus)} rows, recall@{args.k}")
+        for mode, oversample in configs:
+            store = PgVectorStore(
+                session_factory,
+                ef_search=args.ef_search,
+                vector_type=settings.embedding.sql_type,
+                search_mode=mode,
+                dimension=settings.embedding.dimension,
+                binary_oversample=oversample,
+            )
+            found, latencies = [], []
+            for q in queries:
+                started = time.perf_counter()
+                results = await store.search(q, top_k=args.k)
+                latencies.append(time.perf_counter() - started)
+                found.append([position[r.chunk_id] for r in results])
+            q = statistics.quantiles(latencies, n=100)
+            label = "ann" if mode == "ann" else f"binary x{oversample}"
+            print(
+                f"  {label:<11} recall={_recall(found, truth):.4f}"
+                f"  p50={q[49] * 1000:.2f}ms  p95={q[94] * 1000:.2f}ms"
+            )
+    finally:
+        await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--offline", action="store_true")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--ef-search", type=int, default=40)
+    parser.add_argument("--oversample", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    if args.offline:
+        _run_offline(args)
+    else:
+        asyncio.run(_run_db(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Compare the in-process BM25 index with Postgres FTS: latency and recall.
+
+Builds a BM25 index in memory from document_chunks and runs the same
+queries through both providers. Without ``--queries-file``, known-item
+queries are sampled from the corpus (a few words from a random chunk), and
+recall is the share of queries whose source chunk is in the top k. Overlap
+is the mean fraction of each top k shared by the two providers.
+``--synthetic N`` skips Postgres and times BM25 alone on N Zipf-distributed
+documents.
+
+Usage:
+    python scripts/benchmark_bm25.py --queries 300 --k 20
+    python scripts/benchmark_bm25.py --queries-file queries.txt
+    python scripts/benchmark_bm25.py --synthetic 100000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.providers.keyword_search.bm25_index import STOPWORDS, Bm25Index
+
+
+def _percentiles(samples: list[float]) -> str:
+    q = statistics.quantiles(samples, n=100)
+    return f"p50={q[49] * 1e6:9.0f}us  p95={q[94] * 1e6:9.0f}us"
+
+
+def _known_item_queries(rows, count: int, rng: random.Random) -> list[tuple[str, str]]:
+    queries = []
+    while len(queries) < count:
+        chunk_id, text = rng.choice(rows)
+        words = [w for w in text.split() if w.isalpha() and w.lower() not in STOPWORDS]
+        if len(words) >= 3:
+            picked = rng.sample(words, rng.randint(2, min(5, len(words))))
+            queries.append((" ".join(picked), chunk_id))
+    return queries
+
+
+def _synthetic(args: argparse.Namespace) -> None:
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    vocab = np.array([f"term{i}" for i in range(args.vocabulary)])
+    p = 1 / np.arange(1, args.vocabulary + 1)
+    p /= p.sum()
+    lengths = rng.integers(20, 120, args.synthetic)
+    words = np.split(rng.choice(args.vocabulary, size=lengths.sum(), p=p), np.cumsum(lengths)[:-1])
+    docs = [" ".join(vocab[w]) for w in words]
+    started = time.perf_counter()
+    index = Bm25Index.empty().updated([str(i) for i in range(len(docs))], docs)
+    elapsed = time.perf_counter() - started
+    print(f"built {len(docs)} docs, {len(index.doc_ids)} postings in {elapsed:.1f}s")
+    latencies = []
+    for _ in range(args.queries):
+        query = " ".join(vocab[rng.choice(args.vocabulary, size=rng.integers(2, 6), p=p)])
+        started = time.perf_counter()
+        index.search(query, args.k)
+        latencies.append(time.perf_counter() - started)
+    print(f"  bm25 top-{args.k}: {_percentiles(latencies)}")
+
+
+async def _compare(args: argparse.Namespace) -> None:
+    from sqlalchemy import text
+
+    from app.db.engine import dispose_engine, get_session_factory
+    from app.providers.keyword_search.postgres_fts import PostgresFTSProvider
+
+    session_factory = get_session_factory()
+    try:
+        async with session_factory() as session:
+            rows = (
+                await session.execute(text("SELECT CAST(id AS text), text FROM document_chunks"))
+            ).fetchall()
+        if not rows:
+            raise SystemExit("document_chunks is empty; ingest first or use --synthetic")
+        index = Bm25Index.empty().updated([r[0] for r in rows], [r[1] for r in rows])
+
+        if args.queries_file:
+            lines = Path(args.queries_file).read_text().splitlines()
+            queries = [(line, None) for line in lines if line.strip()]
+        else:
+            queries = _known_item_queries(rows, args.queries, random.Random(0))
+
+        fts = PostgresFTSProvider(session_factory)
+        await fts.search(queries[0][0], top_k=args.k)  # warm the pool
+        results: dict[str, list[list[str]]] = {"postgres": [], "bm25": []}
+        latencies: dict[str, list[float]] = {"postgres": [], "bm25": []}
+        for query, _ in queries:
+            started = time.perf_counter()
+            hits = await fts.search(query, top_k=args.k)
+            latencies["postgres"].append(time.perf_counter() - started)
+            results["postgres"].append([h.chunk_id for h in hits])
+            started = time.perf_counter()
+            ranked = index.search(query, args.k)
+            latencies["bm25"].append(time.perf_counter() - started)
+            results["bm25"].append([chunk_id for chunk_id, _ in ranked])
+
+        print(f"{len(rows)} chunks, {len(queries)} queries, top-{args.k}")
+        for name in ("postgres", "bm25"):
+            line = f"  {name:<8} {_percentiles(latencies[name])}"
+            if queries[0][1] is not None:
+                found = sum(
+                    target in ids for (_, target), ids in zip(queries, results[name])
+                )
+                empty = sum(not ids for ids in results[name])
+                line += f"  recall={found / len(queries):.3f}  no-results={empty}"
+            print(line)
+        overlap = [
+            len(set(a) & set(b)) / max(len(a), 1)
+            for a, b in zip(results["postgres"], results["bm25"])
+        ]
+        print(f"  overlap of postgres top-{args.k} with bm25: {statistics.mean(overlap):.3f}")
+    finally:
+        await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--queries-file")
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--synthetic", type=int, default=0)
+    parser.add_argument("--vocabulary", type=int, default=20000)
+    args = parser.parse_args()
+
+    if args.synthetic:
+        _synthetic(args)
+    else:
+        asyncio.run(_compare(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Compare vector (float32) and halfvec (float16) storage: size, latency and recall.
+
+Loads the same embeddings into two scratch tables with identical HNSW
+indexes, then measures table/index size, query latency and recall@k against
+exact float32 search computed in numpy. ``--offline`` skips Postgres and
+reports only the recall cost of float16 rounding (exact search both sides).
+
+Usage:
+    python scripts/benchmark_halfvec.py --source db           # existing chunk embeddings
+    python scripts/benchmark_halfvec.py --source random --rows 50000 --dimension 384
+    python scripts/benchmark_halfvec.py --offline --rows 50000
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _normalize(x: np.ndarray) -> np.ndarray:
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+def _random_corpus(rows: int, dimension: int, seed: int = 0) -> np.ndarray:
+    """Clustered unit vectors, closer to real embeddings than uniform noise."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(rows // 100, 1), dimension))
+    assignments = rng.integers(0, len(centers), rows)
+    return _normalize(centers[assignments] + 0.5 * rng.standard_normal((rows, dimension))).astype(
+        np.float32
+    )
+
+
+def _queries(corpus: np.ndarray, count: int, seed: int = 1) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    picks = corpus[rng.integers(0, len(corpus), count)]
+    return _normalize(picks + 0.1 * rng.standard_normal(picks.shape)).astype(np.float32)
+
+
+def _exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    scores = queries @ corpus.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def _recall(found: list[list[int]], truth: np.ndarray) -> float:
+    k = truth.shape[1]
+    return sum(len(set(f) & set(t)) for f, t in zip(found, truth.tolist())) / (len(found) * k)
+
+
+def _report_offline(corpus: np.ndarray, queries: np.ndarray, k: int) -> None:
+    truth = _exact_top_k(corpus, queries, k)
+    half = _exact_top_k(corpus.astype(np.float16).astype(np.float32), queries, k)
+    print(f"exact search, {len(corpus)} x {corpus.shape[1]}")
+    print(f"  float16 recall@{k}: {_recall(half.tolist(), truth):.4f}")
+    print(f"  raw bytes/vector : float32={corpus.shape[1] * 4}  float16={corpus.shape[1] * 2}")
+
+
+async def _load_db_embeddings(session_factory) -> np.ndarray:
+    from sqlalchemy import text
+
+    async with session_factory() as session:
+        result = await session.execute(
+            text(
+                "SELECT CAST(embedding AS vector) FROM document_chunks"
+                " WHERE embedding IS NOT NULL"
+            )
+        )
+        rows = [r[0].to_numpy() for r in result]
+    if not rows:
+        raise SystemExit("document_chunks has no embeddings; use --source random")
+    return _normalize(np.stack(rows)).astype(np.float32)
+
+
+async def _bench_type(session_factory, sql_type, corpus, queries, truth, args) -> None:
+    from sqlalchemy import text
+
+    dimension = corpus.shape[1]
+    table = f"bench_{sql_type}"
+    async with session_factory() as session:
+        await session.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        await session.execute(
+            text(f"CREATE TABLE {table} (id int PRIMARY KEY, embedding {sql_type}({dimension}))")
+        )
+        for start in range(0, len(corpus), 1000):
+            await session.execute(
+                text(f"INSERT INTO {table} VALUES (:id, CAST(:embedding AS {sql_type}))"),
+                [
+                    {"id": start + i, "embedding": v}
+                    for i, v in enumerate(corpus[start : start + 1000])
+                ],
+            )
+        started = time.perf_counter()
+        await session.execute(
+            text(
+                f"CREATE INDEX ON {table} USING hnsw (embedding {sql_type}_cosine_ops)"
+                " WITH (m = 16, ef_construction = 64)"
+            )
+        )
+        build_seconds = time.perf_counter() - started
+        sizes = (
+            await session.execute(
+                text(
+                    "SELECT pg_relation_size(CAST(:t AS regclass)),"
+                    " pg_indexes_size(CAST(:t AS regclass))"
+                ),
+                {"t": table},
+            )
+        ).one()
+        await session.commit()
+
+        found, latencies = [], []
+        for q in queries:
+            await session.execute(
+                text("SELECT set_config('hnsw.ef_search', :v, true)"), {"v": str(args.ef_search)}
+            )
+            started = time.perf_counter()
+            result = await session.execute(
+                text(
+                    f"SELECT id FROM {table}"
+                    f" ORDER BY embedding <=> CAST(:q AS {sql_type}) LIMIT :k"
+                ),
+                {"q": q, "k": args.k},
+            )
+            latencies.append(time.perf_counter() - started)
+            found.append([r[0] for r in result])
+            await session.commit()
+
+        if not args.keep:
+            await session.execute(text(f"DROP TABLE {table}"))
+            await session.commit()
+
+    q = statistics.quantiles(latencies, n=100)
+    print(f"[{sql_type}]")
+    print(f"  heap size       : {sizes[0] / 2**20:8.1f} MiB")
+    print(f"  index size      : {sizes[1] / 2**20:8.1f} MiB  (build {build_seconds:.1f}s)")
+    print(f"  query latency   : p50={q[49] * 1000:.2f}ms  p95={q[94] * 1000:.2f}ms")
+    print(f"  recall@{args.k:<2}       : {_recall(found, truth):.4f}  (ef_search={args.ef_search})")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", choices=["db", "random"], default="random")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--ef-search", type=int, default=40)
+    parser.add_argument("--offline", action="store_true")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch tables")
+    args = parser.parse_args()
+
+    if args.offline:
+        corpus = _random_corpus(args.rows, args.dimension)
+        _report_offline(corpus, _queries(corpus, args.queries), args.k)
+        return
+
+    from app.db.engine import dispose_engine, get_session_factory
+
+    session_factory = get_session_factory()
+    try:
+        if args.source == "db":
+            corpus = await _load_db_embeddings(session_factory)
+        else:
+            corpus = _random_corpus(args.rows, args.dimension)
+        queries = _queries(corpus, args.queries)
+        truth = _exact_top_k(corpus, queries, args.k)
+        _report_offline(corpus, queries, args.k)
+        for sql_type in ("vector", "halfvec"):
+            await _bench_type(session_factory, sql_type, corpus, queries, truth, args)
+    finally:
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
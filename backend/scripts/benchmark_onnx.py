@@ -0,0 +1,103 @@
+"""Compare PyTorch and int8 ONNX Runtime embedding/rerank latency and memory.
+
+Each backend runs in its own process so peak RSS is attributable to it.
+The first ONNX run also exports and quantizes the models into the cache.
+
+Usage: python scripts/benchmark_onnx.py --iterations 200 --docs 15
+"""
+
+import argparse
+import asyncio
+import multiprocessing as mp
+import resource
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+QUERY = "How do I reset the water filter indicator on my fridge?"
+DOCUMENT = (
+    "To reset the filter indicator, press and hold the Filter button for three seconds "
+    "until the light turns off. Replace the filter every six months for best results."
+)
+
+
+def _build(backend: str, embedding_model: str, reranker_model: str, cache_dir: str):
+    if backend == "onnx":
+        from app.providers.embeddings.onnx_embeddings import OnnxEmbeddingProvider
+        from app.providers.reranker.onnx_reranker import OnnxCrossEncoderReranker
+
+        return (
+            OnnxEmbeddingProvider(model_name=embedding_model, cache_dir=cache_dir),
+            OnnxCrossEncoderReranker(model_name=reranker_model, cache_dir=cache_dir),
+        )
+    from app.providers.embeddings.sentence_transformer_embeddings import (
+        SentenceTransformerEmbeddingProvider,
+    )
+    from app.providers.reranker.cross_encoder_reranker import CrossEncoderReranker
+
+    return (
+        SentenceTransformerEmbeddingProvider(model_name=embedding_model),
+        CrossEncoderReranker(model_name=reranker_model),
+    )
+
+
+def _percentiles(samples: list[float]) -> str:
+    q = statistics.quantiles(samples, n=100)
+    return f"p50={q[49] * 1000:7.2f}ms  p95={q[94] * 1000:7.2f}ms"
+
+
+async def _measure(backend: str, args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    embeddings, reranker = _build(
+        backend, args.embedding_model, args.reranker_model, args.cache_dir
+    )
+    documents = [f"{DOCUMENT} ({i})" for i in range(args.docs)]
+    await embeddings.embed_query(QUERY)
+    await reranker.rerank(QUERY, documents)
+    load_seconds = time.perf_counter() - started
+
+    embed_times, rerank_times = [], []
+    for _ in range(args.iterations):
+        t = time.perf_counter()
+        await embeddings.embed_query(QUERY)
+        embed_times.append(time.perf_counter() - t)
+        t = time.perf_counter()
+        await reranker.rerank(QUERY, documents)
+        rerank_times.append(time.perf_counter() - t)
+
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    if sys.platform == "darwin":  # ru_maxrss is bytes on macOS, KiB on Linux
+        peak_mb /= 1024
+    print(f"[{backend}]")
+    print(f"  load + first call : {load_seconds:.2f}s")
+    print(f"  embed_query       : {_percentiles(embed_times)}")
+    print(f"  rerank ({args.docs:>2} docs) : {_percentiles(rerank_times)}")
+    print(f"  peak RSS          : {peak_mb:.0f} MB")
+
+
+def _run(backend: str, args: argparse.Namespace) -> None:
+    asyncio.run(_measure(backend, args))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--docs", type=int, default=15)
+    parser.add_argument("--embedding-model", default="all-MiniLM-L6-v2")
+    parser.add_argument("--reranker-model", default="cross-encoder/ms-marco-MiniLM-L-6-v2")
+    parser.add_argument("--cache-dir", default=".cache/onnx")
+    parser.add_argument("--backends", nargs="+", default=["pytorch", "onnx"])
+    args = parser.parse_args()
+
+    ctx = mp.get_context("spawn")
+    for backend in args.backends:
+        proc = ctx.Process(target=_run, args=(backend, args))
+        proc.start()
+        proc.join()
+
+
+if __name__ == "__main__":
+    main()
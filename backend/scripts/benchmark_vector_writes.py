@@ -0,0 +1,149 @@
+"""Throughput of PgVectorStore upserts and deletes: set-based vs per-row statements.
+
+Inserts a scratch document with N chunks, then times re-embedding (upsert)
+and clearing (delete) all of them through PgVectorStore at several batch
+sizes. The previous implementation, one UPDATE per vector and a delete
+that cast every id to text, is timed for comparison up to ``--legacy-max``
+rows. The scratch document and its chunks are removed afterwards.
+
+Usage:
+    python scripts/benchmark_vector_writes.py --rows 10000 100000
+    python scripts/benchmark_vector_writes.py --rows 10000 --batch-sizes 500 1000 5000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _random_embeddings(rows: int, dimension: int, seed: int) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((rows, dimension)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+async def _create_chunks(session_factory, rows: int, dimension: int) -> tuple[uuid.UUID, list]:
+    from sqlalchemy import text
+
+    from app.db.repositories.chunk_repo import ChunkRepository
+
+    document_id = uuid.uuid4()
+    chunk_ids = [uuid.uuid4() for _ in range(rows)]
+    embeddings = _random_embeddings(rows, dimension, seed=0)
+    async with session_factory() as session:
+        await session.execute(
+            text(
+                "INSERT INTO documents (id, title, source_type, source_uri, status, metadata,"
+                " chunk_count) VALUES (:id, 'write benchmark', 'benchmark', '', 'ready', '{}', 0)"
+            ),
+            {"id": document_id},
+        )
+        repo = ChunkRepository(session)
+        await repo.create_staging_table()
+        for start in range(0, rows, 5000):
+            batch = chunk_ids[start : start + 5000]
+            await repo.copy_to_staging(
+                document_id,
+                batch,
+                range(start, start + len(batch)),
+                [f"benchmark chunk {start + i}" for i in range(len(batch))],
+                embeddings[start : start + len(batch)],
+                [{}] * len(batch),
+            )
+        await repo.insert_from_staging()
+        await session.commit()
+    return document_id, [str(chunk_id) for chunk_id in chunk_ids]
+
+
+async def _legacy_upsert(session_factory, ids: list[str], embeddings: np.ndarray, vector_type):
+    from sqlalchemy import text
+
+    async with session_factory() as session:
+        for chunk_id, embedding in zip(ids, embeddings):
+            await session.execute(
+                text(
+                    f"UPDATE document_chunks SET embedding = CAST(:embedding AS {vector_type})"
+                    " WHERE id = CAST(:id AS uuid)"
+                ),
+                {"id": chunk_id, "embedding": embedding},
+            )
+        await session.commit()
+
+
+async def _legacy_delete(session_factory, ids: list[str]):
+    from sqlalchemy import text
+
+    async with session_factory() as session:
+        await session.execute(
+            text("UPDATE document_chunks SET embedding = NULL WHERE CAST(id AS text) = ANY(:ids)"),
+            {"ids": ids},
+        )
+        await session.commit()
+
+
+def _report(label: str, rows: int, seconds: float) -> None:
+    print(f"  {label:<26} {seconds:8.2f}s  {rows / seconds:10.0f} rows/s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--legacy-max", type=int, default=10000)
+    args = parser.parse_args()
+
+    from sqlalchemy import text
+
+    from app.core.config import get_settings
+    from app.db.engine import dispose_engine, get_session_factory
+    from app.providers.vectorstore.pgvector_store import PgVectorStore
+
+    settings = get_settings()
+    dimension = settings.embedding.dimension
+    session_factory = get_session_factory()
+    try:
+        for rows in args.rows:
+            document_id, ids = await _create_chunks(session_factory, rows, dimension)
+            embeddings = _random_embeddings(rows, dimension, seed=1)
+            print(f"{rows} chunks, {settings.embedding.column_type}")
+            try:
+                if rows <= args.legacy_max:
+                    started = time.perf_counter()
+                    await _legacy_upsert(
+                        session_factory, ids, embeddings, settings.embedding.sql_type
+                    )
+                    _report("upsert, per row", rows, time.perf_counter() - started)
+                    started = time.perf_counter()
+                    await _legacy_delete(session_factory, ids)
+                    _report("delete, CAST(id AS text)", rows, time.perf_counter() - started)
+                for batch_size in args.batch_sizes:
+                    store = PgVectorStore(
+                        session_factory,
+                        vector_type=settings.embedding.sql_type,
+                        dimension=dimension,
+                        write_batch_size=batch_size,
+                    )
+                    started = time.perf_counter()
+                    await store.upsert(ids, embeddings, [""] * rows, [{}] * rows)
+                    _report(f"upsert, batch {batch_size}", rows, time.perf_counter() - started)
+                    started = time.perf_counter()
+                    await store.delete(ids)
+                    _report(f"delete, batch {batch_size}", rows, time.perf_counter() - started)
+            finally:
+                async with session_factory() as session:
+                    await session.execute(
+                        text("DELETE FROM documents WHERE id = :id"), {"id": document_id}
+                    )
+                    await session.commit()
+    finally:
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+"""Rebuild the in-process BM25 keyword index from document_chunks.
+
+Ingestion keeps the index current incrementally; run this on first deploy
+of KEYWORD_SEARCH_PROVIDER=bm25, after a restore, or after changing the
+tokenizer.
+
+Usage: python scripts/build_bm25_index.py [--index-path DIR]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.config import get_settings
+from app.db.engine import dispose_engine, get_session_factory
+from app.providers.keyword_search.bm25_search import Bm25KeywordSearchProvider
+
+
+async def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--index-path", default=settings.keyword_search.index_path)
+    args = parser.parse_args()
+
+    provider = Bm25KeywordSearchProvider(args.index_path)
+    started = time.perf_counter()
+    try:
+        count = await provider.rebuild(get_session_factory())
+    finally:
+        await dispose_engine()
+    print(f"Indexed {count} chunks into {args.index_path} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+"""Rebuild the in-process vector index from the embeddings in document_chunks.
+
+Ingestion keeps the index current incrementally; run this on first deploy
+of VECTORSTORE_PROVIDER=mmap, after a restore, or to compact the index.
+
+Usage: python scripts/build_vector_index.py [--index-path DIR]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.config import get_settings
+from app.db.engine import dispose_engine, get_session_factory
+from app.providers.vectorstore.mmap_store import MmapVectorStore
+
+
+async def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--index-path", default=settings.vectorstore.index_path)
+    args = parser.parse_args()
+
+    store = MmapVectorStore(args.index_path, dimension=settings.embedding.dimension)
+    started = time.perf_counter()
+    try:
+        count = await store.rebuild(get_session_factory())
+    finally:
+        await dispose_engine()
+    print(f"Indexed {count} chunks into {args.index_path} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+"""Concurrent chat-stream load test.
+
+Opens N simultaneous /chat/stream requests and reports how many were streaming
+at the same time. With the pipeline holding connections only for short reads
+and writes, peak concurrency should exceed the DB pool capacity
+(pool_size + max_overflow = 30) without pool timeouts.
+
+Usage: python scripts/load_test_chat.py --concurrency 100 --url http://localhost:8000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+POOL_CAPACITY = 30  # pool_size=20 + max_overflow=10 in app/db/engine.py
+
+
+class Tracker:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    def enter(self) -> None:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+
+    def leave(self) -> None:
+        self.active -= 1
+
+
+async def one_stream(
+    client: httpx.AsyncClient, url: str, message: str, tracker: Tracker, start: asyncio.Event
+) -> tuple[float | None, float, bool]:
+    await start.wait()
+    started = time.perf_counter()
+    first_event = None
+    streaming = False
+    try:
+        async with client.stream(
+            "POST", f"{url}/api/v1/chat/stream", json={"message": message}
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if first_event is None and line.startswith("event:"):
+                    first_event = time.perf_counter() - started
+                    tracker.enter()
+                    streaming = True
+                if line.startswith("event: error"):
+                    return first_event, time.perf_counter() - started, False
+        return first_event, time.perf_counter() - started, True
+    except httpx.HTTPError:
+        return first_event, time.perf_counter() - started, False
+    finally:
+        if streaming:
+            tracker.leave()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--message", default="How do I clean the lint trap on my dryer?")
+    parser.add_argument("--api-key", default="")
+    args = parser.parse_args()
+
+    headers = {"X-API-Key": args.api_key} if args.api_key else {}
+    limits = httpx.Limits(max_connections=args.concurrency)
+    tracker = Tracker()
+    start = asyncio.Event()
+
+    async with httpx.AsyncClient(timeout=120, limits=limits, headers=headers) as client:
+        tasks = [
+            asyncio.create_task(one_stream(client, args.url, args.message, tracker, start))
+            for _ in range(args.concurrency)
+        ]
+        wall = time.perf_counter()
+        start.set()
+        results = await asyncio.gather(*tasks)
+        wall = time.perf_counter() - wall
+
+    ok = [r for r in results if r[2]]
+    ttfe = [r[0] for r in results if r[0] is not None]
+    totals = [r[1] for r in ok]
+
+    print(f"Requests:             {len(results)} ({len(ok)} ok, {len(results) - len(ok)} failed)")
+    print(f"Wall time:            {wall:.2f}s")
+    print(f"Peak concurrent SSE:  {tracker.peak} (DB pool capacity {POOL_CAPACITY})")
+    if ttfe:
+        print(f"First event p50/max:  {statistics.median(ttfe):.3f}s / {max(ttfe):.3f}s")
+    if totals:
+        print(f"Stream total p50/max: {statistics.median(totals):.3f}s / {max(totals):.3f}s")
+    if tracker.peak > POOL_CAPACITY and len(ok) == len(results):
+        print("PASS: concurrency is not bounded by the DB pool")
+    else:
+        print("Concurrency did not exceed pool capacity — raise --concurrency or check for pool timeouts")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+"""Score parity between the int8 ONNX providers and the PyTorch models.
+
+Downloads and exports the default models on first run; skipped unless the
+``onnx`` extra and sentence-transformers are installed and the Hugging Face
+Hub is reachable.
+"""
+
+import math
+
+import pytest
+
+pytest.importorskip("onnxruntime")
+pytest.importorskip("optimum.onnxruntime")
+pytest.importorskip("sentence_transformers")
+
+from app.providers.embeddings.onnx_embeddings import OnnxEmbeddingProvider
+from app.providers.embeddings.sentence_transformer_embeddings import (
+    SentenceTransformerEmbeddingProvider,
+)
+from app.providers.reranker.cross_encoder_reranker import CrossEncoderReranker
+from app.providers.reranker.onnx_reranker import OnnxCrossEncoderReranker
+
+QUERY = "How do I clean the lint trap on my dryer?"
+DOCUMENTS = [
+    "To clean the lint trap, open the door and pull the screen up.",
+    "The lint trap should be cleaned after every load.",
+    "Maintenance schedule recommends weekly deep cleaning.",
+    "The warranty covers parts and labour for two years.",
+    "Reset the control panel by holding the start button for five seconds.",
+]
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b, strict=True))
+    return dot / (math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b)))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _hub_reachable():
+    from huggingface_hub import model_info
+
+    try:
+        model_info("cross-encoder/ms-marco-MiniLM-L-6-v2", timeout=5)
+    except Exception as e:
+        pytest.skip(f"Hugging Face Hub unreachable: {e}")
+
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory):
+    return str(tmp_path_factory.mktemp("onnx"))
+
+
+class TestOnnxEmbeddingParity:
+    async def test_embeddings_match_pytorch(self, cache_dir):
+        reference = await SentenceTransformerEmbeddingProvider().embed_texts([QUERY, *DOCUMENTS])
+        quantized = await OnnxEmbeddingProvider(cache_dir=cache_dir).embed_texts(
+            [QUERY, *DOCUMENTS]
+        )
+        for ref, q in zip(reference, quantized, strict=True):
+            assert _cosine(ref, q) > 0.98
+
+
+class TestOnnxRerankerParity:
+    async def test_scores_and_ranking_match_pytorch(self, cache_dir):
+        reference = await CrossEncoderReranker().rerank(QUERY, DOCUMENTS, top_k=len(DOCUMENTS))
+        quantized = await OnnxCrossEncoderReranker(cache_dir=cache_dir).rerank(
+            QUERY, DOCUMENTS, top_k=len(DOCUMENTS)
+        )
+        assert reference[0].index == quantized[0].index
+        by_index = {r.index: r.score for r in quantized}
+        for r in reference:
+            assert abs(r.score - by_index[r.index]) < 0.05
@@ -0,0 +1,294 @@
+"""Tests for the semantic answer cache and where the pipeline consults it."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import Settings
+from app.db.repositories.answer_cache_repo import AnswerCacheRepository
+from app.providers.base import LLMMessage
+from app.services import answer_cache as answer_cache_module
+from app.services.answer_cache import CachedAnswer, SemanticAnswerCache
+from app.services.rag_pipeline import RAGPipeline
+from app.services.session_manager import ConversationContext
+
+_ENTRY = SimpleNamespace(
+    query="How do I clean the lint trap?",
+    answer="Pull it out and wipe it.",
+    confidence_tier="ANSWER",
+    sources=[{"title": "Dryer manual"}],
+)
+
+
+class _NullSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _cache_returning(monkeypatch, nearest) -> SemanticAnswerCache:
+    class _Repository:
+        def __init__(self, session):
+            pass
+
+        async def find_nearest(self, embedding, max_age_seconds):
+            _Repository.max_age_seconds = max_age_seconds
+            return nearest
+
+    monkeypatch.setattr(answer_cache_module, "AnswerCacheRepository", _Repository)
+    cache = SemanticAnswerCache(_NullSession, Settings())
+    cache.repository = _Repository
+    return cache
+
+
+class TestSemanticAnswerCache:
+    async def test_hit_at_threshold(self, monkeypatch):
+        threshold = Settings().answer_cache.similarity_threshold
+        cache = _cache_returning(monkeypatch, (_ENTRY, threshold))
+
+        hit = await cache.lookup(np.ones(3, dtype=np.float32))
+
+        assert hit == CachedAnswer(
+            answer=_ENTRY.answer,
+            confidence_tier=_ENTRY.confidence_tier,
+            similarity=threshold,
+            sources=_ENTRY.sources,
+        )
+
+    async def test_miss_below_threshold(self, monkeypatch):
+        threshold = Settings().answer_cache.similarity_threshold
+        cache = _cache_returning(monkeypatch, (_ENTRY, threshold - 0.01))
+        assert await cache.lookup(np.ones(3, dtype=np.float32)) is None
+
+    async def test_miss_when_empty(self, monkeypatch):
+        cache = _cache_returning(monkeypatch, None)
+        assert await cache.lookup(np.ones(3, dtype=np.float32)) is None
+
+    async def test_lookup_uses_ttl_as_max_age(self, monkeypatch):
+        cache = _cache_returning(monkeypatch, None)
+        await cache.lookup(np.ones(3, dtype=np.float32))
+        assert cache.repository.max_age_seconds == cache.settings.answer_cache.ttl_seconds
+
+    async def test_failure_is_a_miss(self, monkeypatch):
+        class _Broken:
+            def __init__(self, session):
+                pass
+
+            async def find_nearest(self, embedding, max_age_seconds):
+                raise ConnectionError("database unavailable")
+
+        monkeypatch.setattr(answer_cache_module, "AnswerCacheRepository", _Broken)
+        cache = SemanticAnswerCache(_NullSession, Settings())
+        assert await cache.lookup(np.ones(3, dtype=np.float32)) is None
+
+    async def test_invalidate_clears_entries(self, monkeypatch):
+        cleared = []
+
+        async def clear(self):
+            cleared.append(self.session)
+            return 3
+
+        monkeypatch.setattr(AnswerCacheRepository, "clear", clear)
+        db = object()
+        await SemanticAnswerCache.invalidate(db)
+        assert cleared == [db]
+
+
+class _Result:
+    def first(self):
+        return None
+
+
+class _StatementSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _Result()
+
+
+class TestFindNearest:
+    async def test_entries_older_than_max_age_are_excluded(self):
+        session = _StatementSession()
+        before = datetime.now(UTC)
+
+        await AnswerCacheRepository(session).find_nearest(
+            np.ones(3, dtype=np.float32), max_age_seconds=3600
+        )
+
+        compiled = session.statements[0].compile(dialect=postgresql.dialect())
+        assert "answer_cache.created_at >= %(created_at_1)s" in str(compiled)
+        cutoff = compiled.params["created_at_1"]
+        assert before - timedelta(seconds=3601) < cutoff <= datetime.now(UTC) - timedelta(
+            seconds=3600
+        )
+        assert "ORDER BY answer_cache.embedding <=>" in str(compiled)
+
+
+class _RecordingAnswerCache:
+    def __init__(self, hit: CachedAnswer | None):
+        self.hit = hit
+        self.lookups = 0
+        self.stored = []
+
+    async def lookup(self, query_embedding):
+        self.lookups += 1
+        return self.hit
+
+    async def store(self, query, query_embedding, answer, confidence_tier, sources):
+        self.stored.append(query)
+
+
+class _Embeddings:
+    async def embed_query(self, text):
+        return np.ones(3, dtype=np.float32)
+
+
+class TestPipelineGating:
+    _hit = CachedAnswer(
+        answer="Pull it out and wipe it.", confidence_tier="ANSWER", similarity=0.99
+    )
+
+    def _pipeline(self, monkeypatch, cache: _RecordingAnswerCache) -> tuple[RAGPipeline, list]:
+        pipeline = RAGPipeline(
+            llm=None,
+            embeddings=_Embeddings(),
+            vector_store=None,
+            reranker=None,
+            keyword_search=None,
+            settings=Settings(),
+            session_factory=_NullSession,
+            answer_cache=cache,
+        )
+        persisted = []
+
+        async def persist(session_id, content, confidence_tier, sources=None, **kwargs):
+            persisted.append((content, confidence_tier))
+
+        async def no_candidates(query, context, timer, deadline, *args):
+            return query, [], []
+
+        monkeypatch.setattr(pipeline, "_persist", persist)
+        monkeypatch.setattr(pipeline, "_rewrite_and_retrieve", no_candidates)
+        return pipeline, persisted
+
+    async def _events(self, pipeline: RAGPipeline, context: ConversationContext, **kwargs):
+        return [
+            event
+            async for event in pipeline.run(
+                "How do I clean the lint trap?", "session", context=context, **kwargs
+            )
+        ]
+
+    async def test_opening_turn_replays_cached_answer(self, monkeypatch):
+        cache = _RecordingAnswerCache(self._hit)
+        pipeline, persisted = self._pipeline(monkeypatch, cache)
+
+        events = await self._events(pipeline, ConversationContext())
+
+        assert cache.lookups == 1
+        assert events[0]["data"]["cached"] is True
+        assert events[1] == {"event": "delta", "data": {"content": self._hit.answer}}
+        assert persisted == [(self._hit.answer, "ANSWER")]
+
+    @pytest.mark.parametrize(
+        ("context", "filters"),
+        [
+            (
+                ConversationContext(
+                    messages=[
+                        LLMMessage(role="user", content="My dryer is slow."),
+                        LLMMessage(role="assistant", content="Check the lint trap."),
+                    ]
+                ),
+                None,
+            ),
+            (ConversationContext(), {"product": "dryer"}),
+        ],
+        ids=["follow-up-turn", "filtered"],
+    )
+    async def test_cache_is_bypassed(self, monkeypatch, context, filters):
+        cache = _RecordingAnswerCache(self._hit)
+        pipeline, _ = self._pipeline(monkeypatch, cache)
+
+        events = await self._events(pipeline, context, filters=filters)
+
+        assert cache.lookups == 0
+        assert events[0]["data"]["confidence_tier"] == "OFF_TOPIC"
+
+
+class TestIngestionInvalidates:
+    async def test_ingest_invalidates_answer_cache(self, monkeypatch):
+        pytest.importorskip("bs4")
+        from app.services import ingestion_pipeline
+        from app.services.ingestion_pipeline import IngestionPipeline
+
+        events = []
+        doc = SimpleNamespace(
+            id="doc", source_type="text", source_uri="manual.txt", status="pending"
+        )
+
+        class _Documents:
+            def __init__(self, db):
+                pass
+
+            async def get(self, document_id):
+                return doc
+
+            async def update_status(self, document_id, status):
+                doc.status = status
+
+        class _Chunks:
+            def __init__(self, db):
+                pass
+
+            async def create_staging_table(self):
+                pass
+
+            async def copy_to_staging(self, *args):
+                pass
+
+            async def insert_from_staging(self):
+                return 1
+
+        class _Loader:
+            def load(self, uri):
+                return [SimpleNamespace(text="Clean the lint trap after every load.", metadata={})]
+
+        class _RetrievalCache:
+            async def bump_corpus_version(self):
+                events.append("corpus_version_bumped")
+
+        class _Db:
+            async def commit(self):
+                events.append("commit")
+
+            async def rollback(self):
+                events.append("rollback")
+
+        async def invalidate(db):
+            events.append("answer_cache_invalidated")
+
+        class _Embedder:
+            async def embed_texts(self, texts):
+                return np.ones((len(texts), 3), dtype=np.float32)
+
+        monkeypatch.setattr(ingestion_pipeline, "DocumentRepository", _Documents)
+        monkeypatch.setattr(ingestion_pipeline, "ChunkRepository", _Chunks)
+        monkeypatch.setattr(ingestion_pipeline, "get_loader", lambda source_type: _Loader())
+        monkeypatch.setattr(ingestion_pipeline, "get_retrieval_cache", _RetrievalCache)
+        monkeypatch.setattr(SemanticAnswerCache, "invalidate", staticmethod(invalidate))
+
+        await IngestionPipeline(_Embedder(), _Db()).ingest(
+            "6f1c1f43-3c5b-4c8e-9d8a-8b1b0a0f3a11"
+        )
+
+        assert doc.status == "ready"
+        # Invalidated inside the transaction that publishes the new chunks.
+        assert events[-3:] == ["answer_cache_invalidated", "commit", "corpus_version_bumped"]
@@ -0,0 +1,116 @@
+"""Tests for dynamic micro-batching."""
+
+import asyncio
+
+from app.core.batching import MicroBatcher
+from app.providers.embeddings.batching_embeddings import BatchingEmbeddingProvider
+from app.providers.reranker.cross_encoder_reranker import CrossEncoderReranker
+
+
+class _RecordingEmbeddings:
+    dimension = 2
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(texts)
+        return [[float(len(t)), 0.0] for t in texts]
+
+    async def embed_query(self, text: str) -> list[float]:
+        return (await self.embed_texts([text]))[0]
+
+
+class TestMicroBatcher:
+    async def test_concurrent_submits_share_one_call(self):
+        calls: list[list[int]] = []
+
+        async def double(items: list[int]) -> list[int]:
+            calls.append(items)
+            return [i * 2 for i in items]
+
+        batcher = MicroBatcher(double, max_batch_size=16, max_wait_ms=5)
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(5)])
+        assert results == [0, 2, 4, 6, 8]
+        assert calls == [[0, 1, 2, 3, 4]]
+
+    async def test_full_batch_dispatched_without_waiting(self):
+        calls: list[list[int]] = []
+
+        async def echo(items: list[int]) -> list[int]:
+            calls.append(items)
+            return items
+
+        batcher = MicroBatcher(echo, max_batch_size=2, max_wait_ms=10_000)
+        results = await asyncio.wait_for(
+            asyncio.gather(*[batcher.submit(i) for i in range(4)]), timeout=1
+        )
+        assert results == [0, 1, 2, 3]
+        assert calls == [[0, 1], [2, 3]]
+
+    async def test_error_fails_every_item_in_batch(self):
+        async def fail(items: list[int]) -> list[int]:
+            raise RuntimeError("model unavailable")
+
+        batcher = MicroBatcher(fail, max_wait_ms=1)
+        results = await asyncio.gather(
+            batcher.submit(1), batcher.submit(2), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+class TestBatchingEmbeddingProvider:
+    async def test_queries_batched_into_embed_texts(self):
+        inner = _RecordingEmbeddings()
+        provider = BatchingEmbeddingProvider(inner, max_wait_ms=5)
+        vectors = await asyncio.gather(
+            provider.embed_query("a"), provider.embed_query("bbb")
+        )
+        assert vectors == [[1.0, 0.0], [3.0, 0.0]]
+        assert inner.batches == [["a", "bbb"]]
+        assert provider.dimension == 2
+
+
+class TestConcurrencyLimit:
+    async def test_items_queue_while_backend_busy(self):
+        calls: list[list[int]] = []
+        release = asyncio.Event()
+
+        async def slow(items: list[int]) -> list[int]:
+            calls.append(items)
+            if len(calls) == 1:
+                await release.wait()
+            return items
+
+        batcher = MicroBatcher(slow, max_batch_size=8, max_wait_ms=1, max_concurrent_batches=1)
+        first = asyncio.create_task(batcher.submit(0))
+        await asyncio.sleep(0.01)
+        rest = [asyncio.create_task(batcher.submit(i)) for i in range(1, 4)]
+        await asyncio.sleep(0.01)
+        assert batcher.queue_depth == 3
+        release.set()
+        assert await asyncio.gather(first, *rest) == [0, 1, 2, 3]
+        assert calls == [[0], [1, 2, 3]]
+
+
+class _FakeCrossEncoder:
+    def __init__(self):
+        self.calls: list[int] = []
+
+    def predict(self, pairs, batch_size, show_progress_bar):
+        self.calls.append(len(pairs))
+        return [float(len(doc)) for _, doc in pairs]
+
+
+class TestCrossEncoderBatching:
+    async def test_concurrent_requests_share_predict_call(self):
+        reranker = CrossEncoderReranker(max_batch_size=64, max_wait_ms=5)
+        model = _FakeCrossEncoder()
+        reranker._model = model
+        first, second = await asyncio.gather(
+            reranker.rerank("q1", ["a", "aaa", "aa"], top_k=2),
+            reranker.rerank("q2", ["bbbb", "b"], top_k=1),
+        )
+        assert model.calls == [5]
+        assert [r.text for r in first] == ["aaa", "aa"]
+        assert [r.index for r in second] == [0]
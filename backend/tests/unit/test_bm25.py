@@ -0,0 +1,106 @@
+"""Tests for the in-process BM25 keyword index."""
+
+import numpy as np
+
+from app.providers.keyword_search.bm25_index import Bm25Index, tokenize
+from app.providers.keyword_search.bm25_search import Bm25KeywordSearchProvider
+
+
+def _dense_scores(index: Bm25Index, query: str) -> dict[str, float]:
+    """Score every document by summing impacts over all query terms."""
+    scores = np.zeros(len(index), dtype=np.float64)
+    for term in set(tokenize(query)):
+        if term in index._term_ids:
+            t = index._term_ids[term]
+            start, end = index.offsets[t], index.offsets[t + 1]
+            np.add.at(scores, index.doc_ids[start:end], index.impacts[start:end])
+    return {str(index.chunk_ids[i]): s for i, s in enumerate(scores) if s > 0}
+
+
+class TestTokenize:
+    def test_drops_stopwords_and_stems(self):
+        assert tokenize("How do I reset the passwords?") == ["reset", "password"]
+
+    def test_query_and_document_forms_match(self):
+        assert tokenize("billing invoices") == tokenize("billed invoice")
+
+
+class TestBm25Index:
+    def test_rare_term_outranks_common_term(self):
+        index = Bm25Index.empty().updated(
+            ["a", "b", "c"],
+            ["refund policy", "account policy", "account settings"],
+        )
+        results = index.search("refund account", top_k=3)
+        assert results[0][0] == "a"
+        assert {cid for cid, _ in results} == {"a", "b", "c"}
+
+    def test_maxscore_matches_exhaustive_scoring(self):
+        rng = np.random.default_rng(0)
+        vocab = [f"w{i}" for i in range(200)]
+        weights = 1 / np.arange(1, len(vocab) + 1)
+        weights /= weights.sum()
+        docs = [" ".join(rng.choice(vocab, size=30, p=weights)) for _ in range(500)]
+        index = Bm25Index.empty().updated([str(i) for i in range(len(docs))], docs)
+
+        for _ in range(25):
+            query = " ".join(rng.choice(vocab, size=4, p=weights))
+            expected = sorted(_dense_scores(index, query).values(), reverse=True)[:10]
+            got = [score for _, score in index.search(query, top_k=10)]
+            np.testing.assert_allclose(got, expected, rtol=1e-5)
+
+    def test_updates_replace_and_delete(self):
+        index = Bm25Index.empty().updated(["a", "b"], ["shipping times", "return window"])
+        index = index.updated(["a"], ["gift cards"], delete_ids=["b"])
+        assert index.search("shipping return") == []
+        assert index.search("gift")[0][0] == "a"
+        assert len(index) == 1
+        assert "shipping" not in index._term_ids
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        index = Bm25Index.empty().updated(["a", "b"], ["shipping times", "return window"])
+        index.save(tmp_path / "bm25.npz")
+        loaded = Bm25Index.load(tmp_path / "bm25.npz")
+        assert loaded.search("return shipping") == index.search("return shipping")
+
+
+class TestBm25KeywordSearchProvider:
+    async def test_missing_index_returns_nothing(self, tmp_path):
+        provider = Bm25KeywordSearchProvider(str(tmp_path / "absent"))
+        assert await provider.search("anything") == []
+
+    async def test_other_workers_see_published_updates(self, tmp_path):
+        writer = Bm25KeywordSearchProvider(str(tmp_path))
+        reader = Bm25KeywordSearchProvider(str(tmp_path))
+        await writer.add_documents(["a", "b"], ["reset password", "change email"])
+        assert [r.chunk_id for r in await reader.search("password")] == ["a"]
+
+        await writer.delete(["a"])
+        await writer.index("c", "password expiry", {})
+        results = await reader.search("password")
+        assert [r.chunk_id for r in results] == ["c"]
+        assert results[0].text == ""
+
+    async def test_reload_runs_off_the_event_loop(self, tmp_path, monkeypatch):
+        import threading
+
+        from app.providers.keyword_search import bm25_search
+
+        writer = Bm25KeywordSearchProvider(str(tmp_path))
+        reader = Bm25KeywordSearchProvider(str(tmp_path))
+        await writer.add_documents(["a"], ["reset password"])
+        loop_thread = threading.get_ident()
+        loaded_in = []
+        load = Bm25Index.load
+
+        def recording_load(path):
+            loaded_in.append(threading.get_ident())
+            return load(path)
+
+        monkeypatch.setattr(bm25_search.Bm25Index, "load", staticmethod(recording_load))
+
+        await reader.search("password")
+        await reader.search("password")  # unchanged file: served from memory
+
+        assert len(loaded_in) == 1
+        assert loaded_in[0] != loop_thread
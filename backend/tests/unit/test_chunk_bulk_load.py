@@ -0,0 +1,89 @@
+"""Tests for COPY-based chunk bulk loading and the generated tsv column."""
+
+import ast
+import json
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+from app.db.repositories.chunk_repo import ChunkRepository
+from app.models.document import CHUNK_TSV_EXPRESSION, DocumentChunk
+
+
+class _Result:
+    rowcount = 2
+
+
+class _FakeSession:
+    def __init__(self):
+        self.statements: list[str] = []
+        self.copies: list[dict] = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+        return _Result()
+
+    async def connection(self):
+        session = self
+
+        class _Driver:
+            async def copy_records_to_table(self, table, *, records, columns):
+                session.copies.append({"table": table, "records": records, "columns": columns})
+
+        class _Raw:
+            driver_connection = _Driver()
+
+        class _Connection:
+            async def get_raw_connection(self):
+                return _Raw()
+
+        return _Connection()
+
+
+class TestChunkBulkLoad:
+    async def test_batches_copied_then_inserted_in_one_statement(self):
+        session = _FakeSession()
+        repo = ChunkRepository(session)
+        document_id = uuid.uuid4()
+        ids = [uuid.uuid4(), uuid.uuid4()]
+        embeddings = np.ones((2, 3), dtype=np.float32)
+
+        await repo.create_staging_table()
+        await repo.copy_to_staging(
+            document_id, ids, [0, 1], ["a", "b"], embeddings, [{"title": "T"}, {}]
+        )
+        assert await repo.insert_from_staging() == 2
+
+        (copy,) = session.copies
+        assert copy["columns"][-2:] == ("embedding", "metadata")
+        first = copy["records"][0]
+        assert first[:4] == (ids[0], document_id, 0, "a")
+        assert np.shares_memory(first[4], embeddings)  # rows go to the codec unconverted
+        assert json.loads(first[5]) == {"title": "T"}
+
+        create, insert = session.statements
+        assert "ON COMMIT DROP" in create
+        assert "tsv" not in insert  # generated by Postgres
+
+
+class TestGeneratedTsv:
+    def test_model_matches_migration(self):
+        path = (
+            Path(__file__).resolve().parents[2]
+            / "alembic"
+            / "versions"
+            / "007_generated_weighted_tsv.py"
+        )
+        # Read the constant without importing the migration (it needs alembic.op).
+        module = ast.parse(path.read_text())
+        (expression,) = [
+            ast.literal_eval(node.value)
+            for node in module.body
+            if isinstance(node, ast.Assign) and node.targets[0].id == "_TSV_EXPRESSION"
+        ]
+        assert expression == CHUNK_TSV_EXPRESSION
+
+        computed = DocumentChunk.__table__.c.tsv.computed
+        assert computed.persisted
+        assert "metadata->>'title'" in str(computed.sqltext)
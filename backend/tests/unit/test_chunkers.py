@@ -29,6 +29,14 @@ class TestFixedSizeChunker:
         chunks = chunker.chunk("Hello", metadata={"source": "test"})
         assert chunks[0].metadata["source"] == "test"
 
+    def test_chunks_record_their_section_heading(self):
+        chunker = FixedSizeChunker(chunk_size=60, overlap=0)
+        text = "# Setup\n\n" + "Plug it in. " * 8 + "\n\n## Reset\n\n" + "Hold the button. " * 8
+        chunks = chunker.chunk(text)
+        assert chunks[0].metadata["heading"] == "Setup"
+        assert chunks[-1].metadata["heading"] == "Reset"
+        assert "heading" not in chunker.chunk("No headings here.")[0].metadata
+
     def test_empty_text(self):
         chunker = FixedSizeChunker(chunk_size=100)
         chunks = chunker.chunk("")
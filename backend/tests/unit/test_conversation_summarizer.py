@@ -0,0 +1,159 @@
+"""Tests for the rolling conversation summary and the context it leaves in the prompt."""
+
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.core.config import Settings
+from app.providers.base import LLMResponse
+from app.services import conversation_summarizer
+from app.services.conversation_summarizer import ConversationSummarizer
+from app.services.session_manager import SessionManager
+
+_START = datetime(2026, 1, 1, 12, 0)
+
+
+class _FakeRepository:
+    def __init__(self):
+        self.session = SimpleNamespace(id=uuid.uuid4(), metadata_={})
+        self.messages: list[SimpleNamespace] = []
+
+    def add(self, count: int) -> None:
+        for _ in range(count):
+            n = len(self.messages)
+            self.messages.append(
+                SimpleNamespace(
+                    role="user" if n % 2 == 0 else "assistant",
+                    content=f"message {n}",
+                    created_at=_START + timedelta(minutes=n),
+                )
+            )
+
+    async def get(self, session_id):
+        return self.session if session_id == self.session.id else None
+
+    async def get_messages_after(self, session_id, after=None):
+        return [m for m in self.messages if after is None or m.created_at > after]
+
+    async def get_recent_messages(self, session_id, limit, after=None):
+        return (await self.get_messages_after(session_id, after))[-limit:]
+
+
+class _FakeDb:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        pass
+
+
+class _SummaryLLM:
+    def __init__(self):
+        self.prompts: list[str] = []
+
+    async def complete(self, messages, *, temperature=None, max_tokens=None):
+        self.prompts.append(messages[-1].content)
+        return LLMResponse(content=f"summary {len(self.prompts)}")
+
+
+def _summarizer(monkeypatch, repo: _FakeRepository) -> tuple[ConversationSummarizer, _SummaryLLM]:
+    monkeypatch.setattr(conversation_summarizer, "SessionRepository", lambda db: repo)
+    llm = _SummaryLLM()
+    return ConversationSummarizer(llm, _FakeDb, Settings()), llm
+
+
+class TestConversationSummarizer:
+    async def test_waits_for_a_full_batch(self, monkeypatch):
+        repo = _FakeRepository()
+        summarizer, llm = _summarizer(monkeypatch, repo)
+        config = summarizer.settings.conversation
+        repo.add(config.recent_messages + config.summary_batch_messages - 1)
+
+        await summarizer.update(str(repo.session.id))
+
+        assert llm.prompts == []
+        assert "summary_through" not in repo.session.metadata_
+
+    async def test_folds_messages_that_left_the_window(self, monkeypatch):
+        repo = _FakeRepository()
+        summarizer, llm = _summarizer(monkeypatch, repo)
+        config = summarizer.settings.conversation
+        repo.add(config.recent_messages + config.summary_batch_messages)
+
+        await summarizer.update(str(repo.session.id))
+
+        (prompt,) = llm.prompts
+        batch = config.summary_batch_messages
+        assert all(f"message {n}" in prompt for n in range(batch))
+        assert f"message {batch}" not in prompt
+        metadata = repo.session.metadata_
+        assert metadata["summary"] == "summary 1"
+        assert metadata["summary_through"] == repo.messages[batch - 1].created_at.isoformat()
+        assert metadata["summary_message_count"] == batch
+
+    async def test_cursor_advances_past_folded_messages(self, monkeypatch):
+        repo = _FakeRepository()
+        summarizer, llm = _summarizer(monkeypatch, repo)
+        config = summarizer.settings.conversation
+        batch = config.summary_batch_messages
+        repo.add(config.recent_messages + batch)
+        await summarizer.update(str(repo.session.id))
+
+        repo.add(batch - 1)
+        await summarizer.update(str(repo.session.id))
+        assert len(llm.prompts) == 1
+
+        repo.add(1)
+        await summarizer.update(str(repo.session.id))
+        second = llm.prompts[1]
+        assert "Existing summary:\nsummary 1" in second
+        assert "message 0\n" not in second
+        assert f"message {batch}" in second
+        assert repo.session.metadata_["summary_message_count"] == 2 * batch
+
+
+class TestContextWindow:
+    def _manager(self, repo: _FakeRepository) -> SessionManager:
+        manager = SessionManager(db=None)
+        manager.repo = repo
+        return manager
+
+    async def test_unsummarised_messages_stay_in_context(self, monkeypatch):
+        repo = _FakeRepository()
+        summarizer, _ = _summarizer(monkeypatch, repo)
+        config = summarizer.settings.conversation
+        total = config.recent_messages + config.summary_batch_messages - 1
+        repo.add(total)
+
+        # Too few have left the window to fold, so they must still be sent verbatim.
+        await summarizer.update(str(repo.session.id))
+        context = await self._manager(repo).get_context(str(repo.session.id), config)
+
+        assert context.summary is None
+        assert [m.content for m in context.messages] == [f"message {n}" for n in range(total)]
+
+    async def test_folded_messages_leave_context(self, monkeypatch):
+        repo = _FakeRepository()
+        summarizer, _ = _summarizer(monkeypatch, repo)
+        config = summarizer.settings.conversation
+        repo.add(config.recent_messages + config.summary_batch_messages)
+
+        await summarizer.update(str(repo.session.id))
+        context = await self._manager(repo).get_context(str(repo.session.id), config)
+
+        assert context.summary == "summary 1"
+        assert len(context.messages) == config.recent_messages
+        assert context.messages[0].content == f"message {config.summary_batch_messages}"
+
+    async def test_without_summary_only_recent_window(self):
+        repo = _FakeRepository()
+        repo.add(20)
+        config = Settings().conversation
+        config.summarize = False
+
+        context = await self._manager(repo).get_context(str(repo.session.id), config)
+
+        assert len(context.messages) == config.recent_messages
@@ -0,0 +1,51 @@
+"""Tests for per-turn latency budgets."""
+
+import asyncio
+
+import pytest
+
+from app.core.config import LatencyBudgetConfig
+from app.services.deadline import Deadline
+
+
+def _budget(**overrides) -> LatencyBudgetConfig:
+    return LatencyBudgetConfig({"total_seconds": 1.0, "rerank_seconds": 0.05, **overrides})
+
+
+class TestLatencyBudgetConfig:
+    def test_channel_override_applied(self):
+        budget = LatencyBudgetConfig(
+            {"total_seconds": 4.0, "rerank_seconds": 1.5, "channels": {"voice": {"total_seconds": 2.0}}}
+        )
+        voice = budget.for_channel("voice")
+        assert voice.total_seconds == 2.0
+        assert voice.rerank_seconds == 1.5
+
+    def test_unknown_channel_uses_base_budget(self):
+        budget = LatencyBudgetConfig({"total_seconds": 4.0})
+        assert budget.for_channel("chat") is budget
+
+
+class TestDeadline:
+    async def test_overrunning_stage_times_out(self):
+        deadline = Deadline(_budget())
+        with pytest.raises(TimeoutError):
+            await deadline.run(asyncio.sleep(1), deadline.budget.rerank_seconds)
+
+    async def test_stage_bounded_by_remaining_total(self):
+        deadline = Deadline(_budget(total_seconds=0.0))
+        assert deadline.timeout(5.0) == 0.0
+
+    async def test_disabled_budget_never_times_out(self):
+        deadline = Deadline(_budget(enabled=False, total_seconds=0.0))
+        assert deadline.timeout(0.01) is None
+        assert await deadline.run(asyncio.sleep(0.02, result="done"), 0.01) == "done"
+
+    def test_fork_keeps_degradations_separate_until_merged(self):
+        deadline = Deadline(_budget())
+        fork = deadline.fork()
+        fork.degrade("rerank_skipped")
+        assert deadline.degraded == []
+        deadline.merge(fork)
+        deadline.merge(fork)
+        assert deadline.degraded == ["rerank_skipped"]
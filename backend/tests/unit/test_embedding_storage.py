@@ -0,0 +1,37 @@
+"""Tests for configurable embedding column type and storage."""
+
+from pgvector.sqlalchemy import HALFVEC, Vector
+
+from app.core.config import EmbeddingSettings
+from app.providers.hybrid_search.postgres_hybrid import PostgresHybridSearchProvider
+
+
+class TestEmbeddingStorage:
+    def test_default_is_float32_vector(self):
+        settings = EmbeddingSettings(dimension=384)
+        assert settings.column_type == "vector(384)"
+        assert settings.cosine_ops == "vector_cosine_ops"
+
+    def test_halfvec_storage(self):
+        settings = EmbeddingSettings(dimension=1536, storage="halfvec")
+        assert settings.column_type == "halfvec(1536)"
+        assert settings.cosine_ops == "halfvec_cosine_ops"
+
+    def test_column_type_follows_settings(self, monkeypatch):
+        from app.core import config
+        from app.models.base import embedding_type
+
+        monkeypatch.setenv("EMBEDDING_DIMENSION", "768")
+        monkeypatch.setenv("EMBEDDING_STORAGE", "halfvec")
+        monkeypatch.setattr(config, "_settings", None)
+        column = embedding_type()
+        assert isinstance(column, HALFVEC) and column.dim == 768
+
+        monkeypatch.setenv("EMBEDDING_STORAGE", "vector")
+        monkeypatch.setattr(config, "_settings", None)
+        assert isinstance(embedding_type(), Vector)
+
+    def test_hybrid_query_casts_to_column_type(self):
+        provider = PostgresHybridSearchProvider(session_factory=None, vector_type="halfvec")
+        assert "CAST(:embedding AS halfvec)" in provider._sql
+        assert "AS vector" not in provider._sql
@@ -0,0 +1,183 @@
+"""Tests for single-round-trip hybrid search and where the pipeline uses it."""
+
+import numpy as np
+
+from app.core.config import Settings
+from app.core.metrics import StageTimer
+from app.providers.base import HybridSearchResult, VectorSearchResult
+from app.providers.hybrid_search.postgres_hybrid import PostgresHybridSearchProvider
+from app.services.deadline import Deadline
+from app.services.rag_pipeline import RAGPipeline
+
+_ROW = ("6f1c1f43-3c5b-4c8e-9d8a-8b1b0a0f3a11", "Clean the lint trap.", {"p": "d"}, 0.03, 1, 2)
+
+
+class _Rows:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def fetchall(self):
+        return self._rows
+
+
+class _RecordingSession:
+    def __init__(self, rows=()):
+        self.calls: list[tuple[str, dict]] = []
+        self._rows = list(rows)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params):
+        self.calls.append((str(statement), params))
+        return _Rows(self._rows)
+
+
+async def _search(session: _RecordingSession, provider=None, **kwargs):
+    provider = provider or PostgresHybridSearchProvider(lambda: session)
+    return await provider.search("lint trap", np.ones(3, dtype=np.float32), **kwargs)
+
+
+class TestHybridSql:
+    async def test_rrf_fuses_both_rankings_in_one_statement(self):
+        session = _RecordingSession()
+        await _search(session, top_k=15, semantic_top_k=20, keyword_top_k=10, rrf_k=60)
+
+        ((sql, params),) = [call for call in session.calls if "set_config" not in call[0]]
+        assert "ROW_NUMBER() OVER (ORDER BY distance) AS rank" in sql
+        assert "ROW_NUMBER() OVER (ORDER BY rank_score DESC) AS rank" in sql
+        assert "COALESCE(1.0 / (:rrf_k + semantic.rank), 0.0)" in sql
+        assert "+ COALESCE(1.0 / (:rrf_k + keyword.rank), 0.0) AS rrf_score" in sql
+        assert "FULL OUTER JOIN keyword ON semantic.id = keyword.id" in sql
+        assert "LIMIT :top_k" in sql
+        assert sql.rstrip().endswith("ORDER BY fused.rrf_score DESC")
+        assert {k: params[k] for k in ("semantic_top_k", "keyword_top_k", "rrf_k", "top_k")} == {
+            "semantic_top_k": 20,
+            "keyword_top_k": 10,
+            "rrf_k": 60,
+            "top_k": 15,
+        }
+
+    async def test_rows_map_to_results(self):
+        results = await _search(_RecordingSession([_ROW]))
+        assert results == [
+            HybridSearchResult(
+                chunk_id=_ROW[0],
+                text=_ROW[1],
+                metadata={"p": "d"},
+                score=0.03,
+                semantic_rank=1,
+                keyword_rank=2,
+            )
+        ]
+
+    async def test_filters_pushed_into_both_rankings(self):
+        session = _RecordingSession()
+        await _search(session, filter_metadata={"product": "dryer"})
+
+        sql, params = session.calls[-1]
+        semantic, keyword = sql.split("keyword_candidates AS (")
+        assert "metadata @> ANY(CAST(CAST(:filter_0" in semantic
+        assert "metadata @> ANY(CAST(CAST(:filter_0" in keyword.split("keyword AS (")[0]
+        assert params["filter_0"] == ['{"product": "dryer"}']
+
+    async def test_ann_settings_applied_before_the_query(self):
+        session = _RecordingSession()
+        provider = PostgresHybridSearchProvider(lambda: session, ef_search=40, probes=1)
+        await _search(session, provider, ef_search=120, probes=8)
+
+        *settings, (query_sql, _) = session.calls
+        assert [(sql.split("'")[1], params["value"]) for sql, params in settings] == [
+            ("hnsw.ef_search", "120"),
+            ("ivfflat.probes", "8"),
+        ]
+        assert "WITH semantic_candidates AS" in query_sql
+
+    async def test_provider_defaults_when_not_overridden(self):
+        session = _RecordingSession()
+        provider = PostgresHybridSearchProvider(lambda: session, ef_search=40, probes=2)
+        await _search(session, provider)
+
+        values = [params["value"] for sql, params in session.calls if "set_config" in sql]
+        assert values == ["40", "2"]
+
+
+class _Embeddings:
+    async def embed_query(self, text):
+        return np.ones(3, dtype=np.float32)
+
+
+class _Ranking:
+    def __init__(self, chunk_id: str):
+        self.chunk_id = chunk_id
+        self.calls = 0
+
+    async def search(self, *args, **kwargs):
+        self.calls += 1
+        return [VectorSearchResult(chunk_id=self.chunk_id, text="t", score=1.0, metadata={})]
+
+
+class _Hybrid:
+    def __init__(self):
+        self.calls = []
+
+    async def search(self, query, query_embedding, top_k=10, **kwargs):
+        self.calls.append({"top_k": top_k, **kwargs})
+        return [HybridSearchResult(chunk_id="fused", text="t", score=0.5, metadata={})]
+
+
+def _pipeline(fusion: str, hybrid_search=None) -> tuple[RAGPipeline, _Ranking, _Ranking]:
+    settings = Settings()
+    settings.retrieval.fusion = fusion
+    vector_store, keyword_search = _Ranking("semantic"), _Ranking("keyword")
+    pipeline = RAGPipeline(
+        llm=None,
+        embeddings=_Embeddings(),
+        vector_store=vector_store,
+        reranker=None,
+        keyword_search=keyword_search,
+        settings=settings,
+        session_factory=None,
+        hybrid_search=hybrid_search,
+    )
+    return pipeline, vector_store, keyword_search
+
+
+async def _retrieve(pipeline: RAGPipeline, **kwargs):
+    deadline = Deadline(pipeline.settings.latency_budget)
+    return await pipeline._retrieve("lint trap", StageTimer(), deadline, **kwargs)
+
+
+class TestPipelineFusion:
+    async def test_sql_fusion_uses_the_provider(self):
+        hybrid = _Hybrid()
+        pipeline, vector_store, keyword_search = _pipeline("sql", hybrid)
+
+        fused = await _retrieve(pipeline, filters={"product": "dryer"})
+
+        assert [item["chunk_id"] for item in fused] == ["fused"]
+        assert fused[0]["rrf_score"] == 0.5
+        assert vector_store.calls == keyword_search.calls == 0
+        (call,) = hybrid.calls
+        assert call["top_k"] == pipeline._rerank_candidates
+        assert call["filter_metadata"] == {"product": "dryer"}
+
+    async def test_python_fusion_when_provider_not_configured(self):
+        pipeline, vector_store, keyword_search = _pipeline("sql", hybrid_search=None)
+
+        fused = await _retrieve(pipeline)
+
+        assert vector_store.calls == keyword_search.calls == 1
+        assert {item["chunk_id"] for item in fused} == {"semantic", "keyword"}
+
+    async def test_python_fusion_setting_ignores_the_provider(self):
+        hybrid = _Hybrid()
+        pipeline, vector_store, _ = _pipeline("python", hybrid)
+
+        await _retrieve(pipeline)
+
+        assert hybrid.calls == []
+        assert vector_store.calls == 1
@@ -0,0 +1,99 @@
+"""Round-trip tests for the local inference server protocol."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.core.exceptions import ProviderError
+from app.inference.client import InferenceClient, RemoteEmbeddingProvider, RemoteReranker
+from app.inference.protocol import (
+    decode_matrix,
+    decode_rerank_request,
+    decode_scores,
+    decode_texts,
+    encode_matrix,
+    encode_rerank_request,
+    encode_scores,
+    encode_texts,
+)
+from app.inference.server import InferenceServer
+from app.providers.base import RerankResult
+
+
+class _FakeEmbeddings:
+    dimension = 3
+
+    async def embed_texts(self, texts: list[str]) -> np.ndarray:
+        return np.array([[float(len(t)), 1.0, 0.5] for t in texts], dtype=np.float32)
+
+    async def embed_query(self, text: str) -> np.ndarray:
+        if text == "boom":
+            raise RuntimeError("model crashed")
+        return (await self.embed_texts([text]))[0]
+
+
+class _FakeReranker:
+    async def rerank(self, query: str, documents: list[str], top_k: int = 5) -> list[RerankResult]:
+        results = [
+            RerankResult(index=i, score=1.0 / (1 + len(d)), text=d) for i, d in enumerate(documents)
+        ]
+        return sorted(results, key=lambda r: r.score, reverse=True)[:top_k]
+
+
+class TestEncoding:
+    def test_texts_round_trip_unicode(self):
+        texts = ["lint trap", "", "café — ñ"]
+        assert decode_texts(encode_texts(texts))[0] == texts
+
+    def test_rerank_request_round_trip(self):
+        assert decode_rerank_request(encode_rerank_request("q", ["a", "b"])) == ("q", ["a", "b"])
+
+    def test_matrix_and_scores_round_trip(self):
+        matrix = decode_matrix(encode_matrix(np.array([[0.5, 1.0], [2.0, -1.0]])))
+        assert matrix.dtype == np.float32
+        assert matrix.tolist() == [[0.5, 1.0], [2.0, -1.0]]
+        assert decode_scores(encode_scores([0.25, 0.75])) == [0.25, 0.75]
+
+    def test_empty_matrix_round_trip(self):
+        matrix = decode_matrix(encode_matrix([], dim=384))
+        assert matrix.shape == (0, 384)
+        assert matrix.dtype == np.float32
+
+
+@pytest.fixture
+async def client(tmp_path):
+    socket_path = str(tmp_path / "inference.sock")
+    server = InferenceServer(_FakeEmbeddings(), _FakeReranker())
+    unix_server = await asyncio.start_unix_server(server.handle_connection, path=socket_path)
+    yield InferenceClient(socket_path, timeout=5)
+    unix_server.close()
+    await unix_server.wait_closed()
+
+
+class TestServerRoundTrip:
+    async def test_concurrent_embeddings_multiplexed(self, client):
+        provider = RemoteEmbeddingProvider(client, dimension=3)
+        vectors = await asyncio.gather(*[provider.embed_query("x" * n) for n in range(1, 6)])
+        assert [v[0] for v in vectors] == [1.0, 2.0, 3.0, 4.0, 5.0]
+        embeddings = await provider.embed_texts(["ab", "abc"])
+        assert embeddings.tolist() == [[2.0, 1.0, 0.5], [3.0, 1.0, 0.5]]
+
+    async def test_empty_batch_embeds_to_empty_matrix(self, client):
+        embeddings = await RemoteEmbeddingProvider(client, dimension=3).embed_texts([])
+        assert embeddings.shape == (0, 3)
+
+    async def test_rerank_scores_returned_in_document_order(self, client):
+        results = await RemoteReranker(client).rerank("q", ["long document", "short", "mid doc"], top_k=2)
+        assert [r.text for r in results] == ["short", "mid doc"]
+        assert results[0].index == 1
+
+    async def test_server_error_raised_as_provider_error(self, client):
+        provider = RemoteEmbeddingProvider(client, dimension=3)
+        with pytest.raises(ProviderError, match="model crashed"):
+            await provider.embed_query("boom")
+        assert await client.ping()
+
+    async def test_unreachable_server(self, tmp_path):
+        client = InferenceClient(str(tmp_path / "missing.sock"))
+        assert not await client.ping()
@@ -0,0 +1,94 @@
+"""Tests for the Prometheus metric helpers and stage timer."""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from prometheus_client import REGISTRY, values
+
+from app.api.v1 import metrics as metrics_api
+from app.core import metrics
+from app.core.metrics import StageTimer, counter, gauge, render_latest
+from app.middleware.auth import APIKeyMiddleware
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestRegistration:
+    def test_same_name_returns_the_existing_metric(self):
+        first = counter("test_registrations_total", "Registrations.", ("result",))
+        assert counter("test_registrations_total", "Registrations.", ("result",)) is first
+
+    def test_callback_gauge_follows_latest_callback(self):
+        gauge("test_queue_depth", "Queue depth.", lambda: 3.0)
+        gauge("test_queue_depth", "Queue depth.", lambda: 5.0)
+        assert _sample("test_queue_depth") == 5.0
+
+    def test_render_exposes_registered_metrics(self):
+        counter("test_rendered_total", "Rendered.", ("result",)).labels(result="hit").inc(2)
+        body, content_type = render_latest()
+        assert content_type.startswith("text/plain")
+        assert b'test_rendered_total{result="hit"} 2.0' in body
+
+
+class TestMultiprocess:
+    def test_scrape_reads_the_shared_directory(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        # The value class is normally chosen from the environment at import time.
+        monkeypatch.setattr(values, "ValueClass", values.MultiProcessValue(lambda: 101))
+        monkeypatch.setattr(metrics, "_METRICS", {})
+        monkeypatch.setattr(metrics, "_CALLBACK_GAUGES", {})
+
+        requests = metrics.counter("test_mp_requests_total", "Requests.", ("result",))
+        depth = metrics.gauge("test_mp_queue_depth", "Queue depth.", lambda: 4.0)
+        try:
+            requests.labels(result="hit").inc()
+            body, _ = metrics.render_latest()
+        finally:
+            REGISTRY.unregister(requests)
+            REGISTRY.unregister(depth)
+
+        assert b'test_mp_requests_total{result="hit"} 1.0' in body
+        assert b"test_mp_queue_depth 4.0" in body
+
+
+class TestStageTimer:
+    def test_observe_labels_by_tier(self):
+        labels = {"stage": "unit_rerank", "confidence_tier": "CAVEAT"}
+        before = _sample("rag_stage_duration_seconds_count", **labels)
+        timer = StageTimer()
+        with timer.stage("unit_rerank"):
+            pass
+        timer.observe("CAVEAT")
+        assert _sample("rag_stage_duration_seconds_count", **labels) == before + 1
+
+    def test_errors_counted_per_stage(self):
+        timer = StageTimer()
+        before = _sample("rag_provider_errors_total", stage="unit_embedding")
+        with pytest.raises(RuntimeError), timer.stage("unit_embedding"):
+            raise RuntimeError("provider down")
+        assert _sample("rag_provider_errors_total", stage="unit_embedding") == before + 1
+        assert "unit_embedding" in timer.durations
+
+    def test_mark_keeps_first_value(self):
+        timer = StageTimer()
+        timer.mark("time_to_first_token")
+        first = timer.durations["time_to_first_token"]
+        timer.mark("time_to_first_token")
+        assert timer.durations["time_to_first_token"] == first
+
+
+class TestMetricsEndpoint:
+    async def test_requires_api_key(self):
+        app = FastAPI()
+        app.add_middleware(APIKeyMiddleware, api_key="secret")
+        app.include_router(metrics_api.router, prefix="/api/v1")
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            anonymous = await client.get("/api/v1/metrics")
+            authorised = await client.get("/api/v1/metrics", headers={"X-API-Key": "secret"})
+
+        assert anonymous.status_code == 401
+        assert authorised.status_code == 200
+        assert "rag_stage_duration_seconds" in authorised.text
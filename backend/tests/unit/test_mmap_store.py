@@ -0,0 +1,139 @@
+"""Tests for the in-process memory-mapped vector index."""
+
+import json
+
+import numpy as np
+
+from app.providers.vectorstore.mmap_store import MmapVectorStore
+from app.services.rag_pipeline import reciprocal_rank_fusion
+
+
+def _unit(*values: float) -> list[float]:
+    v = np.array(values, dtype=np.float32)
+    return (v / np.linalg.norm(v)).tolist()
+
+
+async def _seed(store: MmapVectorStore) -> None:
+    await store.upsert(
+        ids=["a", "b", "c"],
+        embeddings=[_unit(1, 0, 0), _unit(0, 1, 0), _unit(1, 1, 0)],
+        texts=["", "", ""],
+        metadatas=[{}, {}, {}],
+    )
+
+
+class TestMmapVectorStore:
+    async def test_search_returns_ids_and_scores_only(self, tmp_path):
+        store = MmapVectorStore(str(tmp_path), dimension=3)
+        await _seed(store)
+        results = await store.search(_unit(1, 0.1, 0), top_k=2)
+        assert [r.chunk_id for r in results] == ["a", "c"]
+        assert results[0].score > results[1].score
+        assert all(r.text == "" for r in results)
+
+    async def test_missing_index_returns_nothing(self, tmp_path):
+        store = MmapVectorStore(str(tmp_path / "absent"), dimension=3)
+        assert await store.search(_unit(1, 0, 0)) == []
+
+    async def test_other_workers_see_published_updates(self, tmp_path):
+        writer = MmapVectorStore(str(tmp_path), dimension=3)
+        reader = MmapVectorStore(str(tmp_path), dimension=3)
+        await _seed(writer)
+        assert (await reader.search(_unit(0, 0, 1), top_k=1))[0].chunk_id != "d"
+
+        await writer.upsert(["d"], [_unit(0, 0, 1)], [""], [{}])
+        await writer.delete(["a"])
+        results = await reader.search(_unit(0, 0, 1), top_k=5)
+        assert results[0].chunk_id == "d"
+        assert "a" not in {r.chunk_id for r in results}
+        # Old generations are removed once superseded.
+        assert len(list(tmp_path.glob("vectors-*.f32"))) == 1
+
+    async def test_upsert_replaces_existing_vector(self, tmp_path):
+        store = MmapVectorStore(str(tmp_path), dimension=3)
+        await _seed(store)
+        await store.upsert(["b"], [_unit(0, 0, 1)], [""], [{}])
+        results = await store.search(_unit(0, 0, 1), top_k=4)
+        assert len(results) == 3
+        assert results[0].chunk_id == "b"
+
+
+def _manifest(path) -> dict:
+    return json.loads((path / "manifest.json").read_text())
+
+
+class TestIncrementalWrites:
+    async def test_upsert_appends_to_the_current_base(self, tmp_path):
+        store = MmapVectorStore(str(tmp_path), dimension=3)
+        await _seed(store)
+        base = _manifest(tmp_path)["base"]
+        vectors = tmp_path / f"vectors-{base}.f32"
+        inode = vectors.stat().st_ino
+
+        await store.upsert(["d"], [_unit(0, 0, 1)], [""], [{}])
+
+        manifest = _manifest(tmp_path)
+        assert (manifest["base"], manifest["count"], manifest["tombstones"]) == (base, 4, 0)
+        assert vectors.stat().st_ino == inode  # appended in place, not rewritten
+        assert vectors.stat().st_size == 4 * 3 * 4
+
+    async def test_delete_only_records_tombstones(self, tmp_path):
+        store = MmapVectorStore(str(tmp_path), dimension=3)
+        await _seed(store)
+        await store.upsert(["d", "e", "f"], [_unit(0, 0, 1)] * 3, [""] * 3, [{}] * 3)
+        base = _manifest(tmp_path)["base"]
+        size = (tmp_path / f"vectors-{base}.f32").stat().st_size
+
+        await store.delete(["a"])
+
+        manifest = _manifest(tmp_path)
+        assert (manifest["base"], manifest["tombstones"]) == (base, 1)
+        assert (tmp_path / f"vectors-{base}.f32").stat().st_size == size
+        assert "a" not in {r.chunk_id for r in await store.search(_unit(1, 0, 0), top_k=10)}
+
+    async def test_compacts_once_tombstones_pile_up(self, tmp_path):
+        store = MmapVectorStore(str(tmp_path), dimension=3)
+        await _seed(store)
+        base = _manifest(tmp_path)["base"]
+
+        await store.delete(["a"])
+        await store.upsert(["b"], [_unit(0, 0, 1)], [""], [{}])
+
+        manifest = _manifest(tmp_path)
+        assert manifest["base"] != base
+        assert (manifest["count"], manifest["tombstones"]) == (2, 0)
+        assert not (tmp_path / f"vectors-{base}.f32").exists()
+        results = await store.search(_unit(0, 0, 1), top_k=5)
+        assert results[0].chunk_id == "b"
+        assert len(results) == 2
+
+    async def test_reader_on_an_older_generation_is_unaffected_by_appends(self, tmp_path):
+        writer = MmapVectorStore(str(tmp_path), dimension=3)
+        await _seed(writer)
+        snapshot = writer._current()
+
+        await writer.upsert(["d"], [_unit(0, 0, 1)], [""], [{}])
+
+        hits = snapshot.search(np.array(_unit(0, 0, 1), dtype=np.float32), top_k=5)
+        assert {chunk_id for chunk_id, _ in hits} == {"a", "b", "c"}
+
+    async def test_unpublished_rows_are_overwritten(self, tmp_path):
+        store = MmapVectorStore(str(tmp_path), dimension=3)
+        await _seed(store)
+        base = _manifest(tmp_path)["base"]
+        # A writer that died after appending but before publishing.
+        with open(tmp_path / f"vectors-{base}.f32", "ab") as f:
+            np.ones((2, 3), dtype=np.float32).tofile(f)
+
+        await store.upsert(["d"], [_unit(0, 0, 1)], [""], [{}])
+
+        assert (tmp_path / f"vectors-{base}.f32").stat().st_size == 4 * 3 * 4
+        assert (await store.search(_unit(0, 0, 1), top_k=1))[0].chunk_id == "d"
+
+
+class TestFusionWithIdOnlyHits:
+    def test_keyword_text_survives_id_only_vector_hit(self):
+        semantic = [{"chunk_id": "a", "text": "", "score": 0.9, "metadata": {}}]
+        keyword = [{"chunk_id": "a", "text": "Clean the lint trap.", "score": 0.2, "metadata": {}}]
+        fused = reciprocal_rank_fusion(keyword, semantic)
+        assert fused[0]["text"] == "Clean the lint trap."
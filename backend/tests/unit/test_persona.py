@@ -42,3 +42,14 @@ class TestPersonaService:
         msg = persona.build_ambiguity_prompt(["lint trap", "water filter"])
         assert "lint trap" in msg
         assert "water filter" in msg
+
+
+class TestTemplateCache:
+    def test_templates_compiled_once(self):
+        persona = _make_persona()
+        persona.warmup()
+        compiled = dict(persona._templates)
+        persona.build_system_prompt(sources=[], confidence_tier="ANSWER")
+        persona.get_off_topic_message()
+        assert persona._templates == compiled
+        assert {"system_prompt", "off_topic_message"} <= compiled.keys()
@@ -0,0 +1,88 @@
+"""Tests for query rewrite heuristics and caching."""
+
+from app.providers.base import LLMMessage, LLMResponse
+from app.services.query_rewriter import (
+    QueryRewriter,
+    needs_rewrite,
+    references_context,
+    rewrites_equivalent,
+)
+
+
+class _CountingLLM:
+    def __init__(self, reply: str):
+        self.reply = reply
+        self.calls = 0
+
+    async def complete(self, messages, *, temperature=None, max_tokens=None):
+        self.calls += 1
+        return LLMResponse(content=self.reply)
+
+    async def stream(self, messages, *, temperature=None, max_tokens=None):
+        yield self.reply
+
+
+class TestNeedsRewrite:
+    def test_self_contained_question_skips_rewrite(self):
+        assert not needs_rewrite("How do I clean the lint trap on my dryer?")
+
+    def test_pronoun_reference_needs_rewrite(self):
+        assert needs_rewrite("How often should I clean it?")
+
+    def test_follow_up_opener_needs_rewrite(self):
+        assert needs_rewrite("What about the gas model dryer?")
+
+    def test_short_fragment_needs_rewrite(self):
+        assert needs_rewrite("and the filter")
+
+    def test_short_question_is_not_referential(self):
+        assert needs_rewrite("dryer E3 error")
+        assert not references_context("dryer E3 error")
+        assert references_context("What about the gas model dryer?")
+        assert references_context("How often should I clean it?")
+
+
+class TestRewritesEquivalent:
+    def test_same_content_terms_are_equivalent(self):
+        assert rewrites_equivalent("how do I clean the lint trap", "Clean lint trap")
+
+    def test_added_context_is_not_equivalent(self):
+        assert not rewrites_equivalent("how often should I clean it", "how often clean dryer lint trap")
+
+
+class TestQueryRewriter:
+    async def test_rewrite_is_cached_per_context(self):
+        llm = _CountingLLM("dryer lint trap cleaning frequency")
+        rewriter = QueryRewriter(llm)
+        context = [
+            LLMMessage(role="user", content="Where is the lint trap?"),
+            LLMMessage(role="assistant", content="Inside the door."),
+        ]
+
+        first = await rewriter.rewrite("How often do I clean it?", context)
+        second = await rewriter.rewrite("How often do I clean it?", context)
+
+        assert first == second == "dryer lint trap cleaning frequency"
+        assert llm.calls == 1
+
+    async def test_different_context_misses_cache(self):
+        llm = _CountingLLM("rewritten")
+        rewriter = QueryRewriter(llm)
+        await rewriter.rewrite("and it?", [LLMMessage(role="user", content="washer")])
+        await rewriter.rewrite("and it?", [LLMMessage(role="user", content="dryer")])
+        assert llm.calls == 2
+
+    async def test_cache_is_bounded(self):
+        llm = _CountingLLM("rewritten")
+        rewriter = QueryRewriter(llm, cache_size=1)
+        await rewriter.rewrite("first one?", [])
+        await rewriter.rewrite("second one?", [])
+        await rewriter.rewrite("first one?", [])
+        assert llm.calls == 3
+
+    async def test_summary_is_part_of_cache_key(self):
+        llm = _CountingLLM("rewritten")
+        rewriter = QueryRewriter(llm)
+        await rewriter.rewrite("and it?", [], summary="Customer owns a gas dryer.")
+        await rewriter.rewrite("and it?", [], summary="Customer owns a washer.")
+        assert llm.calls == 2
@@ -0,0 +1,300 @@
+"""Tests for RAG pipeline orchestration with fake providers."""
+
+import asyncio
+from typing import ClassVar
+
+import numpy as np
+from prometheus_client import REGISTRY
+
+from app.core.config import LatencyBudgetConfig, Settings
+from app.core.metrics import StageTimer
+from app.db.repositories.chunk_repo import ChunkRepository
+from app.providers.base import LLMMessage, LLMResponse, RerankResult
+from app.services import rag_pipeline
+from app.services.deadline import Deadline
+from app.services.rag_pipeline import RAGPipeline
+from app.services.session_manager import ConversationContext
+
+
+class _NullSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _RewritingLLM:
+    def __init__(self, reply: str):
+        self.reply = reply
+
+    async def complete(self, messages, *, temperature=None, max_tokens=None):
+        return LLMResponse(content=self.reply)
+
+    async def stream(self, messages, *, temperature=None, max_tokens=None):
+        yield self.reply
+
+
+def _speculative(result: str) -> float:
+    return REGISTRY.get_sample_value("rag_speculative_retrievals_total", {"result": result}) or 0.0
+
+
+def _pipeline(llm=None, **kwargs) -> RAGPipeline:
+    providers = {"embeddings": None, "vector_store": None, "reranker": None}
+    return RAGPipeline(
+        llm=llm,
+        keyword_search=None,
+        settings=Settings(),
+        session_factory=_NullSession,
+        **{**providers, **kwargs},
+    )
+
+
+class TestSpeculativeRetrieval:
+    _context = ConversationContext(
+        messages=[
+            LLMMessage(role="user", content="My dryer shows an error."),
+            LLMMessage(role="assistant", content="Which code is displayed?"),
+        ]
+    )
+
+    def _recording_pipeline(self, rewrite: str) -> tuple[RAGPipeline, list[str]]:
+        pipeline = _pipeline(_RewritingLLM(rewrite))
+        retrieved: list[str] = []
+
+        async def retrieve_candidates(query, timer, deadline, query_embedding=None, filters=None):
+            retrieved.append(query)
+            return [{"chunk_id": query}], []
+
+        pipeline._retrieve_candidates = retrieve_candidates
+        return pipeline, retrieved
+
+    async def _resolve(self, pipeline: RAGPipeline, query: str):
+        deadline = Deadline(pipeline.settings.latency_budget)
+        return await pipeline._rewrite_and_retrieve(query, self._context, StageTimer(), deadline)
+
+    async def test_equivalent_rewrite_keeps_speculative_result(self):
+        pipeline, retrieved = self._recording_pipeline("Dryer E3 error")
+        kept = _speculative("kept")
+
+        search_query, fused, _ = await self._resolve(pipeline, "dryer E3 error")
+
+        assert search_query == "dryer E3 error"
+        assert retrieved == ["dryer E3 error"]
+        assert fused == [{"chunk_id": "dryer E3 error"}]
+        assert _speculative("kept") == kept + 1
+
+    async def test_different_rewrite_discards_speculative_result(self):
+        pipeline, retrieved = self._recording_pipeline("dryer E3 error code meaning")
+        discarded = _speculative("discarded")
+
+        search_query, fused, _ = await self._resolve(pipeline, "dryer E3 error")
+
+        assert search_query == "dryer E3 error code meaning"
+        assert retrieved == ["dryer E3 error", "dryer E3 error code meaning"]
+        assert fused == [{"chunk_id": "dryer E3 error code meaning"}]
+        assert _speculative("discarded") == discarded + 1
+
+    async def test_referential_question_does_not_speculate(self):
+        pipeline, retrieved = self._recording_pipeline("how to clear dryer E3 error")
+        before = _speculative("kept") + _speculative("discarded")
+
+        search_query, _, _ = await self._resolve(pipeline, "How do I clear it?")
+
+        assert search_query == "how to clear dryer E3 error"
+        assert retrieved == ["how to clear dryer E3 error"]
+        after = _speculative("kept") + _speculative("discarded")
+        assert after == before
+
+
+class TestHydrate:
+    async def test_filtered_lookup_drops_out_of_scope_chunks(self, monkeypatch):
+        lookups = []
+
+        async def get_texts(self, chunk_ids, filters=None):
+            lookups.append((chunk_ids, filters))
+            return {"in-scope": ("Dryer manual", {"product": "dryer"})}
+
+        monkeypatch.setattr(ChunkRepository, "get_texts", get_texts)
+        pipeline = _pipeline()
+        top_n = pipeline._rerank_candidates
+        fused = [
+            {"chunk_id": "in-scope", "text": "", "metadata": {}},
+            {"chunk_id": "other-product", "text": "", "metadata": {}},
+            *({"chunk_id": f"filler-{i}", "text": "t", "metadata": {}} for i in range(top_n)),
+            {"chunk_id": "unchecked", "text": "", "metadata": {}},
+        ]
+
+        hydrated = await pipeline._hydrate(fused, StageTimer(), {"product": "dryer"})
+
+        assert lookups == [(["in-scope", "other-product"], {"product": "dryer"})]
+        ids = [item["chunk_id"] for item in hydrated]
+        assert ids[0] == "in-scope"
+        assert "other-product" not in ids
+        assert "unchecked" not in ids
+        assert hydrated[0]["text"] == "Dryer manual"
+
+    async def test_unfiltered_tail_is_kept(self, monkeypatch):
+        async def get_texts(self, chunk_ids, filters=None):
+            return {}
+
+        monkeypatch.setattr(ChunkRepository, "get_texts", get_texts)
+        pipeline = _pipeline()
+        fused = [
+            {"chunk_id": f"c{i}", "text": "t", "metadata": {}}
+            for i in range(pipeline._rerank_candidates)
+        ] + [{"chunk_id": "tail", "text": "", "metadata": {}}]
+
+        hydrated = await pipeline._hydrate(fused, StageTimer())
+
+        assert hydrated[-1]["chunk_id"] == "tail"
+
+
+class _RecordingVectorStore:
+    def __init__(self):
+        self.calls = []
+
+    async def search(self, query_embedding, top_k=10, filter_metadata=None, **ann):
+        self.calls.append(ann)
+        return []
+
+
+class _Embeddings:
+    async def embed_query(self, text):
+        return np.ones(3, dtype=np.float32)
+
+
+class TestAnnBreadth:
+    async def _search(self, budget) -> dict:
+        store = _RecordingVectorStore()
+        pipeline = _pipeline(embeddings=_Embeddings(), vector_store=store)
+        await pipeline._semantic_search("lint trap", StageTimer(), Deadline(budget))
+        (call,) = store.calls
+        return call
+
+    async def test_default_budget_keeps_store_settings(self):
+        call = await self._search(Settings().latency_budget)
+        assert call == {"ef_search": None, "probes": None}
+
+    async def test_channel_budget_overrides_ef_search(self):
+        budget = LatencyBudgetConfig({"channels": {"voice": {"hnsw_ef_search": 24}}})
+        call = await self._search(budget.for_channel("voice"))
+        assert call == {"ef_search": 24, "probes": None}
+
+
+class TestRetrievalCoalescing:
+    async def _retrieve_concurrently(self, *budgets) -> list:
+        pipeline = _pipeline()
+        computed = []
+
+        async def compute(query, timer, attempt, *args):
+            computed.append(attempt.budget)
+            await asyncio.sleep(0.01)
+            return [], [], []
+
+        pipeline._compute_candidates = compute
+        await asyncio.gather(
+            *(
+                pipeline._retrieve_candidates("lint trap", StageTimer(), Deadline(budget))
+                for budget in budgets
+            )
+        )
+        return computed
+
+    async def test_same_budget_shares_one_retrieval(self):
+        budget = Settings().latency_budget
+        assert await self._retrieve_concurrently(budget, budget) == [budget]
+
+    async def test_channel_budget_runs_its_own_retrieval(self):
+        chat = LatencyBudgetConfig({"channels": {"voice": {"hnsw_ef_search": 24}}})
+        voice = chat.for_channel("voice")
+
+        computed = await self._retrieve_concurrently(chat, voice)
+
+        assert sorted(b.hnsw_ef_search or 0 for b in computed) == [0, 24]
+
+
+class _TrackedSessionFactory:
+    """Session factory that counts sessions open at any moment."""
+
+    def __init__(self):
+        self.open = 0
+        self.opened = 0
+
+    def __call__(self):
+        factory = self
+
+        class _Session:
+            async def __aenter__(self):
+                factory.open += 1
+                factory.opened += 1
+                return self
+
+            async def __aexit__(self, *exc):
+                factory.open -= 1
+                return False
+
+            async def commit(self):
+                pass
+
+        return _Session()
+
+
+class _RecordingSessionManager:
+    saved: ClassVar[list[str]] = []
+
+    def __init__(self, db):
+        pass
+
+    async def get_context(self, session_id, config):
+        return ConversationContext()
+
+    async def save_assistant_message(self, session_id, content, confidence_tier, sources=None):
+        self.saved.append(content)
+
+
+class _SessionCheckingLLM:
+    def __init__(self, factory: _TrackedSessionFactory):
+        self.factory = factory
+        self.open_during_stream: list[int] = []
+
+    async def stream(self, messages, *, temperature=None, max_tokens=None):
+        for token in ["Pull ", "it ", "out."]:
+            self.open_during_stream.append(self.factory.open)
+            yield token
+
+
+class TestSessionLifetime:
+    async def test_no_session_open_while_answer_streams(self, monkeypatch):
+        monkeypatch.setattr(rag_pipeline, "SessionManager", _RecordingSessionManager)
+        _RecordingSessionManager.saved = []
+        factory = _TrackedSessionFactory()
+        llm = _SessionCheckingLLM(factory)
+        pipeline = RAGPipeline(
+            llm=llm,
+            embeddings=None,
+            vector_store=None,
+            reranker=None,
+            keyword_search=None,
+            settings=Settings(),
+            session_factory=factory,
+        )
+
+        async def retrieve(query, context, timer, deadline, *args):
+            fused = [{"chunk_id": "c", "text": "Lint trap", "metadata": {}, "rrf_score": 0.1}]
+            return query, fused, [RerankResult(index=0, score=0.95, text="Lint trap")]
+
+        monkeypatch.setattr(pipeline, "_rewrite_and_retrieve", retrieve)
+
+        # No context passed in, so the pipeline loads it in a session of its own.
+        events = [event async for event in pipeline.run("Lint trap?", "session")]
+
+        assert [e["data"]["content"] for e in events if e["event"] == "delta"] == [
+            "Pull ",
+            "it ",
+            "out.",
+        ]
+        assert llm.open_during_stream == [0, 0, 0]
+        assert factory.opened == 2  # context load, then the persist after streaming
+        assert factory.open == 0
+        assert _RecordingSessionManager.saved == ["Pull it out."]
@@ -0,0 +1,118 @@
+"""Tests for retrieval cache keying."""
+
+import json
+
+import pytest
+
+from app.core.config import LatencyBudgetConfig, Settings
+from app.providers.base import RerankResult
+from app.services.retrieval_cache import RetrievalCache, normalize_query, retrieval_cache_key
+
+
+class TestNormalizeQuery:
+    def test_case_and_whitespace_folded(self):
+        assert normalize_query("  How do I   clean\tthe LINT trap ") == "how do i clean the lint trap"
+
+    def test_trailing_punctuation_dropped(self):
+        assert normalize_query("Where is the filter?!") == "where is the filter"
+
+
+class TestRetrievalCacheKey:
+    def test_equivalent_queries_share_key(self):
+        settings = Settings()
+        assert retrieval_cache_key("Lint trap?", settings, 1) == retrieval_cache_key(
+            "lint  trap", settings, 1
+        )
+
+    def test_corpus_version_changes_key(self):
+        settings = Settings()
+        assert retrieval_cache_key("lint trap", settings, 1) != retrieval_cache_key(
+            "lint trap", settings, 2
+        )
+
+    def test_retrieval_config_changes_key(self):
+        settings = Settings()
+        before = retrieval_cache_key("lint trap", settings, 1)
+        settings.retrieval.rerank_top_k += 1
+        assert retrieval_cache_key("lint trap", settings, 1) != before
+
+    @pytest.mark.parametrize(
+        ("section", "name", "value"),
+        [
+            ("retrieval", "vector_search", "binary"),
+            ("retrieval", "binary_oversample", 4),
+            ("retrieval", "hnsw_iterative_scan", "strict_order"),
+            ("retrieval", "hnsw_ef_search", 100),
+            ("retrieval", "ivfflat_probes", 10),
+            ("vectorstore", "provider", "mmap"),
+            ("keyword_search", "provider", "bm25"),
+        ],
+    )
+    def test_search_mode_changes_key(self, section, name, value):
+        settings = Settings()
+        before = retrieval_cache_key("lint trap", settings, 1)
+        setattr(getattr(settings, section), name, value)
+        assert retrieval_cache_key("lint trap", settings, 1) != before
+
+    def test_budget_ann_breadth_changes_key(self):
+        settings = Settings()
+        default = retrieval_cache_key("lint trap", settings, 1, budget=settings.latency_budget)
+        assert default == retrieval_cache_key("lint trap", settings, 1)
+        budget = LatencyBudgetConfig(
+            {"channels": {"voice": {"hnsw_ef_search": 24, "ivfflat_probes": 3}}}
+        )
+        voice = retrieval_cache_key("lint trap", settings, 1, budget=budget.for_channel("voice"))
+        assert voice != default
+        # An override equal to the retrieval default searches the same way.
+        same = LatencyBudgetConfig({"hnsw_ef_search": settings.retrieval.hnsw_ef_search})
+        assert retrieval_cache_key("lint trap", settings, 1, budget=same) == default
+
+    def test_filters_scope_key(self):
+        settings = Settings()
+        unfiltered = retrieval_cache_key("lint trap", settings, 1)
+        assert retrieval_cache_key("lint trap", settings, 1, {}) == unfiltered
+        dryer = retrieval_cache_key("lint trap", settings, 1, {"product": "dryer"})
+        assert dryer != unfiltered
+        assert dryer != retrieval_cache_key("lint trap", settings, 1, {"product": "washer"})
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+class TestRetrievalCache:
+    async def test_round_trip(self):
+        cache = RetrievalCache(_FakeRedis(), Settings())
+        key, entry = await cache.get("lint trap")
+        assert entry is None
+        await cache.set(key, [{"chunk_id": "a"}], [RerankResult(0, 0.9, "t")], 0.2)
+
+        _, entry = await cache.get("Lint trap?")
+
+        assert entry.fused == [{"chunk_id": "a"}]
+        assert entry.reranked == [RerankResult(0, 0.9, "t")]
+        assert cache.stats.hits == 1
+
+    async def test_undecodable_entry_is_a_miss_and_deleted(self):
+        redis = _FakeRedis()
+        cache = RetrievalCache(redis, Settings())
+        key, _ = await cache.get("lint trap")
+        redis.data[key] = json.dumps({"fused": [], "reranked": []})  # older format
+
+        returned_key, entry = await cache.get("lint trap")
+
+        assert (returned_key, entry) == (key, None)
+        assert key not in redis.data
+        assert cache.stats.errors == 1
+        redis.data[key] = "not json"
+        assert await cache.get("lint trap") == (key, None)
@@ -0,0 +1,121 @@
+"""Tests for in-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from app.services.singleflight import SingleFlight, StreamFanout
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_execution(self):
+        flight: SingleFlight[str] = SingleFlight()
+        calls = 0
+
+        async def work() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*[flight.do("q", work) for _ in range(5)])
+        assert calls == 1
+        assert [r for r, _ in results] == ["result"] * 5
+        assert sum(shared for _, shared in results) == 4
+
+    async def test_key_released_after_completion(self):
+        flight: SingleFlight[int] = SingleFlight()
+        counter = iter(range(10))
+
+        async def work() -> int:
+            return next(counter)
+
+        assert (await flight.do("q", work))[0] == 0
+        assert (await flight.do("q", work))[0] == 1
+
+    async def test_error_propagates_to_all_callers(self):
+        flight: SingleFlight[None] = SingleFlight()
+
+        async def work() -> None:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("reranker down")
+
+        results = await asyncio.gather(
+            flight.do("q", work), flight.do("q", work), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_cancelled_caller_does_not_cancel_shared_work(self):
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def work() -> str:
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.create_task(flight.do("q", work))
+        second = asyncio.create_task(flight.do("q", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == ("done", True)
+
+
+async def _tokens(calls: list[int], error: Exception | None = None):
+    calls.append(1)
+    for token in ["a", "b", "c"]:
+        await asyncio.sleep(0.005)
+        yield token
+    if error is not None:
+        raise error
+
+
+async def _collect(stream) -> str:
+    return "".join([t async for t in stream])
+
+
+class TestStreamFanout:
+    async def test_late_subscriber_replays_missed_tokens(self):
+        fanout = StreamFanout()
+        calls: list[int] = []
+        first, shared_first = fanout.subscribe("k", lambda: _tokens(calls))
+        first_task = asyncio.create_task(_collect(first))
+        await asyncio.sleep(0.008)
+        second, shared_second = fanout.subscribe("k", lambda: _tokens(calls))
+        assert await first_task == "abc"
+        assert await _collect(second) == "abc"
+        assert (shared_first, shared_second) == (False, True)
+        assert len(calls) == 1
+
+    async def test_upstream_error_reaches_subscribers(self):
+        fanout = StreamFanout()
+        stream, _ = fanout.subscribe("k", lambda: _tokens([], RuntimeError("llm down")))
+        with pytest.raises(RuntimeError, match="llm down"):
+            await _collect(stream)
+
+    async def test_upstream_cancelled_when_every_subscriber_leaves(self):
+        fanout = StreamFanout()
+        finished: list[bool] = []
+
+        async def tokens():
+            try:
+                for token in ["a", "b", "c"]:
+                    await asyncio.sleep(0.01)
+                    yield token
+                finished.append(True)
+            except asyncio.CancelledError:
+                finished.append(False)
+                raise
+
+        first, _ = fanout.subscribe("k", tokens)
+        second, _ = fanout.subscribe("k", tokens)
+        clients = [asyncio.create_task(_collect(s)) for s in (first, second)]
+        await asyncio.sleep(0.015)
+
+        clients[0].cancel()
+        await asyncio.sleep(0)
+        assert finished == []  # one client still listening
+        clients[1].cancel()
+        await asyncio.gather(*clients, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert finished == [False]
+        assert "k" not in fanout._streams
@@ -0,0 +1,53 @@
+"""Tests for binary pgvector binding of NumPy embeddings."""
+
+import numpy as np
+from pgvector import HalfVector, Vector
+from sqlalchemy.dialects import postgresql
+
+from app.db.engine import _register_vector_codec
+from app.models.answer_cache import AnswerCacheEntry
+from app.models.base import BinaryHalfVector, BinaryVector
+from app.models.document import DocumentChunk
+
+
+class TestBinaryVectorColumn:
+    def test_arrays_bound_without_text_formatting(self):
+        dialect = postgresql.asyncpg.dialect()
+        assert BinaryVector(3).bind_processor(dialect) is None
+        assert BinaryHalfVector(3).bind_processor(dialect) is None
+
+    def test_distance_binds_the_array_itself(self):
+        query = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+        compiled = DocumentChunk.embedding.cosine_distance(query).compile(
+            dialect=postgresql.asyncpg.dialect()
+        )
+        (value,) = compiled.params.values()
+        assert value is query
+        assert not compiled._bind_processors
+
+    def test_codec_results_decode_to_float32_arrays(self):
+        dialect = postgresql.asyncpg.dialect()
+        for column, decoded in (
+            (BinaryVector(3), Vector([0.5, 1.0, -2.0])),
+            (BinaryHalfVector(3), HalfVector([0.5, 1.0, -2.0])),
+        ):
+            process = column.result_processor(dialect, None)
+            result = process(decoded)
+            assert result.dtype == np.float32
+            assert result.tolist() == [0.5, 1.0, -2.0]
+            assert process(None) is None
+
+    def test_array_values_compare_elementwise(self):
+        column = AnswerCacheEntry.__table__.c.embedding.type
+        assert column.compare_values(np.ones(3), np.ones(3))
+        assert not column.compare_values(np.ones(3), np.zeros(3))
+        assert not column.compare_values(np.ones(3), None)
+
+
+class TestRegisterVectorCodec:
+    def test_missing_extension_does_not_break_connections(self):
+        class _Connection:
+            def run_async(self, fn):
+                raise ValueError("unknown type: public.vector")
+
+        _register_vector_codec(_Connection(), None)
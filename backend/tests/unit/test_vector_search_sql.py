@@ -0,0 +1,185 @@
+"""Tests for plain and binary-quantized vector search SQL."""
+
+import numpy as np
+from pgvector import HalfVector
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.core.config import RetrievalConfig, Settings, get_settings
+from app.db.repositories.chunk_repo import (
+    binary_ef_search,
+    chunk_filter_sql,
+    semantic_candidates_sql,
+)
+from app.models.document import DocumentChunk
+from app.providers.vectorstore.pgvector_store import PgVectorStore
+
+
+class TestSemanticCandidatesSql:
+    def test_plain_search_orders_by_full_vector(self):
+        sql = semantic_candidates_sql("vector")
+        assert "ORDER BY embedding <=> CAST(:embedding AS vector)" in sql
+        assert "binary_quantize" not in sql
+
+    def test_binary_prefilter_then_exact_rescore(self):
+        sql = semantic_candidates_sql("halfvec", binary_dimension=384, limit_param="semantic_top_k")
+        # Must match the migration 006 index expression to use the bit index.
+        assert "CAST(binary_quantize(embedding) AS bit(384)) <~>" in sql
+        assert "LIMIT :candidates" in sql
+        assert sql.endswith("ORDER BY distance LIMIT :semantic_top_k")
+
+    def test_ef_search_covers_candidates(self):
+        assert binary_ef_search(40, 160) == 160
+        assert binary_ef_search(200, 80) == 200
+        assert binary_ef_search(None, 5000) == 1000
+
+    def test_store_selects_mode(self):
+        store = PgVectorStore(session_factory=None, search_mode="binary", dimension=768)
+        assert "bit(768)" in store._search_sql
+        assert "binary_quantize" not in PgVectorStore(session_factory=None)._search_sql
+
+    def test_filter_applies_in_both_modes(self):
+        plain = semantic_candidates_sql("vector", filter_sql=" AND x")
+        assert "WHERE embedding IS NOT NULL AND x" in plain
+        binary = semantic_candidates_sql("vector", binary_dimension=384, filter_sql=" AND x")
+        assert "WHERE embedding IS NOT NULL AND x" in binary
+
+
+class TestBinaryIndexModel:
+    def test_model_declares_the_index_the_prefilter_uses(self):
+        (index,) = [
+            i
+            for i in DocumentChunk.__table__.indexes
+            if i.name == "ix_document_chunks_embedding_bit_hnsw"
+        ]
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+        dimension = get_settings().embedding.dimension
+        assert f"USING hnsw (CAST(binary_quantize(embedding) AS BIT({dimension}))" in ddl
+        assert "bit_hamming_ops" in ddl
+
+
+class TestChunkFilterSql:
+    def test_no_filters(self):
+        assert chunk_filter_sql(None) == ("", {})
+        assert chunk_filter_sql({}) == ("", {})
+
+    def test_metadata_values_become_containment_params(self):
+        sql, params = chunk_filter_sql({"product": ["dryer", "washer"], "public": True})
+        assert sql == (
+            " AND metadata @> ANY(CAST(CAST(:filter_0 AS text[]) AS jsonb[]))"
+            " AND metadata @> ANY(CAST(CAST(:filter_1 AS text[]) AS jsonb[]))"
+        )
+        assert params == {
+            "filter_0": ['{"product": "dryer"}', '{"product": "washer"}'],
+            "filter_1": ['{"public": true}'],
+        }
+
+    def test_document_id_uses_column(self):
+        sql, params = chunk_filter_sql({"document_id": "6f1c1f43-3c5b-4c8e-9d8a-8b1b0a0f3a11"})
+        assert sql == " AND document_id = ANY(CAST(:filter_0 AS uuid[]))"
+        assert params == {"filter_0": ["6f1c1f43-3c5b-4c8e-9d8a-8b1b0a0f3a11"]}
+
+    def test_keys_never_reach_sql_text(self):
+        sql, params = chunk_filter_sql({"x') OR true --": "y"})
+        assert "OR true" not in sql
+        assert params["filter_0"] == ['{"x\') OR true --": "y"}']
+
+
+class TestGetTexts:
+    async def test_filters_restrict_lookup(self):
+        from sqlalchemy.dialects import postgresql
+
+        from app.db.repositories.chunk_repo import ChunkRepository
+
+        statements = []
+
+        class _Session:
+            async def execute(self, statement):
+                statements.append(statement.compile(dialect=postgresql.dialect()))
+                return _NoRows()
+
+        chunk_id = "6f1c1f43-3c5b-4c8e-9d8a-8b1b0a0f3a11"
+        await ChunkRepository(_Session()).get_texts([chunk_id], {"product": "dryer"})
+
+        (compiled,) = statements
+        assert "metadata @> ANY(CAST(CAST(%(filter_0)s AS text[]) AS jsonb[]))" in str(compiled)
+        assert compiled.params["filter_0"] == ['{"product": "dryer"}']
+
+
+class _NoRows:
+    def fetchall(self):
+        return []
+
+    def all(self):
+        return []
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.calls: list[tuple[str, dict]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params):
+        self.calls.append((str(statement), params))
+        return _NoRows()
+
+    async def commit(self):
+        pass
+
+
+class TestPgVectorStoreWrites:
+    async def test_upsert_batches_typed_arrays(self):
+        session = _RecordingSession()
+        store = PgVectorStore(lambda: session, vector_type="halfvec", write_batch_size=2)
+        ids = ["a", "b", "c"]
+        await store.upsert(ids, np.eye(3, dtype=np.float32), ["", "", ""], [{}, {}, {}])
+
+        assert [params["ids"] for _, params in session.calls] == [["a", "b"], ["c"]]
+        sql, params = session.calls[0]
+        assert "unnest(CAST(:ids AS uuid[]), CAST(:embeddings AS halfvec[]))" in sql
+        assert all(isinstance(v, HalfVector) for v in params["embeddings"])
+
+    async def test_delete_matches_on_uuid_primary_key(self):
+        session = _RecordingSession()
+        store = PgVectorStore(lambda: session, write_batch_size=1000)
+        await store.delete(["a", "b"])
+        ((sql, params),) = session.calls
+        assert "id = ANY(CAST(:ids AS uuid[]))" in sql
+        assert "CAST(id AS text)" not in sql
+        assert params == {"ids": ["a", "b"]}  # one batch
+
+
+class TestPgVectorStoreFilteredSearch:
+    async def test_filter_enables_iterative_scan(self):
+        session = _RecordingSession()
+        store = PgVectorStore(lambda: session, iterative_scan="strict_order")
+        await store.search(np.ones(3, dtype=np.float32), filter_metadata={"product": "dryer"})
+
+        settings = {params["value"] for sql, params in session.calls if "set_config" in sql}
+        assert "strict_order" in settings
+        sql, params = session.calls[-1]
+        assert "metadata @> ANY(" in sql
+        assert params["filter_0"] == ['{"product": "dryer"}']
+
+    async def test_iterative_scan_off_by_default(self):
+        # pgvector < 0.8 rejects hnsw.iterative_scan, so it is opt-in.
+        assert Settings().retrieval.hnsw_iterative_scan is None
+        assert RetrievalConfig({"hnsw_iterative_scan": False}).hnsw_iterative_scan is None
+        session = _RecordingSession()
+        store = PgVectorStore(lambda: session)
+        await store.search(np.ones(3, dtype=np.float32), filter_metadata={"product": "dryer"})
+
+        assert not any("hnsw.iterative_scan" in sql for sql, _ in session.calls)
+
+    async def test_unfiltered_search_is_unchanged(self):
+        session = _RecordingSession()
+        store = PgVectorStore(lambda: session)
+        await store.search(np.ones(3, dtype=np.float32))
+
+        assert not any("hnsw.iterative_scan" in sql for sql, _ in session.calls)
+        assert session.calls[-1][0] == store._search_sql
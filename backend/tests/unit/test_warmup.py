@@ -0,0 +1,53 @@
+"""Tests for startup warm-up and readiness state."""
+
+from app.core.config import PersonaConfig
+from app.services.persona import PersonaService
+from app.services.warmup import WarmupState, warm_up
+
+
+class FakeLocalEmbeddings:
+    dimension = 4
+
+    def __init__(self):
+        self.warmups = 0
+
+    async def embed_texts(self, texts):
+        return [[0.0] * 4 for _ in texts]
+
+    async def embed_query(self, text):
+        return [0.0] * 4
+
+    async def warmup(self):
+        self.warmups += 1
+
+
+class FakeApiReranker:
+    async def rerank(self, query, documents, top_k=5):
+        raise AssertionError("hosted providers are not called during warm-up")
+
+
+class BrokenEmbeddings(FakeLocalEmbeddings):
+    async def warmup(self):
+        raise OSError("model not found")
+
+
+class TestWarmUp:
+    async def test_warms_local_providers_and_records_timings(self):
+        embeddings = FakeLocalEmbeddings()
+        persona = PersonaService(PersonaConfig({"template_path": "persona/default.yaml"}))
+        state = await warm_up(
+            embeddings=embeddings,
+            reranker=FakeApiReranker(),
+            persona=persona,
+            state=WarmupState(),
+        )
+        assert state.ready
+        assert embeddings.warmups == 2  # cold, then warm
+        assert set(state.timings) == {"templates", "embeddings"}
+        assert {"cold_ms", "warm_ms"} <= state.timings["embeddings"].keys()
+
+    async def test_failure_keeps_state_not_ready(self):
+        state = await warm_up(embeddings=BrokenEmbeddings(), state=WarmupState())
+        assert not state.ready
+        assert state.status == "failed"
+        assert "model not found" in state.as_dict()["error"]